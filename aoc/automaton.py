@@ -0,0 +1,136 @@
+# --- Aho-Corasick ---
+# Finds every occurrence of a set of words in one pass over the text,
+# overlapping matches included ("eightwo" holds both "eight" and "two").
+#
+#   automaton = Automaton({"one": "1", "two": "2", "1": "1"})
+#   automaton.leftmost("xtwone3")          -> (1, "2")   start index and value
+#   FirstLastMatcher(words).first_and_last("xtwone3four")  -> ("2", "4")
+#
+# The goto/failure structure is flattened into a full transition table
+# (one dict per state), so each character costs a single dict lookup.
+# FirstLastMatcher pairs an automaton over the words with one over the
+# reversed words, so the last match is found by scanning from the end and
+# both scans stop as soon as no earlier (or later) match is possible.
+
+import sys
+
+
+class Automaton:
+    """An Aho-Corasick automaton over the keys of `patterns`, reporting their values."""
+
+    def __init__(self, patterns):
+        patterns = {word: value for word, value in patterns.items() if word}
+        self.max_length = max(map(len, patterns), default=0)
+
+        # trie
+        children = [{}]
+        outputs = [()]
+        for word, value in patterns.items():
+            state = 0
+            for ch in word:
+                if ch not in children[state]:
+                    children[state][ch] = len(children)
+                    children.append({})
+                    outputs.append(())
+                state = children[state][ch]
+            outputs[state] = ((len(word), value),)
+
+        # failure links, breadth first, folded into a full transition table
+        alphabet = {ch for word in patterns for ch in word}
+        transitions = [dict() for _ in children]
+        queue = []
+        for ch, child in children[0].items():
+            transitions[0][ch] = child
+            queue.append((child, 0))
+        for state, fail in queue:
+            # a state also emits whatever its longest proper suffix state emits
+            outputs[state] = outputs[state] + outputs[fail]
+            for ch in alphabet:
+                child = children[state].get(ch)
+                if child is None:
+                    target = transitions[fail].get(ch, 0)
+                    if target:
+                        transitions[state][ch] = target
+                else:
+                    transitions[state][ch] = child
+                    queue.append((child, transitions[fail].get(ch, 0) if state else 0))
+
+        self.transitions = transitions
+        # longest match first, so the first output of a state is its leftmost
+        self.outputs = [tuple(sorted(output, key=lambda match: -match[0])) for output in outputs]
+
+    def iter_matches(self, text):
+        """Yields `(start, end, value)` for every occurrence, by end position."""
+        transitions, outputs, state = self.transitions, self.outputs, 0
+        for end, ch in enumerate(text, 1):
+            state = transitions[state].get(ch, 0)
+            for length, value in outputs[state]:
+                yield end - length, end, value
+
+    def leftmost(self, text):
+        """`(start, value)` of the match that starts first, or None.
+
+        Scanning stops once no match can start before the best one found,
+        i.e. `max_length` characters past its start.
+        """
+        transitions, outputs, state = self.transitions, self.outputs, 0
+        best = None
+        # `text` may be any iterable of characters, e.g. reversed(line)
+        stop = sys.maxsize
+        for end, ch in enumerate(text, 1):
+            state = transitions[state].get(ch, 0)
+            output = outputs[state]
+            if output:
+                length, value = output[0]
+                start = end - length
+                if best is None or start < best[0]:
+                    best = (start, value)
+                    stop = start + self.max_length
+            if end >= stop:
+                break
+        return best
+
+
+class FirstLastMatcher:
+    """Finds the values of the first and the last word occurring in a text."""
+
+    def __init__(self, patterns):
+        self.forward = Automaton(patterns)
+        self.backward = Automaton({word[::-1]: value for word, value in patterns.items()})
+
+    def first(self, text):
+        match = self.forward.leftmost(text)
+        return None if match is None else match[1]
+
+    def last(self, text):
+        # reversed(text) walks the str from the end without copying it
+        match = self.backward.leftmost(reversed(text))
+        return None if match is None else match[1]
+
+    def first_and_last(self, text):
+        first = self.first(text)
+        if first is None:
+            return None, None
+        return first, self.last(text)
+
+
+def test_automaton():
+    automaton = Automaton({"he": 1, "she": 2, "his": 3, "hers": 4})
+    assert sorted(automaton.iter_matches("ushers")) == [(1, 4, 2), (2, 4, 1), (2, 6, 4)]
+    assert automaton.leftmost("ushers") == (1, 2) and automaton.leftmost("xyz") is None
+
+    # a longer word found later can still start first
+    assert Automaton({"abcd": "long", "bc": "short"}).leftmost("abcd") == (0, "long")
+
+    words = {"one": "1", "two": "2", "three": "3", "eight": "8", "1": "1", "2": "2", "3": "3", "4": "4"}
+    matcher = FirstLastMatcher(words)
+    assert matcher.first_and_last("xtwone3four") == ("2", "3")
+    assert matcher.first_and_last("eightwothree") == ("8", "3")
+    assert matcher.first_and_last("zoneight234") == ("1", "4")
+    assert matcher.first_and_last("twone") == ("2", "1")
+    assert matcher.first_and_last("nothing") == (None, None)
+    print("✅ test_automaton passed")
+
+
+if __name__ == "__main__":
+    test_automaton()
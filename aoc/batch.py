@@ -0,0 +1,123 @@
+# --- Batch mode ---
+# Solves many input files for one day across a process pool and streams
+# the results back as JSON lines, in the order they finish.
+#
+#   python -m aoc.batch --day 9 inputs/day_9/          # every file in a directory
+#   python -m aoc.batch --day 9 --part 2 manifest.txt  # one input path per line
+#
+# Inputs are sent to the workers in chunks, so thousands of small inputs
+# don't pay one round trip each.
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from aoc.runner import run_solver
+from aoc.solvers import select_solvers
+
+
+def collect_inputs(source):
+    """Input paths from a directory (every file, sorted) or a manifest file.
+
+    Manifest lines are paths relative to the manifest; blank lines and
+    `#` comments are ignored.
+    """
+    if os.path.isdir(source):
+        return sorted(
+            os.path.join(root, name)
+            for root, _, names in os.walk(source)
+            for name in names
+            if not name.startswith(".")
+        )
+
+    base = os.path.dirname(source)
+    with open(source) as f:
+        lines = [line.split("#", 1)[0].strip() for line in f]
+    return [os.path.join(base, line) for line in lines if line]
+
+
+def solve_chunk(tasks):
+    """Worker entry point: runs `(solver, input_path)` pairs one after the other."""
+    results = []
+    for solver, input_path in tasks:
+        result = run_solver(solver, input_path, track_memory=False)
+        del result["cached"]
+        results.append(result)
+    return results
+
+
+def chunked(items, size):
+    return [items[start : start + size] for start in range(0, len(items), size)]
+
+
+def run_batch(day, input_paths, parts=None, workers=None, chunksize=None):
+    """Yields a result per (part, input) as soon as its chunk finishes."""
+    solvers = select_solvers([day], parts)
+    if not solvers:
+        raise ValueError(f"No solvers registered for day {day}")
+
+    tasks = [(solver, path) for path in input_paths for solver in solvers]
+    if not tasks:
+        return
+
+    workers = workers or os.cpu_count() or 1
+    # a few chunks per worker keeps the pool busy without one task per round trip
+    chunksize = chunksize or max(1, len(tasks) // (workers * 4))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(solve_chunk, chunk): chunk for chunk in chunked(tasks, chunksize)}
+        for future in as_completed(futures):
+            try:
+                yield from future.result()
+            except Exception as e:
+                # the worker itself died, report every input of the chunk
+                for solver, path in futures[future]:
+                    yield {"day": solver.day, "part": solver.part, "input": path, "answer": None,
+                           "wall_time": None, "cpu_time": None, "peak_memory": None,
+                           "error": f"{type(e).__name__}: {e}"}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve many inputs of one day concurrently, as JSON lines.")
+    parser.add_argument("source", help="directory of inputs or a manifest file listing them")
+    parser.add_argument("--day", type=int, required=True)
+    parser.add_argument("--part", type=int, action="append", dest="parts", choices=[1, 2])
+    parser.add_argument("--workers", type=int, help="processes to use (default: one per core)")
+    parser.add_argument("--chunksize", type=int, help="inputs sent to a worker at a time")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for result in run_batch(args.day, collect_inputs(args.source), args.parts, args.workers, args.chunksize):
+        failed = failed or result["error"] is not None
+        print(json.dumps(result, default=str), flush=True)
+    return 1 if failed else 0
+
+
+def test_run_batch():
+    import shutil
+    import tempfile
+
+    directory = tempfile.mkdtemp()
+    try:
+        histories = ["0 3 6 9 12 15", "1 3 6 10 15 21", "10 13 16 21 30 45"]
+        for number, history in enumerate(histories):
+            with open(os.path.join(directory, f"{number}.txt"), "w") as f:
+                f.write(history + "\n")
+        with open(os.path.join(directory, "manifest"), "w") as f:
+            f.write("# day 9 examples\n0.txt\n1.txt\n2.txt\nmissing.txt\n")
+
+        inputs = collect_inputs(os.path.join(directory, "manifest"))
+        results = list(run_batch(9, inputs, parts=[1], workers=2, chunksize=1))
+        answers = {os.path.basename(r["input"]): r["answer"] for r in results}
+        assert answers == {"0.txt": 18, "1.txt": 28, "2.txt": 68, "missing.txt": None}, answers
+        [failure] = [r for r in results if r["error"]]
+        assert failure["error"].startswith("FileNotFoundError")
+        print("✅ test_run_batch passed")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
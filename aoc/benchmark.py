@@ -0,0 +1,260 @@
+# --- Regression benchmarks ---
+# Times every fixture a few times, stores median/p95 wall time and peak
+# memory in a JSON baseline, and fails when a later run is slower.
+#
+#   python -m aoc.benchmark record                     # writes benchmarks/baseline.json
+#   python -m aoc.benchmark compare --threshold 0.25   # exit 1 on a >25% slowdown
+#   python -m aoc.benchmark record --day 14 --repeat 9 --fixtures samples
+#
+# Fixtures are the inline `test_*` functions of every solver script (i.e.
+# the puzzle's sample inputs) plus every registered part on its real
+# `input.txt`. Each repetition gets a freshly loaded module, and memory is
+# measured in one extra tracemalloc run so it doesn't skew the timings.
+
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import math
+import os
+import platform
+import statistics
+import time
+import tracemalloc
+from collections import namedtuple
+
+from aoc.solvers import DEFAULT_INPUT_PATH, load_module, resolve_input_path, select_solvers
+
+BASELINE_VERSION = 1
+DEFAULT_BASELINE = "benchmarks/baseline.json"
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.25
+# differences below this many seconds are noise, whatever the ratio
+NOISE_FLOOR = 0.005
+
+Fixture = namedtuple("Fixture", ["name", "day", "path", "function", "argument"])
+
+
+def _inline_test_names(module):
+    """Names of the module level `test_*` functions and `test_*` static methods of its classes."""
+    names = []
+    for name, value in vars(module).items():
+        if name.startswith("test_") and callable(value):
+            names.append(name)
+        elif isinstance(value, type) and value.__module__ == module.__name__:
+            names.extend(
+                f"{name}.{attribute}"
+                for attribute, member in vars(value).items()
+                if attribute.startswith("test_") and isinstance(member, staticmethod)
+            )
+    return names
+
+
+def collect_fixtures(days=None, parts=None, kinds=("samples", "inputs"), input_path=DEFAULT_INPUT_PATH):
+    fixtures = []
+    solvers = select_solvers(days, parts)
+    if "samples" in kinds:
+        for path in sorted({solver.path for solver in solvers}, key=lambda p: (int(p.split("/")[0][4:]), p)):
+            day = int(path.split("/")[0][4:])
+            for name in _inline_test_names(load_module(path)):
+                fixtures.append(Fixture(f"{path}::{name}", day, path, name, None))
+    if "inputs" in kinds:
+        for solver in solvers:
+            fixtures.append(
+                Fixture(
+                    f"day_{solver.day}/part_{solver.part}/input",
+                    solver.day,
+                    solver.path,
+                    solver.function,
+                    resolve_input_path(solver, input_path),
+                )
+            )
+    return fixtures
+
+
+def _load_callable(fixture):
+    target = load_module(fixture.path)
+    for name in fixture.function.split("."):
+        target = getattr(target, name)
+    if fixture.argument is None:
+        return target
+    return lambda: target(fixture.argument)
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def measure(fixture, repeat=DEFAULT_REPEAT):
+    timings = []
+    for _ in range(repeat + 1):
+        run = _load_callable(fixture)
+        with contextlib.redirect_stdout(io.StringIO()):
+            if len(timings) < repeat:
+                start = time.perf_counter()
+                run()
+                timings.append(time.perf_counter() - start)
+            else:
+                tracemalloc.start()
+                try:
+                    run()
+                    peak_memory = tracemalloc.get_traced_memory()[1]
+                finally:
+                    tracemalloc.stop()
+    return {
+        "median": statistics.median(timings),
+        "p95": percentile(timings, 0.95),
+        "peak_memory": peak_memory,
+        "runs": repeat,
+    }
+
+
+def record(fixtures, repeat=DEFAULT_REPEAT, progress=None):
+    results = {}
+    for fixture in fixtures:
+        try:
+            results[fixture.name] = measure(fixture, repeat)
+        except Exception as e:
+            results[fixture.name] = {"error": f"{type(e).__name__}: {e}"}
+        if progress:
+            progress(fixture, results[fixture.name])
+    return {
+        "version": BASELINE_VERSION,
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "repeat": repeat,
+        "fixtures": results,
+    }
+
+
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD, noise_floor=NOISE_FLOOR):
+    """Fixtures whose median or p95 time or peak memory grew by more than `threshold`.
+
+    Returns a list of `(name, metric, baseline value, current value)`;
+    fixtures that now fail count as regressions too.
+    """
+    if baseline.get("version") != BASELINE_VERSION:
+        raise ValueError(f"Baseline version {baseline.get('version')} is not {BASELINE_VERSION}, record a new one")
+
+    regressions = []
+    for name, now in current["fixtures"].items():
+        before = baseline["fixtures"].get(name)
+        if before is None or "error" in before:
+            continue
+        if "error" in now:
+            regressions.append((name, "error", None, now["error"]))
+            continue
+        for metric in ("median", "p95"):
+            if now[metric] > before[metric] * (1 + threshold) and now[metric] - before[metric] > noise_floor:
+                regressions.append((name, metric, before[metric], now[metric]))
+        if now["peak_memory"] > before["peak_memory"] * (1 + threshold) and now["peak_memory"] - before["peak_memory"] > 64 * 1024:
+            regressions.append((name, "peak_memory", before["peak_memory"], now["peak_memory"]))
+    return regressions
+
+
+def _print_progress(fixture, result):
+    if "error" in result:
+        print(f"  {fixture.name}: {result['error']}")
+    else:
+        print(
+            f"  {fixture.name}: median {result['median'] * 1000:.2f} ms, p95 {result['p95'] * 1000:.2f} ms, "
+            f"peak {result['peak_memory'] / 1024:.1f} KiB"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Record benchmark baselines and check for regressions.")
+    parser.add_argument("command", choices=["record", "compare"])
+    parser.add_argument("--day", type=int, action="append", dest="days")
+    parser.add_argument("--part", type=int, action="append", dest="parts", choices=[1, 2])
+    parser.add_argument("--fixtures", choices=["all", "samples", "inputs"], default="all")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="timed runs per fixture (default: %(default)s)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline file (default: %(default)s)")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="allowed relative slowdown before failing (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "compare" and not os.path.exists(args.baseline):
+        parser.error(f"no baseline at {args.baseline}, run `record` first")
+
+    kinds = ("samples", "inputs") if args.fixtures == "all" else (args.fixtures,)
+    fixtures = collect_fixtures(args.days, args.parts, kinds)
+    current = record(fixtures, args.repeat, progress=_print_progress)
+
+    if args.command == "record":
+        directory = os.path.dirname(args.baseline)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # keep fixtures that weren't re-run this time
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                previous = json.load(f)
+            if previous.get("version") == BASELINE_VERSION:
+                current["fixtures"] = {**previous["fixtures"], **current["fixtures"]}
+        with open(args.baseline, "w") as f:
+            json.dump(current, f, indent=2, sort_keys=True)
+        print(f"Recorded {len(fixtures)} fixtures to {args.baseline}")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(baseline, current, args.threshold)
+    for name, metric, before, now in regressions:
+        if metric == "error":
+            print(f"❌ {name}: now fails with {now}")
+        elif metric in ("median", "p95"):
+            print(f"❌ {name}: {metric} {before * 1000:.2f} ms -> {now * 1000:.2f} ms")
+        else:
+            print(f"❌ {name}: peak memory {before / 1024:.1f} KiB -> {now / 1024:.1f} KiB")
+    if not regressions:
+        print(f"✅ no regressions over {args.threshold:.0%} against {args.baseline}")
+    return 1 if regressions else 0
+
+
+def test_compare():
+    def result(median, peak_memory=1024 * 1024, p95=None):
+        return {"median": median, "p95": median if p95 is None else p95, "peak_memory": peak_memory, "runs": 5}
+
+    baseline = {"version": BASELINE_VERSION, "fixtures": {name: result(1.0) for name in "acde"} | {"b": result(0.001)}}
+    current = {
+        "fixtures": {
+            "a": result(1.2),  # within the threshold
+            "b": result(0.003),  # 3x slower but below the noise floor
+            "c": result(2.0, 4 * 1024 * 1024),
+            "d": {"error": "ValueError: boom"},
+            "e": result(1.0, p95=1.5),  # steady median, slower tail
+            "new": result(9.0),  # nothing to compare against
+        }
+    }
+    assert compare(baseline, current, threshold=0.25) == [
+        ("c", "median", 1.0, 2.0),
+        ("c", "p95", 1.0, 2.0),
+        ("c", "peak_memory", 1024 * 1024, 4 * 1024 * 1024),
+        ("d", "error", None, "ValueError: boom"),
+        ("e", "p95", 1.0, 1.5),
+    ]
+    assert percentile([5, 1, 4, 2, 3], 0.95) == 5 and percentile([1, 2], 0.5) == 1
+    print("✅ test_compare passed")
+
+
+def test_collect_fixtures():
+    fixtures = collect_fixtures(days=[4])
+    names = [fixture.name for fixture in fixtures]
+    assert "day_4/scratchcards.py::ScratchCardProcessor.test_calculate_total_points" in names
+    assert "day_4/part_2/input" in names
+    # the samples change as day 4 grows tests, so only check that both kinds are there
+    assert all(f.day == 4 for f in fixtures) and {"day_4/part_1/input", "day_4/part_2/input"} < set(names)
+    assert measure(fixtures[0], repeat=2)["runs"] == 2
+    print("✅ test_collect_fixtures passed")
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
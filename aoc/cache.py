@@ -0,0 +1,258 @@
+# --- Result cache ---
+# Remembers answers on disk so repeat runs of an expensive part come back
+# immediately. Entries are content addressed: the key hashes the input's
+# bytes, the day/part and the source of the solver (plus the `aoc` helpers
+# and sibling day modules it imports), so editing a solver or its input
+# simply misses the cache.
+#
+#   python -m aoc.runner --cache               # answer from the cache when possible
+#   python -m aoc.cache --clear
+#
+# Each entry is one small JSON file. A hit touches the file, and once the
+# directory grows past its size cap the least recently used entries go first.
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import re
+import time
+
+from aoc.solvers import REPO_ROOT
+
+DEFAULT_CACHE_DIR = os.path.join(REPO_ROOT, ".aoc_cache")
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+# packages whose modules count towards a solver's digest
+LOCAL_PACKAGES = re.compile(r"aoc|day_\d+")
+
+
+def imported_modules(source):
+    """`(package, module)` of every `aoc` or day module a source imports.
+
+    Covers `import aoc.grid`, `from aoc.grid import Grid` and `from aoc
+    import directions` (where the imported names may be modules), at any
+    nesting level.
+    """
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return set()
+    found = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names = [node.module] + [f"{node.module}.{alias.name}" for alias in node.names]
+        else:
+            continue
+        for name in names:
+            package, _, rest = name.partition(".")
+            if rest and LOCAL_PACKAGES.fullmatch(package):
+                found.add((package, rest.partition(".")[0]))
+    return found
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def solver_digest(solver, root=REPO_ROOT):
+    """Hash of the solver script and of every `aoc` helper or sibling day module it imports, transitively."""
+    with open(os.path.join(root, solver.path), "rb") as f:
+        source = f.read()
+    digest = hashlib.sha256(source)
+    seen = set()
+    # names that aren't modules (e.g. `Grid` in `from aoc.grid import Grid`) have no file and are skipped
+    pending = list(imported_modules(source))
+    while pending:
+        module = pending.pop()
+        helper_path = os.path.join(root, *module) + ".py"
+        if module in seen or not os.path.exists(helper_path):
+            continue
+        seen.add(module)
+        with open(helper_path, "rb") as f:
+            pending.extend(imported_modules(f.read()))
+    for module in sorted(seen):
+        digest.update(file_digest(os.path.join(root, *module) + ".py").encode())
+    return digest.hexdigest()
+
+
+def cache_key(solver, input_path):
+    parts = [str(solver.day), str(solver.part), solver.function, solver_digest(solver), file_digest(input_path)]
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+class ResultCache:
+    """An on-disk, size capped, least recently used store of answers."""
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def _entry_path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, solver, input_path):
+        """Returns `(True, answer)` on a hit and `(False, None)` on a miss."""
+        path = self._entry_path(cache_key(solver, input_path))
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return False, None
+        # mark as recently used
+        os.utime(path)
+        return True, entry["answer"]
+
+    def put(self, solver, input_path, answer):
+        """Stores an answer; answers that can't be written as JSON are not cached."""
+        entry = {"day": solver.day, "part": solver.part, "input": input_path, "answer": answer, "stored_at": time.time()}
+        try:
+            payload = json.dumps(entry)
+        except TypeError:
+            return False
+
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._entry_path(cache_key(solver, input_path))
+        # write then rename, so a concurrent reader never sees half an entry
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w") as f:
+            f.write(payload)
+        os.replace(temporary_path, path)
+        self.evict()
+        return True
+
+    def entries(self):
+        """(last used, size, path) of every entry, least recently used first."""
+        if not os.path.isdir(self.directory):
+            return []
+        found = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            found.append((stat.st_mtime, stat.st_size, path))
+        return sorted(found)
+
+    def size(self):
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self):
+        """Drops least recently used entries until the cache fits its size cap."""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self):
+        for _, _, path in self.entries():
+            os.remove(path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect or clear the solver result cache.")
+    parser.add_argument("--dir", default=DEFAULT_CACHE_DIR, help="cache directory (default: %(default)s)")
+    parser.add_argument("--clear", action="store_true", help="remove every cached answer")
+    args = parser.parse_args(argv)
+
+    cache = ResultCache(args.dir)
+    if args.clear:
+        cache.clear()
+    entries = cache.entries()
+    print(f"{len(entries)} cached answers, {sum(size for _, size, _ in entries) / 1024:.1f} KiB in {cache.directory}")
+
+
+def test_result_cache():
+    import shutil
+    import tempfile
+
+    from aoc.solvers import select_solvers
+
+    directory = tempfile.mkdtemp()
+    try:
+        [part_1, part_2] = select_solvers(days=[9])
+        input_path = os.path.join(directory, "input.txt")
+        with open(input_path, "w") as f:
+            f.write("0 3 6 9 12 15\n")
+
+        cache = ResultCache(os.path.join(directory, "cache"))
+        assert cache.get(part_1, input_path) == (False, None)
+        cache.put(part_1, input_path, 18)
+        first_key = cache_key(part_1, input_path)
+        assert cache.get(part_1, input_path) == (True, 18)
+        assert cache.get(part_2, input_path) == (False, None), "parts must not share entries"
+
+        # a different input is a different entry
+        with open(input_path, "w") as f:
+            f.write("1 3 6 10 15 21\n")
+        assert cache.get(part_1, input_path) == (False, None)
+
+        # the least recently used entry is evicted first
+        cache.put(part_2, input_path, -3)
+        entry_size = cache.size() // 2
+        oldest = cache._entry_path(first_key)
+        os.utime(oldest, (0, 0))
+        cache.max_bytes = entry_size + entry_size // 2
+        assert cache.evict() == 1 and not os.path.exists(oldest)
+        assert cache.get(part_2, input_path) == (True, -3)
+        print("✅ test_result_cache passed")
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_solver_digest_follows_helpers():
+    import tempfile
+
+    from aoc.solvers import Solver
+
+    with tempfile.TemporaryDirectory() as root:
+        os.makedirs(os.path.join(root, "aoc"))
+        os.makedirs(os.path.join(root, "day_1"))
+        files = {
+            "day_1/solver.py": "from aoc import directions\nimport aoc.grid\n\ndef part_1(path):\n    from day_1.helper import answer\n",
+            "day_1/helper.py": "answer = 1\n",
+            "aoc/directions.py": "UP = 0\n",
+            "aoc/grid.py": "from aoc.parsing import ints\n",
+            "aoc/parsing.py": "def ints(): pass\n",
+        }
+        for path, source in files.items():
+            with open(os.path.join(root, path), "w") as f:
+                f.write(source)
+        solver = Solver(1, 1, "day_1/solver.py", "part_1")
+
+        # editing any helper, however it is imported, changes the key
+        digest = solver_digest(solver, root)
+        for path in ("aoc/directions.py", "aoc/grid.py", "aoc/parsing.py", "day_1/helper.py"):
+            with open(os.path.join(root, path), "a") as f:
+                f.write("# edited\n")
+            assert solver_digest(solver, root) != digest, f"{path} isn't part of the digest"
+            digest = solver_digest(solver, root)
+    assert imported_modules("from aoc import directions\nfrom aoc.grid import Grid\nimport os, day_2.game_log\n") == {
+        ("aoc", "directions"),
+        ("aoc", "grid"),
+        ("day_2", "game_log"),
+    }
+    print("✅ test_solver_digest_follows_helpers passed")
+
+
+if __name__ == "__main__":
+    main()
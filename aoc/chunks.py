@@ -0,0 +1,95 @@
+# --- Chunked inputs ---
+# Splits one large input file into newline-aligned byte ranges and maps a
+# worker over them in a process pool, for documents too big to read whole.
+#
+#   for start, end in line_aligned_ranges("big.txt", chunk_size=8 << 20): ...
+#   total = sum(map_ranges("big.txt", count_lines, processes=4))
+#
+# Only the `(path, start, end)` triple is sent to a worker, which reads its
+# own range, and at most `2 * processes` ranges are in flight at a time, so
+# memory stays around `2 * processes * chunk_size` whatever the file size.
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+DEFAULT_CHUNK_SIZE = 4 << 20
+
+
+def line_aligned_ranges(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yields `(start, end)` byte ranges of about `chunk_size` that each end after a newline.
+
+    A range only stops short of a newline at the end of the file, and a
+    line longer than `chunk_size` makes its range longer rather than being
+    split.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        start = 0
+        while start < size:
+            end = start + chunk_size
+            if end < size:
+                # finish the line the boundary falls in (or the one ending right before it)
+                f.seek(end - 1)
+                f.readline()
+                end = f.tell()
+            end = min(end, size)
+            yield start, end
+            start = end
+
+
+def read_range(path, start, end):
+    with open(path, "rb") as f:
+        f.seek(start)
+        return f.read(end - start)
+
+
+def map_ranges(path, worker, processes=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yields `worker(path, start, end)` for every range of the file, in file order.
+
+    `worker` must be picklable (a module level function or a
+    `functools.partial` of one). With one process it runs in this process.
+    """
+    ranges = line_aligned_ranges(path, chunk_size)
+    processes = processes or os.cpu_count() or 1
+    if processes == 1:
+        for start, end in ranges:
+            yield worker(path, start, end)
+        return
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        pending = deque()
+        for start, end in ranges:
+            pending.append(executor.submit(worker, path, start, end))
+            if len(pending) >= 2 * processes:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _count_lines(path, start, end):
+    return read_range(path, start, end).count(b"\n")
+
+
+def test_line_aligned_ranges():
+    import tempfile
+
+    with tempfile.NamedTemporaryFile("wb", suffix=".txt", delete=False) as f:
+        f.write(b"one\ntwo\nthree\n\nfour\nfive")
+    try:
+        ranges = list(line_aligned_ranges(f.name, chunk_size=4))
+        assert ranges == [(0, 4), (4, 8), (8, 14), (14, 20), (20, 24)], ranges
+        assert [read_range(f.name, *r) for r in ranges][2:4] == [b"three\n", b"\nfour\n"]
+        assert list(line_aligned_ranges(f.name, chunk_size=100)) == [(0, 24)]
+
+        for processes in (1, 2):
+            assert list(map_ranges(f.name, _count_lines, processes, chunk_size=6)) == [2, 1, 2, 0]
+    finally:
+        os.remove(f.name)
+    print("✅ test_line_aligned_ranges passed")
+
+
+if __name__ == "__main__":
+    test_line_aligned_ranges()
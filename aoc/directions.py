@@ -0,0 +1,67 @@
+# --- Directions ---
+# The four grid directions as small ints, with lookup tables so hot loops
+# index tuples instead of hashing Enums, reading `.value` or testing list
+# membership on every step.
+#
+#   UP, RIGHT, DOWN, LEFT = 0, 1, 2, 3    (clockwise, so turning is +-1 mod 4)
+#   DELTAS[d]                             (row, col) step
+#   OPPOSITE[d], TURN_LEFT[d], TURN_RIGHT[d], PERPENDICULAR[d]
+#   beam_table(...)[tile << 2 | d]        directions a beam leaves a tile in
+#
+# Rows grow downwards, matching `aoc.grid.Grid`.
+
+UP, RIGHT, DOWN, LEFT = range(4)
+DIRECTIONS = (UP, RIGHT, DOWN, LEFT)
+NAMES = ("UP", "RIGHT", "DOWN", "LEFT")
+
+DELTAS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+DROW = tuple(dr for dr, _ in DELTAS)
+DCOL = tuple(dc for _, dc in DELTAS)
+
+OPPOSITE = tuple((d + 2) % 4 for d in DIRECTIONS)
+TURN_RIGHT = tuple((d + 1) % 4 for d in DIRECTIONS)
+TURN_LEFT = tuple((d + 3) % 4 for d in DIRECTIONS)
+PERPENDICULAR = tuple((TURN_LEFT[d], TURN_RIGHT[d]) for d in DIRECTIONS)
+
+# a beam moving in direction d leaves a `/` mirror in SLASH[d], a `\` mirror in BACKSLASH[d]
+SLASH = (RIGHT, UP, LEFT, DOWN)
+BACKSLASH = (LEFT, DOWN, RIGHT, UP)
+
+
+def flat_offsets(width):
+    """Flat index step per direction in a row-major grid of the given width."""
+    return (-width, 1, width, -1)
+
+
+def beam_table(slash=b"/", backslash=b"\\", vertical_splitter=b"|", horizontal_splitter=b"-"):
+    """Outgoing directions of a beam per `(tile byte << 2 | direction)`.
+
+    Mirrors turn the beam, splitters hit side-on split it in two, and every
+    other tile lets it through unchanged.
+    """
+    table = [(d,) for _ in range(256) for d in DIRECTIONS]
+    for d in DIRECTIONS:
+        table[ord(slash) << 2 | d] = (SLASH[d],)
+        table[ord(backslash) << 2 | d] = (BACKSLASH[d],)
+        if d in (LEFT, RIGHT):
+            table[ord(vertical_splitter) << 2 | d] = (UP, DOWN)
+        else:
+            table[ord(horizontal_splitter) << 2 | d] = (LEFT, RIGHT)
+    return tuple(table)
+
+
+def test_directions():
+    assert [NAMES[OPPOSITE[d]] for d in DIRECTIONS] == ["DOWN", "LEFT", "UP", "RIGHT"]
+    assert TURN_RIGHT[UP] == RIGHT and TURN_LEFT[UP] == LEFT and PERPENDICULAR[RIGHT] == (UP, DOWN)
+    assert all(DELTAS[OPPOSITE[d]] == (-DROW[d], -DCOL[d]) for d in DIRECTIONS)
+    assert flat_offsets(10)[DOWN] == 10
+
+    table = beam_table()
+    assert table[ord("/") << 2 | RIGHT] == (UP,) and table[ord("\\") << 2 | RIGHT] == (DOWN,)
+    assert table[ord("|") << 2 | LEFT] == (UP, DOWN) and table[ord("|") << 2 | UP] == (UP,)
+    assert table[ord(".") << 2 | DOWN] == (DOWN,)
+    print("✅ test_directions passed")
+
+
+if __name__ == "__main__":
+    test_directions()
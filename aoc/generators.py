@@ -0,0 +1,485 @@
+# --- Synthetic input generators ---
+# One generator per day, each writing an input in that day's format at a
+# multiple of the size of the real puzzle input. Grid days scale the area
+# (so each side grows by sqrt(scale)), everything else scales the number of
+# records.
+#
+#   python -m aoc.generators --scale 10 --scale 100          # every day
+#   python -m aoc.generators --day 3 --scale 1000 --out generated
+#
+# Files land in `<out>/x<scale>/day_<day>/input.txt`, which plugs straight
+# into the runner: `python -m aoc.runner --input generated/x10/day_{day}/input.txt`.
+# The seed a file was made with sits next to it in `input.txt.seed`.
+
+import argparse
+import contextlib
+import io
+import math
+import os
+import random
+import string
+import tempfile
+
+DEFAULT_OUTPUT_DIR = "generated"
+DEFAULT_SCALES = (10, 100, 1000)
+DEFAULT_SEED = 2023
+
+DIGIT_WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+def _side(base, scale):
+    """Side length of a square-ish grid whose area grows linearly with scale."""
+    return max(3, round(base * math.sqrt(scale)))
+
+
+def _names(count, length, reserved=()):
+    """Returns `count` distinct lowercase names of at least `length` letters."""
+    names = []
+    index = 0
+    while len(names) < count:
+        name, value = "", index
+        for _ in range(length):
+            name = string.ascii_lowercase[value % 26] + name
+            value //= 26
+        while value:
+            name = string.ascii_lowercase[value % 26] + name
+            value //= 26
+        if name not in reserved:
+            names.append(name)
+        index += 1
+    return names
+
+
+def generate_day_1(scale, rng):
+    lines = []
+    for _ in range(1000 * scale):
+        tokens = []
+        for _ in range(rng.randint(2, 8)):
+            kind = rng.random()
+            if kind < 0.3:
+                tokens.append(str(rng.randint(1, 9)))
+            elif kind < 0.6:
+                tokens.append(rng.choice(DIGIT_WORDS))
+            else:
+                tokens.append("".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 6))))
+        if not any(token.isdigit() for token in tokens):
+            tokens.insert(rng.randrange(len(tokens) + 1), str(rng.randint(1, 9)))
+        lines.append("".join(tokens))
+    return "\n".join(lines)
+
+
+def generate_day_2(scale, rng):
+    lines = []
+    for game_id in range(1, 100 * scale + 1):
+        draws = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            draws.append(", ".join(f"{rng.randint(1, 20)} {color}" for color in colors))
+        lines.append(f"Game {game_id}: " + "; ".join(draws))
+    return "\n".join(lines)
+
+
+def generate_day_3(scale, rng):
+    width = height = _side(140, scale)
+    grid = [["."] * width for _ in range(height)]
+    for row in grid:
+        col = rng.randint(0, 3)
+        while col < width:
+            kind = rng.random()
+            if kind < 0.25:
+                number = str(rng.randint(1, 999))[: width - col]
+                row[col : col + len(number)] = number
+                col += len(number) + rng.randint(1, 4)
+            elif kind < 0.35:
+                row[col] = rng.choice("*#+$/@=%&-")
+                col += rng.randint(2, 5)
+            else:
+                col += rng.randint(1, 4)
+    return "\n".join("".join(row) for row in grid)
+
+
+def generate_day_4(scale, rng):
+    lines = []
+    num_cards = 200 * scale
+    for card_id in range(1, num_cards + 1):
+        # keep most cards losing so part two's copy counts stay reasonable
+        max_matches = min(10, num_cards - card_id)
+        matches = 0 if rng.random() < 0.85 else rng.randint(1, max(1, max_matches))
+        matches = min(matches, max_matches)
+        winning = rng.sample(range(1, 100), 10)
+        others = [n for n in range(1, 100) if n not in winning]
+        held = rng.sample(winning, matches) + rng.sample(others, 25 - matches)
+        rng.shuffle(held)
+        lines.append(
+            f"Card {card_id:>3}: "
+            + " ".join(f"{n:>2}" for n in winning)
+            + " | "
+            + " ".join(f"{n:>2}" for n in held)
+        )
+    return "\n".join(lines)
+
+
+def generate_day_5(scale, rng):
+    upper = 2**32
+    seeds = []
+    for _ in range(10 * scale):
+        start = rng.randrange(upper)
+        seeds += [start, rng.randint(1, 10**8)]
+
+    stages = ["seed", "soil", "fertilizer", "water", "light", "temperature", "humidity", "location"]
+    sections = ["seeds: " + " ".join(map(str, seeds))]
+    for src, dest in zip(stages, stages[1:]):
+        # split the number line into non-overlapping source ranges
+        cuts = sorted(rng.sample(range(1, upper), 2 * 30 * scale))
+        lines = []
+        for low, high in zip(cuts[::2], cuts[1::2]):
+            lines.append(f"{rng.randrange(upper - (high - low))} {low} {high - low}")
+        rng.shuffle(lines)
+        sections.append(f"{src}-to-{dest} map:\n" + "\n".join(lines))
+    return "\n\n".join(sections)
+
+
+def generate_day_6(scale, rng):
+    # part two reads the concatenated numbers, so scale the magnitude of the
+    # combined race and split its digits over four columns
+    time = rng.randint(40_000_000, 60_000_000) * scale
+    distance = rng.randint(time * time // 8, time * time // 4 - 1)
+
+    def split_digits(value):
+        digits = str(value)
+        cuts = sorted(rng.sample(range(1, len(digits)), 3))
+        return [digits[i:j] for i, j in zip([0] + cuts, cuts + [len(digits)])]
+
+    times, distances = split_digits(time), split_digits(distance)
+    width = max(map(len, times + distances)) + 2
+    return (
+        "Time:    " + "".join(t.rjust(width) for t in times) + "\n"
+        "Distance:" + "".join(d.rjust(width) for d in distances)
+    )
+
+
+def generate_day_7(scale, rng):
+    lines = []
+    for _ in range(1000 * scale):
+        hand = "".join(rng.choices("AKQJT98765432", k=5))
+        lines.append(f"{hand} {rng.randint(1, 1000)}")
+    return "\n".join(lines)
+
+
+def generate_day_8(scale, rng):
+    # every ghost walks into a ring containing a single Z node, so both parts
+    # terminate and part two's answer is the lcm of the ring lengths
+    instructions = "".join(rng.choices("LR", k=rng.randint(260, 300)))
+    num_ghosts = 6
+    ring_size = max(4, 750 * scale // num_ghosts)
+    names = iter(_names(num_ghosts * (ring_size + 1), 2, reserved={"aa", "zz"}))
+
+    lines = []
+    for ghost in range(num_ghosts):
+        length = ring_size - rng.randint(0, ring_size // 4)
+        ring = [next(names).upper() + "X" for _ in range(length - 1)]
+        ring.append("ZZZ" if ghost == 0 else next(names).upper() + "Z")
+        start = "AAA" if ghost == 0 else next(names).upper() + "A"
+        lines.append(f"{start} = ({ring[0]}, {ring[0]})")
+        for i, name in enumerate(ring):
+            following = ring[(i + 1) % length]
+            lines.append(f"{name} = ({following}, {following})")
+    rng.shuffle(lines)
+    return instructions + "\n\n" + "\n".join(lines)
+
+
+def generate_day_9(scale, rng):
+    lines = []
+    for _ in range(200 * scale):
+        coefficients = [rng.randint(-9, 9) for _ in range(rng.randint(1, 6))]
+        offset = rng.randint(-5, 5)
+        values = [sum(c * (x + offset) ** i for i, c in enumerate(coefficients)) for x in range(21)]
+        lines.append(" ".join(map(str, values)))
+    return "\n".join(lines)
+
+
+def generate_day_10(scale, rng):
+    # the loop runs along the bottom row, up the right side, back along a
+    # random skyline and down the left side, so it never touches itself
+    width = height = _side(140, scale)
+    skyline = [rng.randint(1, height // 2) for _ in range(width)]
+
+    loop = [(height - 2, col) for col in range(1, width - 1)]
+    row = height - 2
+    for col in range(width - 2, 1, -1):
+        step = -1 if skyline[col] < row else 1
+        loop += [(r, col) for r in range(row + step, skyline[col] + step, step)]
+        row = skyline[col]
+        loop.append((row, col - 1))
+    loop += [(r, 1) for r in range(row + 1, height - 2)]
+
+    grid = [rng.choices("|-LJ7F...", k=width) for _ in range(height)]
+    start = loop[0]
+    for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+        grid[start[0] + dr][start[1] + dc] = "."
+
+    pipes = {
+        frozenset([(-1, 0), (1, 0)]): "|",
+        frozenset([(0, -1), (0, 1)]): "-",
+        frozenset([(-1, 0), (0, 1)]): "L",
+        frozenset([(-1, 0), (0, -1)]): "J",
+        frozenset([(1, 0), (0, -1)]): "7",
+        frozenset([(1, 0), (0, 1)]): "F",
+    }
+    for i, (r, c) in enumerate(loop):
+        (pr, pc), (nr, nc) = loop[i - 1], loop[(i + 1) % len(loop)]
+        grid[r][c] = pipes[frozenset([(pr - r, pc - c), (nr - r, nc - c)])]
+    grid[start[0]][start[1]] = "S"
+    return "\n".join("".join(row) for row in grid)
+
+
+def generate_day_11(scale, rng):
+    width = height = _side(140, scale)
+    empty_rows = set(rng.sample(range(height), height // 20))
+    empty_cols = set(rng.sample(range(width), width // 20))
+    grid = []
+    for r in range(height):
+        row = ["."] * width
+        if r not in empty_rows:
+            for c in range(width):
+                if c not in empty_cols and rng.random() < 0.02:
+                    row[c] = "#"
+        grid.append("".join(row))
+    return "\n".join(grid)
+
+
+def generate_day_12(scale, rng):
+    lines = []
+    for _ in range(1000 * scale):
+        springs = rng.choices("#..", k=rng.randint(4, 20))
+        springs[rng.randrange(len(springs))] = "#"
+        springs = "".join(springs)
+        groups = [len(run) for run in springs.split(".") if run]
+        record = "".join("?" if rng.random() < 0.4 else ch for ch in springs)
+        lines.append(f"{record} {','.join(map(str, groups))}")
+    return "\n".join(lines)
+
+
+def generate_day_13(scale, rng):
+    patterns = []
+    for _ in range(100 * scale):
+        rows, cols = rng.randint(7, 17), rng.randint(7, 17)
+        horizontal = rng.random() < 0.5
+        length = rows if horizontal else cols
+        mirror = rng.randint(1, length - 1)
+        lines = [None] * length
+        for i in range(length):
+            reflected = 2 * mirror - 1 - i
+            if i >= mirror and 0 <= reflected < mirror:
+                lines[i] = lines[reflected]
+            else:
+                lines[i] = "".join(rng.choices("#.", k=cols if horizontal else rows))
+        if not horizontal:
+            lines = ["".join(column) for column in zip(*lines)]
+        patterns.append("\n".join(lines))
+    return "\n\n".join(patterns)
+
+
+def generate_day_14(scale, rng):
+    side = _side(100, scale)
+    return "\n".join("".join(rng.choices("OO#.....", k=side)) for _ in range(side))
+
+
+def generate_day_15(scale, rng):
+    labels = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 6))) for _ in range(500)]
+    steps = []
+    for _ in range(4000 * scale):
+        label = rng.choice(labels)
+        steps.append(f"{label}-" if rng.random() < 0.3 else f"{label}={rng.randint(1, 9)}")
+    return ",".join(steps)
+
+
+def generate_day_16(scale, rng):
+    # this repo's inputs spell `/` as R and `\` as L
+    side = _side(110, scale)
+    return "\n".join("".join(rng.choices("|-RL" + "." * 36, k=side)) for _ in range(side))
+
+
+def generate_day_17(scale, rng):
+    side = _side(141, scale)
+    return "\n".join("".join(rng.choices("123456789", k=side)) for _ in range(side))
+
+
+def generate_day_18(scale, rng):
+    # both dig plans trace a simple rectilinear skyline polygon
+    columns = 350 * scale
+
+    def skyline_moves(max_width, max_height):
+        widths = [rng.randint(1, max_width) for _ in range(columns)]
+        heights = [rng.randint(1, max_height)]
+        for _ in range(columns - 1):
+            height = rng.randint(1, max_height)
+            heights.append(height if height != heights[-1] else height + 1)
+
+        moves = [("R", sum(widths)), ("U", heights[-1])]
+        for j in range(columns - 1, -1, -1):
+            moves.append(("L", widths[j]))
+            if j:
+                delta = heights[j - 1] - heights[j]
+                moves.append(("U" if delta > 0 else "D", abs(delta)))
+        moves.append(("D", heights[0]))
+        return moves
+
+    hex_direction = {"R": "0", "D": "1", "L": "2", "U": "3"}
+    lines = []
+    simple, hex_moves = skyline_moves(10, 20), skyline_moves(50_000, 500_000)
+    for (direction, distance), (hex_dir, hex_distance) in zip(simple, hex_moves):
+        lines.append(f"{direction} {distance} (#{hex_distance:05x}{hex_direction[hex_dir]})")
+    return "\n".join(lines)
+
+
+def generate_day_19(scale, rng):
+    # workflows form a tree rooted at `in`, so every part ends in A or R
+    num_workflows = 550 * scale
+    names = iter(_names(num_workflows, 2, reserved={"in"}))
+    workflows, pending = [], ["in"]
+    created = 1
+    while pending:
+        name = pending.pop(0)
+        rules = []
+        for _ in range(rng.randint(1, 3)):
+            if created < num_workflows and rng.random() < 0.7:
+                target = next(names)
+                pending.append(target)
+                created += 1
+            else:
+                target = rng.choice("AR")
+            rules.append(f"{rng.choice('xmas')}{rng.choice('<>')}{rng.randint(1, 4000)}:{target}")
+        if created < num_workflows and rng.random() < 0.5:
+            fallback = next(names)
+            pending.append(fallback)
+            created += 1
+        else:
+            fallback = rng.choice("AR")
+        workflows.append(f"{name}{{{','.join(rules + [fallback])}}}")
+    rng.shuffle(workflows)
+
+    parts = [
+        "{" + ",".join(f"{rating}={rng.randint(1, 4000)}" for rating in "xmas") + "}"
+        for _ in range(200 * scale)
+    ]
+    return "\n".join(workflows) + "\n\n" + "\n".join(parts)
+
+
+def generate_day_20(scale, rng):
+    # the usual circuit: the broadcaster feeds 12-bit flip-flop counters, each
+    # reset by a conjunction hub once it reaches its period; the hubs report
+    # through inverters into the conjunction in front of `rx`
+    num_counters = 4 * scale
+    bits = 12
+    names = iter(_names(num_counters * (bits + 2) + 1, 2, reserved={"rx"}))
+    final = next(names)
+
+    lines, counter_heads = [], []
+    for _ in range(num_counters):
+        period = rng.randrange(2 ** (bits - 1), 2**bits) | 1
+        flip_flops = [next(names) for _ in range(bits)]
+        hub, inverter = next(names), next(names)
+        counter_heads.append(flip_flops[0])
+
+        for i, flip_flop in enumerate(flip_flops):
+            destinations = [flip_flops[i + 1]] if i + 1 < bits else []
+            if period >> i & 1:
+                destinations.append(hub)
+            lines.append(f"%{flip_flop} -> {', '.join(destinations)}")
+
+        hub_destinations = [flip_flops[0]] + [
+            flip_flop for i, flip_flop in enumerate(flip_flops) if not period >> i & 1
+        ]
+        lines.append(f"&{hub} -> {', '.join(hub_destinations + [inverter])}")
+        lines.append(f"&{inverter} -> {final}")
+
+    lines.append(f"&{final} -> rx")
+    lines.append(f"broadcaster -> {', '.join(counter_heads)}")
+    rng.shuffle(lines)
+    return "\n".join(lines)
+
+
+GENERATORS = {
+    int(name.rsplit("_", 1)[1]): generator
+    for name, generator in list(globals().items())
+    if name.startswith("generate_day_")
+}
+
+
+def generate(day, scale, seed=DEFAULT_SEED):
+    """Generates an input for `day` at `scale` times the size of the real one."""
+    return GENERATORS[day](scale, random.Random(f"{seed}-{day}-{scale}"))
+
+
+def generated_input_path(day, scale, output_dir=DEFAULT_OUTPUT_DIR):
+    return os.path.join(output_dir, f"x{scale}", f"day_{day}", "input.txt")
+
+
+def _read_seed(path):
+    try:
+        with open(path + ".seed") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def write_input(day, scale, output_dir=DEFAULT_OUTPUT_DIR, seed=DEFAULT_SEED, overwrite=False):
+    """Writes a generated input to disk, reusing an existing file unless asked not to.
+
+    The seed is kept next to the input (`input.txt.seed`), so a file made
+    with another seed is regenerated rather than reused.
+    """
+    path = generated_input_path(day, scale, output_dir)
+    if overwrite or not os.path.exists(path) or _read_seed(path) != str(seed):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(generate(day, scale, seed))
+        with open(path + ".seed", "w") as f:
+            f.write(f"{seed}\n")
+    return path
+
+
+def test_generated_inputs_are_solvable():
+    from aoc.solvers import load_solver, select_solvers
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        for solver in select_solvers():
+            if solver.day in (6, 14, 16, 17):
+                continue  # too slow for a quick check, exercised by aoc.scaling
+            path = write_input(solver.day, 1, output_dir)
+            with contextlib.redirect_stdout(io.StringIO()):
+                answer = load_solver(solver)(path)
+            assert answer is not None, f"day {solver.day} part {solver.part} gave no answer"
+    print("✅ test_generated_inputs_are_solvable passed")
+
+
+def test_write_input_follows_seed():
+    with tempfile.TemporaryDirectory() as output_dir:
+        path = write_input(9, 1, output_dir, seed=1)
+        modified = os.path.getmtime(path)
+        # same seed: reused as is
+        assert write_input(9, 1, output_dir, seed=1) == path and os.path.getmtime(path) == modified
+        # another seed: regenerated
+        write_input(9, 1, output_dir, seed=2)
+        with open(path) as f:
+            assert f.read() == generate(9, 1, seed=2) != generate(9, 1, seed=1)
+    print("✅ test_write_input_follows_seed passed")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate scaled puzzle inputs.")
+    parser.add_argument("--day", type=int, action="append", dest="days", choices=sorted(GENERATORS))
+    parser.add_argument("--scale", type=int, action="append", dest="scales")
+    parser.add_argument("--out", default=DEFAULT_OUTPUT_DIR, help="output directory (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    args = parser.parse_args(argv)
+
+    for scale in args.scales or DEFAULT_SCALES:
+        for day in args.days or sorted(GENERATORS):
+            path = write_input(day, scale, args.out, args.seed, overwrite=True)
+            print(f"{path} ({os.path.getsize(path)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
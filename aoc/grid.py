@@ -0,0 +1,167 @@
+# --- Shared grid ---
+# A compact character grid for the grid days. Cells live row-major in one
+# flat bytearray, so a 140x140 puzzle is 19600 bytes instead of 140 lists of
+# 140 one-character strings.
+#
+# `grid[row, col]` reads and writes single characters for readable code;
+# hot loops index `grid.cells` directly with flat indices and the offsets
+# from `neighbour_offsets()`.
+
+# (row, col) deltas, clockwise from the top-left corner
+NEIGHBOURS_4 = ((-1, 0), (0, 1), (1, 0), (0, -1))
+NEIGHBOURS_8 = ((-1, -1), (-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1))
+
+
+class Grid:
+    """A rectangular grid of single-byte characters stored in a flat bytearray."""
+
+    def __init__(self, width, height, cells=None, fill="."):
+        self.width = width
+        self.height = height
+        if cells is None:
+            cells = fill.encode() * (width * height)
+        self.cells = bytearray(cells)
+        if len(self.cells) != width * height:
+            raise ValueError(f"Expected {width * height} cells, got {len(self.cells)}")
+
+    @classmethod
+    def from_string(cls, text):
+        """Builds a grid from newline separated rows, ignoring trailing blank lines."""
+        lines = text.splitlines()
+        while lines and not lines[-1]:
+            lines.pop()
+        return cls.from_lines(lines)
+
+    @classmethod
+    def from_lines(cls, lines):
+        """Builds a grid from a list of equally long rows."""
+        lines = [line.rstrip("\n") for line in lines]
+        width = len(lines[0]) if lines else 0
+        for line in lines:
+            if len(line) != width:
+                raise ValueError(f"Ragged grid: expected rows of {width}, got {len(line)}")
+        return cls(width, len(lines), "".join(lines).encode())
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Builds a grid from a bytes-like block of rows, e.g. a view from `aoc.inputs`."""
+        return cls.from_lines(bytes(data).decode().splitlines())
+
+    def index(self, row, col):
+        return row * self.width + col
+
+    def position(self, index):
+        return divmod(index, self.width)
+
+    def in_bounds(self, row, col):
+        return 0 <= row < self.height and 0 <= col < self.width
+
+    def __getitem__(self, position):
+        row, col = position
+        return chr(self.cells[row * self.width + col])
+
+    def __setitem__(self, position, char):
+        row, col = position
+        self.cells[row * self.width + col] = ord(char)
+
+    def row(self, row):
+        """A zero-copy view of one row."""
+        start = row * self.width
+        return memoryview(self.cells)[start : start + self.width]
+
+    def column(self, col):
+        """A zero-copy (strided) view of one column."""
+        return memoryview(self.cells)[col :: self.width]
+
+    def rows(self):
+        return [self.row(row) for row in range(self.height)]
+
+    def columns(self):
+        return [self.column(col) for col in range(self.width)]
+
+    def neighbour_offsets(self, diagonal=False):
+        """Flat index deltas to the 4 (or 8) neighbours of a cell.
+
+        Only valid away from the edges, see `padded()`.
+        """
+        return tuple(dr * self.width + dc for dr, dc in (NEIGHBOURS_8 if diagonal else NEIGHBOURS_4))
+
+    def padded(self, fill="."):
+        """A copy surrounded by a one cell border, so neighbour lookups need no bounds checks."""
+        border = fill.encode()
+        width = self.width + 2
+        cells = bytearray(border * width)
+        for row in range(self.height):
+            cells += border + self.row(row) + border
+        cells += border * width
+        return Grid(width, self.height + 2, cells)
+
+    def find(self, char):
+        """Position of the first `char`, or None."""
+        index = self.cells.find(char.encode())
+        return None if index == -1 else self.position(index)
+
+    def positions(self, char):
+        """Positions of every `char`, in row-major order."""
+        target, found = char.encode(), []
+        index = self.cells.find(target)
+        while index != -1:
+            found.append(self.position(index))
+            index = self.cells.find(target, index + 1)
+        return found
+
+    def count(self, char):
+        return self.cells.count(char.encode())
+
+    def copy(self):
+        return Grid(self.width, self.height, self.cells)
+
+    def transpose(self):
+        cells, width = self.cells, self.width
+        return Grid(self.height, width, b"".join(cells[col::width] for col in range(width)))
+
+    def rotate_clockwise(self):
+        cells, width = self.cells, self.width
+        return Grid(self.height, width, b"".join(cells[col::width][::-1] for col in range(width)))
+
+    def rotate_counterclockwise(self):
+        cells, width = self.cells, self.width
+        return Grid(self.height, width, b"".join(cells[col::width] for col in range(width - 1, -1, -1)))
+
+    def __eq__(self, other):
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return (self.width, self.height, self.cells) == (other.width, other.height, other.cells)
+
+    __hash__ = None
+
+    def __str__(self):
+        return "\n".join(self.row(row).tobytes().decode() for row in range(self.height))
+
+    def __repr__(self):
+        return f"Grid({self.width}x{self.height})\n{self}"
+
+
+def test_grid():
+    grid = Grid.from_string("ab\ncd\nef\n")
+    assert (grid.width, grid.height) == (2, 3) and Grid.from_bytes(memoryview(b"ab\ncd\nef")) == grid
+    assert grid[2, 1] == "f" and grid.find("d") == (1, 1) and grid.find("z") is None
+    assert bytes(grid.row(1)) == b"cd" and bytes(grid.column(0)) == b"ace"
+    assert str(grid.transpose()) == "ace\nbdf"
+    assert str(grid.rotate_clockwise()) == "eca\nfdb"
+    assert str(grid.rotate_counterclockwise()) == "bdf\nace"
+    assert grid.rotate_clockwise().rotate_counterclockwise() == grid
+
+    padded = grid.padded()
+    assert str(padded) == "....\n.ab.\n.cd.\n.ef.\n...."
+    center = padded.index(2, 1)
+    assert sorted(chr(padded.cells[center + o]) for o in padded.neighbour_offsets()) == [".", "a", "d", "e"]
+
+    grid[0, 0] = "#"
+    grid.column(1)[:] = b"###"
+    assert grid.positions("#") == [(0, 0), (0, 1), (1, 1), (2, 1)] and grid.count("#") == 4
+    print("✅ test_grid passed")
+
+
+if __name__ == "__main__":
+    test_grid()
@@ -0,0 +1,135 @@
+# --- Input loading ---
+# Memory-maps a puzzle input and walks it as lines, blank-line separated
+# blocks or comma separated records. Every item is a memoryview slice of the
+# mapping, so nothing is copied until a solver turns it into a str/int, and
+# multi-gigabyte inputs are paged in by the OS instead of read into memory.
+#
+#   with MappedInput("day_15/input.txt") as data:
+#       total = sum(hash_step(step) for step in data.records())
+#
+# The iterators work on any bytes-like object (bytes, mmap, memoryview), so
+# the inline tests can feed them plain byte strings. Views handed out by a
+# MappedInput are only valid inside its `with` block.
+
+import mmap
+import re
+
+NEWLINE = re.compile(rb"\r?\n")
+BLANK_LINES = re.compile(rb"\r?\n(?:[ \t]*\r?\n)+")
+COMMA = re.compile(rb",")
+TRAILING_WHITESPACE = b" \t\r\n"
+
+
+def _content_end(data):
+    """Length of `data` without trailing whitespace."""
+    view = memoryview(data)
+    end = len(view)
+    while end and view[end - 1] in TRAILING_WHITESPACE:
+        end -= 1
+    return end
+
+
+def _split(data, separator):
+    """Yields the pieces of `data` between matches of `separator`, as views."""
+    view = memoryview(data)
+    end = _content_end(view)
+    start = 0
+    for match in separator.finditer(view, 0, end):
+        yield view[start : match.start()]
+        start = match.end()
+    if start < end:
+        yield view[start:end]
+
+
+def iter_lines(data):
+    """Lines without their line endings (an empty line is yielded as an empty view)."""
+    return _split(data, NEWLINE)
+
+
+def iter_blocks(data):
+    """Groups of lines separated by one or more blank lines (days 5, 13, 19)."""
+    return _split(data, BLANK_LINES)
+
+
+def iter_records(data, separator=COMMA):
+    """Separator delimited records, e.g. the comma separated steps of day 15."""
+    return _split(data, separator)
+
+
+class MappedInput:
+    """A read-only memory mapping of an input file."""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+        self.data = b""
+
+    def __enter__(self):
+        self._file = open(self.path, "rb")
+        try:
+            self.data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty files can't be mapped
+            self.data = b""
+        return self
+
+    def __exit__(self, *exc_info):
+        if isinstance(self.data, mmap.mmap):
+            try:
+                self.data.close()
+            except BufferError:
+                # a caller still holds a view, the mapping goes when it does
+                pass
+        self.data = b""
+        self._file.close()
+
+    def __len__(self):
+        return len(self.data)
+
+    def lines(self):
+        return iter_lines(self.data)
+
+    def blocks(self):
+        return iter_blocks(self.data)
+
+    def records(self, separator=COMMA):
+        return iter_records(self.data, separator)
+
+
+def test_iterators():
+    data = b"seeds: 1 2\r\n\r\nmap:\n3 4\n5 6\n\n\nlast\n\n"
+    assert [bytes(line) for line in iter_lines(data)] == [b"seeds: 1 2", b"", b"map:", b"3 4", b"5 6", b"", b"", b"last"]
+    assert [bytes(block) for block in iter_blocks(data)] == [b"seeds: 1 2", b"map:\n3 4\n5 6", b"last"]
+    assert [bytes(line) for line in iter_lines(list(iter_blocks(data))[1])] == [b"map:", b"3 4", b"5 6"]
+    assert [bytes(record) for record in iter_records(b"rn=1,cm-,qp=3\n")] == [b"rn=1", b"cm-", b"qp=3"]
+    assert list(iter_lines(b"")) == [] and list(iter_blocks(b"\n\n")) == []
+    print("✅ test_iterators passed")
+
+
+def test_mapped_input():
+    import os
+    import tempfile
+
+    with tempfile.NamedTemporaryFile("wb", suffix=".txt", delete=False) as f:
+        f.write(b"a,b\nc\n")
+    try:
+        with MappedInput(f.name) as data:
+            assert len(data) == 6
+            assert [bytes(line) for line in data.lines()] == [b"a,b", b"c"]
+            assert [bytes(record) for record in data.records()] == [b"a", b"b\nc"]
+            # a view kept past the block must not break closing the mapping
+            kept = next(data.lines())
+        del kept
+
+        with open(f.name, "wb"):
+            pass
+        with MappedInput(f.name) as data:
+            assert list(data.blocks()) == []
+    finally:
+        os.remove(f.name)
+    print("✅ test_mapped_input passed")
+
+
+if __name__ == "__main__":
+    test_iterators()
+    test_mapped_input()
@@ -0,0 +1,238 @@
+# --- Parsing helpers ---
+# Shared scanners for the number-heavy inputs. Rather than the per-field
+# `split(": ")` / `split(" | ")` / `map(int, ...)` chains of the solvers,
+# the raw bytes go through one `bytes.translate` that blanks everything
+# that isn't part of a number, one `split()`, and straight into an
+# `array('q')` (str input is accepted and encoded).
+#
+#   ints(b"Card 3:  1 21 | 69 82")       -> array('q', [3, 1, 21, 69, 82])
+#   ints_per_line(report)                -> (values, offsets), line i is values[offsets[i]:offsets[i + 1]]
+#   count_words(b"3 blue, 4 red")        -> [(3, b"blue"), (4, b"red")]
+#
+#   python -m aoc.parsing                # benchmark against the old split-based parsers
+#
+# On inputs of this size the scan itself is on par with `str.split`; the
+# win is that every solver parses its input exactly once into flat arrays.
+
+from array import array
+from itertools import accumulate, chain
+
+# numpy is optional, only ints_per_line_numpy needs it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# everything but digits (and optionally the minus sign) becomes a space
+UNSIGNED = bytes(c if chr(c) in "0123456789\n" else 32 for c in range(256))
+SIGNED = bytes(c if chr(c) in "-0123456789\n" else 32 for c in range(256))
+PUNCTUATION = bytes(32 if chr(c) in ":;,|=<>{}()[]" else c for c in range(256))
+
+
+def _as_bytes(data):
+    return data.encode() if isinstance(data, str) else bytes(data)
+
+
+def ints(data, out=None, signed=False):
+    """Every integer in `data`, in order.
+
+    `signed` treats `-` as a minus sign; leave it off when the input has
+    hyphenated words such as `seed-to-soil`. Pass a preallocated
+    `array('q')` as `out` to reuse its buffer; it is cleared first.
+    """
+    numbers = map(int, _as_bytes(data).translate(SIGNED if signed else UNSIGNED).split())
+    if out is None:
+        return array("q", numbers)
+    del out[:]
+    out.extend(numbers)
+    return out
+
+
+def ints_per_line(data, signed=False):
+    """The integers of every line, flattened.
+
+    Returns `(values, offsets)`: the integers of line `i` are
+    `values[offsets[i]:offsets[i + 1]]`. Trailing blank lines are ignored.
+    """
+    scanned = _as_bytes(data).rstrip().translate(SIGNED if signed else UNSIGNED)
+    lines = [line.split() for line in scanned.splitlines()]
+    values = array("q", map(int, chain.from_iterable(lines)))
+    offsets = array("q", [0])
+    offsets.extend(accumulate(map(len, lines)))
+    return values, offsets
+
+
+def ints_per_line_numpy(data):
+    """`ints_per_line` for unsigned integers, as int64 numpy arrays and without a python loop per number.
+
+    Digit runs are found from the digit positions, and every run's value is
+    a sum of its digits weighted by powers of ten.
+    """
+    if np is None:
+        raise ImportError("ints_per_line_numpy needs numpy")
+    text = np.frombuffer(_as_bytes(data).rstrip().translate(UNSIGNED), dtype=np.uint8)
+    if not len(text):
+        return np.zeros(0, dtype=np.int64), np.zeros(1, dtype=np.int64)
+    positions = np.flatnonzero((text != ord(" ")) & (text != ord("\n")))
+    line_ends = np.flatnonzero(text == ord("\n"))
+    if not len(positions):
+        return np.zeros(0, dtype=np.int64), np.zeros(len(line_ends) + 2, dtype=np.int64)
+    run_starts = np.ones(len(positions), dtype=bool)
+    run_starts[1:] = positions[1:] != positions[:-1] + 1
+    first_digits = np.flatnonzero(run_starts)
+    run_of_digit = np.cumsum(run_starts) - 1
+    last_digits = positions[np.append(first_digits[1:], len(positions)) - 1]
+    weights = np.power(10, last_digits[run_of_digit] - positions)
+    digits = text[positions].astype(np.int64) - ord("0")
+    values = np.add.reduceat(digits * weights, first_digits)
+    # line i holds the runs starting between its start and the next newline
+    offsets = np.concatenate(([0], np.searchsorted(positions[first_digits], line_ends), [len(values)]))
+    return values, offsets.astype(np.int64)
+
+
+def rows(values, offsets):
+    """Splits the output of `ints_per_line` back into one array per line."""
+    return [values[offsets[i] : offsets[i + 1]] for i in range(len(offsets) - 1)]
+
+
+def tokens(data):
+    """Whitespace/punctuation separated tokens as bytes, e.g. hands and bids."""
+    return _as_bytes(data).translate(PUNCTUATION).split()
+
+
+def count_words(data):
+    """`<count> <word>` pairs such as the cube draws of day 2 (`3 blue, 4 red; 1 red`)."""
+    words = tokens(data)
+    return list(zip(map(int, words[0::2]), words[1::2]))
+
+
+# --- benchmarks ---
+# The split-based parsers the solvers used before, next to their scanner
+# replacements; `python -m aoc.parsing` times both on the real inputs.
+
+def _legacy_day_2(text):
+    games = []
+    for game in text.splitlines():
+        game_id, sequences = game.split(": ")
+        draws = [(int(count), color) for sequence in sequences.split(";") for count, color in map(str.split, sequence.split(","))]
+        games.append((int(game_id.split()[1]), draws))
+    return games
+
+
+def _scanner_day_2(data):
+    games = []
+    for line in data.splitlines():
+        head, draws = line.split(b":")
+        games.append((int(head[5:]), count_words(draws)))
+    return games
+
+
+def _legacy_day_4(text):
+    cards = []
+    for card in text.splitlines():
+        _, numbers = card.split(": ")
+        cards.append([set(map(int, ns.split())) for ns in numbers.split(" | ")])
+    return cards
+
+
+def _scanner_day_4(data):
+    # every card has the same shape: id, winning numbers, our numbers
+    first_line = data[: data.index(b"\n")]
+    winning = len(first_line[: first_line.index(b"|")].split()) - 2
+    values, offsets = ints_per_line(data)
+    cards = []
+    for start, end in zip(offsets, offsets[1:]):
+        cards.append((set(values[start + 1 : start + 1 + winning]), set(values[start + 1 + winning : end])))
+    return cards
+
+
+def _legacy_day_5(text):
+    sections = [block.splitlines() for block in text.strip().split("\n\n")]
+    seeds = [int(i) for i in sections[0][0].split()[1:]]
+    return seeds, [[list(map(int, line.split())) for line in block[1:]] for block in sections[1:]]
+
+
+def _scanner_day_5(data):
+    blocks = data.strip().split(b"\n\n")
+    return ints(blocks[0]), [ints(block) for block in blocks[1:]]
+
+
+def _legacy_lines_of_ints(text):
+    return [[int(x) for x in line.split()] for line in text.splitlines()]
+
+
+def _scanner_lines_of_ints(data):
+    return ints_per_line(data, signed=True)
+
+
+def _legacy_day_7(text):
+    return [(line.split()[0], int(line.split()[1])) for line in text.strip().split("\n")]
+
+
+def _scanner_day_7(data):
+    found = tokens(data)
+    return list(zip(found[0::2], map(int, found[1::2])))
+
+
+def _legacy_day_19(text):
+    parts = []
+    for part in text.split("\n\n")[1].splitlines():
+        parts.append([int(rating.split("=")[1]) for rating in part[1:-1].split(",")])
+    return parts
+
+
+def _scanner_day_19(data):
+    return ints(data[data.index(b"\n\n") :])
+
+
+BENCHMARKS = {
+    2: (_legacy_day_2, _scanner_day_2),
+    4: (_legacy_day_4, _scanner_day_4),
+    5: (_legacy_day_5, _scanner_day_5),
+    7: (_legacy_day_7, _scanner_day_7),
+    9: (_legacy_lines_of_ints, _scanner_lines_of_ints),
+    19: (_legacy_day_19, _scanner_day_19),
+}
+
+
+def benchmark(input_path="day_{day}/input.txt", repeat=20):
+    import timeit
+
+    results = []
+    for day, (legacy, scanner) in BENCHMARKS.items():
+        with open(input_path.format(day=day), "rb") as f:
+            data = f.read()
+        text = data.decode()
+        legacy_time = min(timeit.repeat(lambda: legacy(text), number=1, repeat=repeat))
+        scanner_time = min(timeit.repeat(lambda: scanner(data), number=1, repeat=repeat))
+        results.append((day, legacy_time, scanner_time))
+    return results
+
+
+def test_parsing():
+    assert list(ints(b"Card 3:  1 21 | 69 82")) == [3, 1, 21, 69, 82]
+    assert list(ints("0 -3 6 -9", signed=True)) == [0, -3, 6, -9]
+    assert list(ints(b"seed-to-soil map:\n50 98 2")) == [50, 98, 2]
+    buffer = array("q", [7, 7, 7, 7, 7])
+    assert ints(b"1 2", out=buffer) is buffer and list(buffer) == [1, 2]
+
+    values, offsets = ints_per_line(b"0 3 6\n\n1 -3\n\n", signed=True)
+    assert [list(row) for row in rows(values, offsets)] == [[0, 3, 6], [], [1, -3]]
+
+    if np is not None:
+        data = b"Card 1: 41 48 | 83  6\n\nCard 12: 7 | 0 107\n\n"
+        expected_values, expected_offsets = ints_per_line(data)
+        numpy_values, numpy_offsets = ints_per_line_numpy(data)
+        assert numpy_values.tolist() == list(expected_values) and numpy_offsets.tolist() == list(expected_offsets)
+        assert ints_per_line_numpy(b"").__len__() == 2 and ints_per_line_numpy(b"x\n")[1].tolist() == [0, 0]
+
+    assert tokens(b"32T3K 765\nT55J5 684") == [b"32T3K", b"765", b"T55J5", b"684"]
+    assert count_words(" 3 blue, 4 red; 1 red") == [(3, b"blue"), (4, b"red"), (1, b"red")]
+    print("✅ test_parsing passed")
+
+
+if __name__ == "__main__":
+    test_parsing()
+    print(f"{'day':>3} {'split (ms)':>11} {'scanner (ms)':>13} {'speedup':>8}")
+    for day, legacy_time, scanner_time in benchmark():
+        print(f"{day:>3} {legacy_time * 1000:>11.3f} {scanner_time * 1000:>13.3f} {legacy_time / scanner_time:>7.2f}x")
@@ -0,0 +1,308 @@
+# --- Profiling hooks ---
+# Profiles a solver without editing it: the part function (or any function
+# or method inside its module, e.g. `Simulation.run_simulation`) runs under
+# cProfile, hot-path callables and lookup tables are wrapped with counters,
+# and the memory still held when the part returns is snapshotted with
+# tracemalloc.
+#
+#   python -m aoc.profiling --day 17 --part 1                # default counters for the day
+#   python -m aoc.profiling --day 20 --part 2 --wrap Simulation.run_simulation_until_rx
+#   python -m aoc.runner --profile profiles/                 # or AOC_PROFILE=profiles/
+#
+# Every profiled part writes `day_<d>_part_<p>.pstats` (open it with
+# `python -m pstats`) and a `.json` summary next to it. Nothing is patched
+# unless profiling is switched on, so normal runs pay nothing for it.
+
+import argparse
+import contextlib
+import cProfile
+import functools
+import io
+import json
+import os
+import pstats
+import time
+import tracemalloc
+from collections import Counter
+
+from aoc.solvers import DEFAULT_INPUT_PATH, load_solver, resolve_input_path, select_solvers
+
+PROFILE_ENV = "AOC_PROFILE"
+
+# callables worth counting per day, as attribute paths inside the solver
+# module; a lookup table counts how often it is indexed instead (day 16
+# looks every beam node up in BEAM_TURNS once)
+HOT_PATHS = {
+    16: ["BEAM_TURNS", "simulate_light_beam"],
+    17: ["heappush"],
+    20: ["update_pulse_count", "Simulation.run_simulation"],
+}
+
+TOP_FUNCTIONS = 20
+TOP_ALLOCATIONS = 10
+
+_MISSING = object()
+
+
+def profile_dir_from_env():
+    return os.environ.get(PROFILE_ENV) or None
+
+
+def resolve(namespace, target):
+    """Finds `Name.attr.attr` in a module namespace, returning (owner, attribute name)."""
+    head, *rest = target.split(".")
+    if head not in namespace:
+        raise AttributeError(f"Solver module has no attribute {head!r}")
+    if not rest:
+        return namespace, head
+    owner = namespace[head]
+    for name in rest[:-1]:
+        owner = getattr(owner, name)
+    return owner, rest[-1]
+
+
+@contextlib.contextmanager
+def patched(owner, name, replacement):
+    """Temporarily replaces `owner.name` (or `owner[name]` for a module namespace)."""
+    if isinstance(owner, dict):
+        original = owner[name]
+        owner[name] = replacement(original)
+        try:
+            yield
+        finally:
+            owner[name] = original
+        return
+
+    own = vars(owner).get(name, _MISSING)
+    setattr(owner, name, replacement(getattr(owner, name)))
+    try:
+        yield
+    finally:
+        if own is _MISSING:
+            delattr(owner, name)
+        else:
+            setattr(owner, name, own)
+
+
+class CountedTable:
+    """A lookup table that counts how often it is indexed.
+
+    Swapped in for tables that hot loops index directly, so they can be
+    counted without adding a function call to the loop when not profiling.
+    """
+
+    def __init__(self, table, counters, key):
+        self.table = table
+        self.counters = counters
+        self.key = key
+
+    def __getitem__(self, index):
+        self.counters[self.key] += 1
+        return self.table[index]
+
+    def __len__(self):
+        return len(self.table)
+
+
+def counting(counters, key):
+    def wrap(function):
+        if not callable(function):
+            return CountedTable(function, counters, key)
+
+        @functools.wraps(function)
+        def counted(*args, **kwargs):
+            counters[key] += 1
+            return function(*args, **kwargs)
+
+        return counted
+
+    return wrap
+
+
+def profiling(profiler):
+    depth = [0]
+
+    def wrap(function):
+        @functools.wraps(function)
+        def profiled(*args, **kwargs):
+            # recursive calls stay inside the outer profiling window
+            depth[0] += 1
+            if depth[0] == 1:
+                profiler.enable()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                depth[0] -= 1
+                if depth[0] == 0:
+                    profiler.disable()
+
+        return profiled
+
+    return wrap
+
+
+def cache_stats(namespace):
+    """Hits and misses of every `functools.cache`d function in the module."""
+    stats = {}
+    for name, value in namespace.items():
+        cache_info = getattr(value, "cache_info", None)
+        if callable(cache_info) and getattr(value, "__module__", None) == namespace.get("__name__"):
+            info = cache_info()
+            stats[name] = {"hits": info.hits, "misses": info.misses, "size": info.currsize}
+    return stats
+
+
+def top_functions(profiler, limit=TOP_FUNCTIONS):
+    stats = pstats.Stats(profiler)
+    rows = []
+    for (filename, line, name), (_, calls, own_time, cumulative, _) in stats.stats.items():
+        rows.append(
+            {
+                "function": f"{os.path.relpath(filename) if os.path.isabs(filename) else filename}:{line}({name})",
+                "calls": calls,
+                "own_time": own_time,
+                "cumulative_time": cumulative,
+            }
+        )
+    return sorted(rows, key=lambda row: row["cumulative_time"], reverse=True)[:limit]
+
+
+def top_allocations(snapshot, limit=TOP_ALLOCATIONS):
+    snapshot = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+    return [
+        {"location": str(stat.traceback), "size": stat.size, "count": stat.count}
+        for stat in snapshot.statistics("lineno")[:limit]
+    ]
+
+
+def profiled(part_function, output_stem, count=None, wrap=()):
+    """Wraps a part function so each call is profiled and reported to `output_stem`.{pstats,json}.
+
+    `count` lists callables to count (defaults to nothing); `wrap` narrows
+    cProfile down to those callables instead of the whole part.
+    """
+    namespace = part_function.__globals__
+
+    @functools.wraps(part_function)
+    def run(*args, **kwargs):
+        counters = Counter()
+        profiler = cProfile.Profile()
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+
+        with contextlib.ExitStack() as stack:
+            for target in count or ():
+                stack.enter_context(patched(*resolve(namespace, target), counting(counters, target)))
+            for target in wrap:
+                stack.enter_context(patched(*resolve(namespace, target), profiling(profiler)))
+
+            wall_start = time.perf_counter()
+            if wrap:
+                answer = part_function(*args, **kwargs)
+            else:
+                answer = profiler.runcall(part_function, *args, **kwargs)
+            wall_time = time.perf_counter() - wall_start
+
+        snapshot = tracemalloc.take_snapshot()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        if started_tracing:
+            tracemalloc.stop()
+
+        directory = os.path.dirname(output_stem)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        profiler.dump_stats(f"{output_stem}.pstats")
+        report = {
+            "function": part_function.__qualname__,
+            "arguments": [str(arg) for arg in args],
+            "answer": answer,
+            "wall_time": wall_time,
+            "peak_memory": peak_memory,
+            "counters": dict(counters),
+            "caches": cache_stats(namespace),
+            "top_functions": top_functions(profiler),
+            "top_allocations": top_allocations(snapshot),
+        }
+        with open(f"{output_stem}.json", "w") as f:
+            json.dump(report, f, indent=2, default=str)
+        return answer
+
+    return run
+
+
+def profile_solver(solver, output_dir, input_path=DEFAULT_INPUT_PATH, count=None, wrap=()):
+    """Runs one registered part under the profiler and returns its answer."""
+    part_function = load_solver(solver)
+    counted = HOT_PATHS.get(solver.day, []) if count is None else count
+    output_stem = os.path.join(output_dir, f"day_{solver.day}_part_{solver.part}")
+    with contextlib.redirect_stdout(io.StringIO()):
+        return profiled(part_function, output_stem, counted, wrap)(resolve_input_path(solver, input_path))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile solvers with cProfile, tracemalloc and call counters.")
+    parser.add_argument("--day", type=int, action="append", dest="days")
+    parser.add_argument("--part", type=int, action="append", dest="parts", choices=[1, 2])
+    parser.add_argument("--input", default=DEFAULT_INPUT_PATH)
+    parser.add_argument("--out", default=profile_dir_from_env() or "profiles", help="where reports are written")
+    parser.add_argument(
+        "--count", action="append", help="callable to count, e.g. heappush (default: the day's hot paths)"
+    )
+    parser.add_argument("--wrap", action="append", default=[], help="only profile inside this callable")
+    args = parser.parse_args(argv)
+
+    for solver in select_solvers(args.days, args.parts):
+        answer = profile_solver(solver, args.out, args.input, args.count, args.wrap)
+        print(f"day {solver.day} part {solver.part}: {answer} -> {args.out}/day_{solver.day}_part_{solver.part}.json")
+
+
+def test_profile_solver():
+    import shutil
+    import tempfile
+
+    directory = tempfile.mkdtemp()
+    try:
+        [solver] = select_solvers(days=[17], parts=[1])
+        input_path = os.path.join(directory, "input.txt")
+        with open(input_path, "w") as f:
+            f.write("2413432311323\n3215453535623\n3255245654254\n3446585845452\n")
+
+        answer = profile_solver(solver, directory, input_path)
+        with open(os.path.join(directory, "day_17_part_1.json")) as f:
+            report = json.load(f)
+        assert report["answer"] == answer and report["counters"]["heappush"] > 0
+        assert os.path.exists(os.path.join(directory, "day_17_part_1.pstats"))
+
+        part_function = load_solver(solver)
+        push = part_function.__globals__["heappush"]
+        with contextlib.redirect_stdout(io.StringIO()):
+            profiled(part_function, os.path.join(directory, "again"), ["heappush"])(input_path)
+        assert part_function.__globals__["heappush"] is push, "patches must be undone"
+
+        # day 16 counts beam nodes through its lookup table, which is put back afterwards
+        [solver] = select_solvers(days=[16], parts=[1])
+        with open(input_path, "w") as f:
+            f.write(".|...L....\n|.-.L.....\n.....|-...\n........|.\n..........\n.........L\n....R.LL..\n.-.-R..|..\n.|....-|.L\n..RR.|....\n")
+        part_function = load_solver(solver)
+        turns = part_function.__globals__["BEAM_TURNS"]
+        with contextlib.redirect_stdout(io.StringIO()):
+            profiled(part_function, os.path.join(directory, "beams"), HOT_PATHS[16])(input_path)
+        with open(os.path.join(directory, "beams.json")) as f:
+            counters = json.load(f)["counters"]
+        assert counters["simulate_light_beam"] == 1 and counters["BEAM_TURNS"] >= 46  # at least one node per energized tile
+        assert part_function.__globals__["BEAM_TURNS"] is turns, "patches must be undone"
+
+        [solver] = select_solvers(days=[20], parts=[1])
+        profile_solver(solver, directory, wrap=["Simulation.run_simulation"])
+        with open(os.path.join(directory, "day_20_part_1.json")) as f:
+            report = json.load(f)
+        assert report["answer"] == 899848294 and report["counters"]["Simulation.run_simulation"] == 1
+        assert any("run_simulation" in row["function"] for row in report["top_functions"])
+        print("✅ test_profile_solver passed")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+# --- Timed runner ---
+# Runs every registered day/part on a chosen input and reports wall time,
+# CPU time and peak memory per part.
+#
+#   python -m aoc.runner                      # all days, table output
+#   python -m aoc.runner --day 16 --json      # one day, JSON output
+#   python -m aoc.runner --input "big/day_{day}.txt"
+#   python -m aoc.runner --cache              # reuse answers from aoc.cache
+#   python -m aoc.runner --profile profiles/  # cProfile/tracemalloc reports, see aoc.profiling
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import time
+import tracemalloc
+
+from aoc.cache import DEFAULT_CACHE_DIR, ResultCache
+from aoc.profiling import HOT_PATHS, profile_dir_from_env, profiled
+from aoc.solvers import DEFAULT_INPUT_PATH, Solver, load_solver, resolve_input_path, select_solvers
+
+
+def run_solver(solver, input_path=DEFAULT_INPUT_PATH, track_memory=True, cache=None, profile_dir=None):
+    """Runs a single part and returns its answer along with the measurements.
+
+    With a `ResultCache`, a cached answer is returned without running the
+    solver (`cached` is set and the timings are zero). With a `profile_dir`
+    (or `AOC_PROFILE` set) the part is profiled and its reports written there.
+    """
+    result = {
+        "day": solver.day,
+        "part": solver.part,
+        "input": resolve_input_path(solver, input_path),
+        "answer": None,
+        "wall_time": None,
+        "cpu_time": None,
+        "peak_memory": None,
+        "error": None,
+        "cached": False,
+    }
+
+    if cache is not None:
+        try:
+            hit, answer = cache.get(solver, result["input"])
+        except OSError:
+            hit, answer = False, None
+        if hit:
+            result.update(answer=answer, wall_time=0.0, cpu_time=0.0, cached=True)
+            return result
+
+    try:
+        # a day that doesn't even import is recorded like any other failure
+        part_function = load_solver(solver)
+    except Exception as e:
+        result.update(error=f"{type(e).__name__}: {e}", wall_time=0.0, cpu_time=0.0)
+        return result
+
+    profile_dir = profile_dir or profile_dir_from_env()
+    if profile_dir:
+        output_stem = os.path.join(profile_dir, f"day_{solver.day}_part_{solver.part}")
+        part_function = profiled(part_function, output_stem, HOT_PATHS.get(solver.day, []))
+
+    if track_memory:
+        tracemalloc.start()
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    try:
+        # solvers print their answers, keep the report clean
+        with contextlib.redirect_stdout(io.StringIO()):
+            result["answer"] = part_function(result["input"])
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    finally:
+        result["wall_time"] = time.perf_counter() - wall_start
+        result["cpu_time"] = time.process_time() - cpu_start
+        if track_memory:
+            result["peak_memory"] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+    if cache is not None and result["error"] is None:
+        try:
+            cache.put(solver, result["input"], result["answer"])
+        except OSError:
+            # e.g. a read-only cache directory, the answer just isn't cached
+            pass
+
+    return result
+
+
+def run_all(solvers, input_path=DEFAULT_INPUT_PATH, track_memory=True, cache=None, profile_dir=None):
+    """Runs the given solvers one after the other."""
+    return [run_solver(solver, input_path, track_memory, cache, profile_dir) for solver in solvers]
+
+
+def format_table(results):
+    """Formats the results as a plain text table."""
+    header = f"{'day':>3} {'part':>4} {'wall (s)':>10} {'cpu (s)':>10} {'peak (KiB)':>11}  answer"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        peak = "-" if result["peak_memory"] is None else f"{result['peak_memory'] / 1024:.1f}"
+        answer = result["error"] or result["answer"]
+        if result.get("cached"):
+            answer = f"{answer} (cached)"
+        lines.append(
+            f"{result['day']:>3} {result['part']:>4} {result['wall_time']:>10.4f} "
+            f"{result['cpu_time']:>10.4f} {peak:>11}  {answer}"
+        )
+    lines.append("-" * len(header))
+    lines.append(
+        f"{'total':>8} {sum(r['wall_time'] for r in results):>10.4f} "
+        f"{sum(r['cpu_time'] for r in results):>10.4f}"
+    )
+    return "\n".join(lines)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the Advent of Code solvers with timings.")
+    parser.add_argument("--day", type=int, action="append", dest="days", help="day to run (repeatable)")
+    parser.add_argument("--part", type=int, action="append", dest="parts", choices=[1, 2], help="part to run")
+    parser.add_argument(
+        "--input",
+        default=DEFAULT_INPUT_PATH,
+        help="input path, `{day}` is replaced by the day number (default: %(default)s)",
+    )
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="skip peak memory tracking (tracemalloc slows the solvers down)",
+    )
+    parser.add_argument("--cache", action="store_true", help="reuse answers cached for the same input and solver source")
+    parser.add_argument(
+        "--profile",
+        metavar="DIR",
+        help="write cProfile/tracemalloc/counter reports per part to DIR (also AOC_PROFILE)",
+    )
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="cache directory (default: %(default)s)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    solvers = select_solvers(args.days, args.parts)
+    cache = ResultCache(args.cache_dir) if args.cache else None
+    results = run_all(solvers, args.input, track_memory=not args.no_memory, cache=cache, profile_dir=args.profile)
+
+    if args.json:
+        print(json.dumps(results, indent=2, default=str))
+    else:
+        print(format_table(results))
+
+    return 1 if any(result["error"] for result in results) else 0
+
+
+def test_run_solver():
+    [solver] = select_solvers(days=[9], parts=[1])
+    result = run_solver(solver)
+    assert result["error"] is None, result["error"]
+    assert result["answer"] == 2105961943, f"Expected 2105961943, got {result['answer']}"
+    assert result["wall_time"] > 0 and result["peak_memory"] > 0
+    print("✅ test_run_solver passed")
+
+
+def test_run_solver_captures_errors():
+    import tempfile
+
+    [solver] = select_solvers(days=[9], parts=[1])
+    result = run_solver(solver, "day_{day}/missing.txt", track_memory=False)
+    assert result["error"].startswith("FileNotFoundError"), result["error"]
+    assert result["peak_memory"] is None
+
+    # a module that doesn't import, and a cache that can't be written
+    class ReadOnlyCache:
+        def get(self, solver, input_path):
+            return False, None
+
+        def put(self, solver, input_path, answer):
+            raise PermissionError("read-only")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "broken.py")
+        with open(path, "w") as f:
+            f.write("def part_1(:\n")
+        result = run_solver(Solver(99, 1, path, "part_1"), track_memory=False)
+        assert result["error"].startswith("SyntaxError"), result["error"]
+        format_table([result])
+    result = run_solver(solver, track_memory=False, cache=ReadOnlyCache())
+    assert result["error"] is None and result["answer"] == 2105961943
+    print("✅ test_run_solver_captures_errors passed")
+
+
+def test_run_solver_uses_cache():
+    import shutil
+    import tempfile
+
+    directory = tempfile.mkdtemp()
+    try:
+        cache = ResultCache(directory)
+        [solver] = select_solvers(days=[9], parts=[1])
+        first = run_solver(solver, track_memory=False, cache=cache)
+        second = run_solver(solver, track_memory=False, cache=cache)
+        assert not first["cached"] and second["cached"]
+        assert second["answer"] == first["answer"] == 2105961943
+        print("✅ test_run_solver_uses_cache passed")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,140 @@
+# --- Scaling benchmarks ---
+# Runs every solver over generated inputs of growing size and fits an
+# empirical complexity curve to the timings, so a solver that quietly goes
+# from O(n) to O(n^2) stands out.
+#
+#   python -m aoc.scaling                          # every day at x1, x10, x100, x1000
+#   python -m aoc.scaling --day 3 --scale 1 --scale 10 --budget 5
+#
+# A size is skipped when the previous timings predict it would take longer
+# than the per-run budget.
+
+import argparse
+import json
+import math
+import os
+
+from aoc.generators import DEFAULT_OUTPUT_DIR, DEFAULT_SEED, write_input
+from aoc.runner import run_solver
+from aoc.solvers import select_solvers
+
+DEFAULT_SCALES = (1, 10, 100, 1000)
+DEFAULT_BUDGET = 30.0
+
+COMPLEXITY_MODELS = {
+    "O(1)": lambda n: 1.0,
+    "O(log n)": lambda n: math.log(n),
+    "O(n)": lambda n: n,
+    "O(n log n)": lambda n: n * math.log(n),
+    "O(n^2)": lambda n: n**2,
+    "O(n^3)": lambda n: n**3,
+}
+
+
+def fit_exponent(sizes, times):
+    """Slope of the least-squares line through (log n, log t)."""
+    xs, ys = [math.log(n) for n in sizes], [math.log(t) for t in times]
+    x_mean, y_mean = sum(xs) / len(xs), sum(ys) / len(ys)
+    spread = sum((x - x_mean) ** 2 for x in xs)
+    if spread == 0:
+        return None
+    return sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys)) / spread
+
+
+def best_complexity(sizes, times):
+    """Picks the model `t = c * f(n)` with the smallest squared log error."""
+    best_model, best_error = None, float("inf")
+    for model, f in COMPLEXITY_MODELS.items():
+        residuals = [math.log(t) - math.log(f(n)) for n, t in zip(sizes, times)]
+        log_c = sum(residuals) / len(residuals)
+        error = sum((r - log_c) ** 2 for r in residuals)
+        if error < best_error - 1e-12:
+            best_model, best_error = model, error
+    return best_model
+
+
+def benchmark_solver(solver, scales=DEFAULT_SCALES, budget=DEFAULT_BUDGET, output_dir=DEFAULT_OUTPUT_DIR, seed=DEFAULT_SEED):
+    """Times one solver across the scales and fits its complexity."""
+    runs = []
+    for scale in scales:
+        if len(runs) >= 1:
+            # assume at least linear growth when predicting the next run
+            last = runs[-1]
+            exponent = max(1.0, fit_exponent([r["size"] for r in runs], [r["wall_time"] for r in runs]) or 1.0)
+            predicted = last["wall_time"] * (scale / last["scale"]) ** exponent
+            if predicted > budget:
+                runs.append({"scale": scale, "skipped": f"predicted {predicted:.1f}s > budget"})
+                break
+
+        path = write_input(solver.day, scale, output_dir, seed)
+        result = run_solver(solver, path, track_memory=False)
+        if result["error"]:
+            runs.append({"scale": scale, "skipped": result["error"]})
+            break
+        runs.append(
+            {
+                "scale": scale,
+                "size": os.path.getsize(path),
+                "wall_time": max(result["wall_time"], 1e-6),
+            }
+        )
+
+    timed = [run for run in runs if "wall_time" in run]
+    sizes, times = [r["size"] for r in timed], [r["wall_time"] for r in timed]
+    enough = len(timed) >= 2
+    return {
+        "day": solver.day,
+        "part": solver.part,
+        "runs": runs,
+        "exponent": fit_exponent(sizes, times) if enough else None,
+        "complexity": best_complexity(sizes, times) if enough else None,
+    }
+
+
+def format_table(reports, scales):
+    header = f"{'day':>3} {'part':>4} " + " ".join(f"{'x' + str(s):>9}" for s in scales) + f" {'exponent':>8}  fit"
+    lines = [header, "-" * len(header)]
+    for report in reports:
+        cells = {run["scale"]: run for run in report["runs"]}
+        timings = []
+        for scale in scales:
+            run = cells.get(scale)
+            timings.append(f"{run['wall_time']:>9.4f}" if run and "wall_time" in run else f"{'-':>9}")
+        exponent = "-" if report["exponent"] is None else f"{report['exponent']:.2f}"
+        lines.append(
+            f"{report['day']:>3} {report['part']:>4} " + " ".join(timings)
+            + f" {exponent:>8}  {report['complexity'] or '-'}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fit empirical complexity curves over generated inputs.")
+    parser.add_argument("--day", type=int, action="append", dest="days")
+    parser.add_argument("--part", type=int, action="append", dest="parts", choices=[1, 2])
+    parser.add_argument("--scale", type=int, action="append", dest="scales")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET, help="max seconds per run (default: %(default)s)")
+    parser.add_argument("--out", default=DEFAULT_OUTPUT_DIR, help="where generated inputs are kept")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    scales = sorted(args.scales or DEFAULT_SCALES)
+    reports = [
+        benchmark_solver(solver, scales, args.budget, args.out, args.seed)
+        for solver in select_solvers(args.days, args.parts)
+    ]
+    print(json.dumps(reports, indent=2) if args.json else format_table(reports, scales))
+
+
+def test_best_complexity():
+    sizes = [10, 100, 1000, 10000]
+    assert best_complexity(sizes, [0.5 * n for n in sizes]) == "O(n)"
+    assert best_complexity(sizes, [2e-3 * n * n for n in sizes]) == "O(n^2)"
+    assert best_complexity(sizes, [3.0 for _ in sizes]) == "O(1)"
+    assert abs(fit_exponent(sizes, [n**2 for n in sizes]) - 2) < 1e-9
+    print("✅ test_best_complexity passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# --- Solver registry ---
+# Maps every day/part to the script and function that solves it, and loads
+# those scripts as fresh modules so they can be run from a single process.
+
+import importlib.util
+import os
+import sys
+from collections import namedtuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_INPUT_PATH = "day_{day}/input.txt"
+
+Solver = namedtuple("Solver", ["day", "part", "path", "function"])
+
+SOLVERS = [
+    Solver(1, 1, "day_1/part_1_trebuchet.py", "main"),
+    Solver(1, 2, "day_1/part_2_trebuchet.py", "main"),
+    Solver(2, 1, "day_2/part_1_cube_conundrum.py", "main"),
+    Solver(2, 2, "day_2/part_2_cube_conundrum.py", "main"),
+    Solver(3, 1, "day_3/gear_ratios.py", "part_1"),
+    Solver(3, 2, "day_3/gear_ratios.py", "part_2"),
+    Solver(4, 1, "day_4/scratchcards.py", "part_1"),
+    Solver(4, 2, "day_4/scratchcards.py", "part_2"),
+    Solver(5, 2, "day_5/if_you_give_a_seed_a_fertilizer_take2.py", "main"),
+    Solver(6, 1, "day_6/wait_for_it.py", "part_1"),
+    Solver(6, 2, "day_6/wait_for_it.py", "part_2"),
+    Solver(7, 1, "day_7/camel_cards_part_1.py", "part_1"),
+    Solver(7, 2, "day_7/camel_cards_part_2.py", "part_2"),
+    Solver(8, 1, "day_8/haunted_wasteland.py", "navigate_through_desert"),
+    Solver(8, 2, "day_8/haunted_wasteland.py", "navigate_through_desert_as_ghosts"),
+    Solver(9, 1, "day_9/mirage_maintenance.py", "part_one"),
+    Solver(9, 2, "day_9/mirage_maintenance.py", "part_two"),
+    Solver(10, 1, "day_10/pipe_maze.py", "part_one"),
+    Solver(10, 2, "day_10/pipe_maze.py", "part_two"),
+    Solver(11, 1, "day_11/cosmic_expansion.py", "part_one"),
+    Solver(11, 2, "day_11/cosmic_expansion.py", "part_two"),
+    Solver(12, 1, "day_12/hot_springs.py", "part_one"),
+    Solver(12, 2, "day_12/hot_springs.py", "part_two"),
+    Solver(13, 1, "day_13/point_of_incidence.py", "part_one"),
+    Solver(13, 2, "day_13/point_of_incidence.py", "part_two"),
+    Solver(14, 1, "day_14/parabolic_reflector_dish.py", "part_one"),
+    Solver(14, 2, "day_14/parabolic_reflector_dish.py", "part_two"),
+    Solver(15, 1, "day_15/lens_library.py", "part_one"),
+    Solver(15, 2, "day_15/lens_library.py", "part_two"),
+    Solver(16, 1, "day_16/the_floor_will_be_lava.py", "part_one"),
+    Solver(16, 2, "day_16/the_floor_will_be_lava.py", "part_two"),
+    Solver(17, 1, "day_17/clumsy_crucible.py", "part_one"),
+    Solver(17, 2, "day_17/clumsy_crucible.py", "part_two"),
+    Solver(18, 1, "day_18/lavaduct_lagoon.py", "part_one"),
+    Solver(18, 2, "day_18/lavaduct_lagoon.py", "part_two"),
+    Solver(19, 1, "day_19/aplenty_part_1.py", "part_one"),
+    Solver(19, 2, "day_19/aplenty_part_2.py", "part_two"),
+    Solver(20, 1, "day_20/pulse_propagation.py", "part_one"),
+    Solver(20, 2, "day_20/pulse_propagation.py", "part_two"),
+]
+
+
+def select_solvers(days=None, parts=None):
+    """Returns the registered solvers, optionally filtered by day and part."""
+    return [
+        solver
+        for solver in SOLVERS
+        if (not days or solver.day in days) and (not parts or solver.part in parts)
+    ]
+
+
+def load_module(path):
+    """Loads a solver script as a brand new module.
+
+    Some solvers keep state in module globals (e.g. the pulse counters of
+    day 20), so every run gets its own copy of the module.
+    """
+    # solvers import the shared helpers as `aoc.*`
+    if REPO_ROOT not in sys.path:
+        sys.path.insert(0, REPO_ROOT)
+    module_name = os.path.splitext(path.replace("/", "."))[0]
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(REPO_ROOT, path))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_solver(solver):
+    """Returns the part function of a registered solver."""
+    return getattr(load_module(solver.path), solver.function)
+
+
+def resolve_input_path(solver, input_path=DEFAULT_INPUT_PATH):
+    """Fills the `{day}` placeholder of an input path template."""
+    return input_path.format(day=solver.day)
@@ -0,0 +1,41 @@
+# --- Test helpers ---
+# Shared by the inline `test_*` functions of the solvers.
+#
+#   for _ in numpy_modes(sys.modules[__name__]):   # run the body with and without numpy
+#       assert ...
+
+import sys
+
+
+def numpy_modes(module):
+    """Runs the loop body once with `module.np` as numpy and once as None.
+
+    Solvers with an optional numpy path import it as `np` (None when it
+    is missing), so this checks both paths agree. The module's `np` is
+    restored afterwards, even when an assertion fails.
+    """
+    numpy = module.np
+    try:
+        for mode in (numpy, None) if numpy is not None else (None,):
+            module.np = mode
+            yield mode
+    finally:
+        module.np = numpy
+
+
+def test_numpy_modes():
+    module = type(sys)("example")
+    module.np = numpy = object()
+    assert list(numpy_modes(module)) == [numpy, None] and module.np is numpy
+    try:
+        for mode in numpy_modes(module):
+            raise ValueError
+    except ValueError:
+        assert module.np is numpy
+    module.np = None
+    assert list(numpy_modes(module)) == [None]
+    print("✅ test_numpy_modes passed")
+
+
+if __name__ == "__main__":
+    test_numpy_modes()
@@ -0,0 +1,73 @@
+# --- Day 1: Trebuchet?! ---
+# --- Streaming mode ---
+# sums the calibration values of documents too large for readlines(): the
+# file is cut into newline-aligned byte ranges (aoc.chunks) and each range
+# is summed in a worker process, with either part's rules
+#
+#   python -m day_1.parallel_trebuchet --part 2 --processes 8 --chunk-size 8M big.txt
+
+import argparse
+import functools
+
+from aoc.chunks import DEFAULT_CHUNK_SIZE, map_ranges, read_range
+from day_1 import part_1_trebuchet, part_2_trebuchet
+
+RULES = {
+    1: part_1_trebuchet.get_combined_digits,
+    2: part_2_trebuchet.get_combined_digits,
+}
+
+def sum_range(part, path, start, end):
+    # worker: sums the lines of one byte range of the document
+    get_combined_digits = RULES[part]
+    lines = read_range(path, start, end).decode().splitlines()
+    return sum(get_combined_digits(line.strip()) for line in lines)
+
+def sum_calibration_file(input_path, part=2, processes=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    # one process per core unless told otherwise; processes=1 runs in this process
+    worker = functools.partial(sum_range, part)
+    return sum(map_ranges(input_path, worker, processes, chunk_size))
+
+def parse_size(text):
+    # "65536", "64K", "8M", "1G"
+    units = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+    text = text.strip().upper()
+    if text and text[-1] in units:
+        return int(text[:-1]) * units[text[-1]]
+    return int(text)
+
+def test_sum_calibration_file():
+    import os
+    import tempfile
+
+    lines = ["two1nine", "eightwothree", "abcone2threexyz", "xtwone3four", "4nineeightseven2", "zoneight234", "7pqrstsixteen", "1abc2", "treb7uchet"]
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+        f.write("\n".join(lines) + "\n")
+    try:
+        for processes, chunk_size in [(1, 1), (2, 16), (2, 1 << 20)]:
+            assert sum_calibration_file(f.name, 1, processes, chunk_size) == part_1_trebuchet.sum_calibration_values(lines)
+            assert sum_calibration_file(f.name, 2, processes, chunk_size) == part_2_trebuchet.sum_calibration_values(lines) == 281 + 12 + 77
+    finally:
+        os.remove(f.name)
+    assert parse_size("64K") == 65536 and parse_size("3") == 3
+    print("All tests passed")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sum the calibration values of a large document in parallel.")
+    parser.add_argument("input_path", nargs="?", default="day_1/input.txt")
+    parser.add_argument("--part", type=int, choices=[1, 2], default=2)
+    parser.add_argument("--processes", type=int, help="worker processes (default: one per core)")
+    parser.add_argument("--chunk-size", type=parse_size, default=DEFAULT_CHUNK_SIZE, help="bytes per range, e.g. 8M (default: 4M)")
+    args = parser.parse_args(argv)
+
+    total = sum_calibration_file(args.input_path, args.part, args.processes, args.chunk_size)
+    print(total)
+    return total
+
+if __name__ == "__main__":
+    # run the test function
+    test_sum_calibration_file()
+
+    # execute the main function
+    main()
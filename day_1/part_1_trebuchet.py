@@ -1,6 +1,14 @@
 # --- Day 1: Trebuchet?! ---
 # --- Part one ---
 
+import sys
+
+# numpy is optional, without it only the per-line path is available
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 def get_combined_digits(line):
     # extract all digits from the input line
     digits = [ch for ch in line if ch.isdigit()]
@@ -19,13 +27,47 @@ def sum_calibration_values(lines):
     # sum up combined digits values for each line
     return sum(get_combined_digits(line.strip()) for line in lines)
 
-def main():
+def sum_calibration_values_vectorized(data):
+    # same result as sum_calibration_values for ASCII digits, with no
+    # per-character python loop: the whole document is one uint8 array
+    if np is None:
+        raise ImportError("the vectorized mode needs numpy")
+    text = np.frombuffer(data, dtype=np.uint8)
+    if not len(text):
+        return 0
+
+    # line i covers text[starts[i]:ends[i]]
+    ends = np.flatnonzero(text == ord("\n"))
+    if text[-1] != ord("\n"):
+        ends = np.append(ends, len(text))
+    starts = np.concatenate(([0], ends[:-1] + 1))
+
+    # positions of every digit, then the first one at or after each line
+    # start and the last one before each line end
+    digit_positions = np.flatnonzero((text >= ord("0")) & (text <= ord("9")))
+    first = np.searchsorted(digit_positions, starts)
+    last = np.searchsorted(digit_positions, ends) - 1
+
+    # lines without digits have no digit between their start and end
+    has_digits = first <= last
+    values = text[digit_positions[first[has_digits]]].astype(np.int64) * 10 + text[digit_positions[last[has_digits]]]
+    return int(values.sum() - 11 * ord("0") * len(values))
+
+def main(input_path="day_1/input.txt", vectorized=np is not None):
+    if vectorized:
+        with open(input_path, "rb") as f:
+            total = sum_calibration_values_vectorized(f.read())
+        print(total)
+        return total
+
     # read lines from the file
-    with open("input.txt") as f:
+    with open(input_path) as f:
         lines = f.readlines()
 
     # calculate and display the sum of calibration values
-    print(sum_calibration_values(lines))
+    total = sum_calibration_values(lines)
+    print(total)
+    return total
 
 def test_calibration_values():
     # define test cases with expected outcomes
@@ -44,13 +86,43 @@ def test_calibration_values():
     # test sum_calibration_values function
     assert sum_calibration_values([line for line, _ in test_cases]) == 142, "Sum test failed"
 
+    # the vectorized mode agrees, including blank lines, \r\n and a missing final newline
+    if np is not None:
+        document = "\n".join(line for line, _ in test_cases) + "\n\n7\r\nx"
+        assert sum_calibration_values_vectorized(document.encode()) == 142 + 77
+        assert sum_calibration_values_vectorized(b"") == 0
+
     # indicate all tests passed
     print("All tests passed")
 
+def benchmark(size=100 << 20, input_path="day_1/input.txt"):
+    # throughput of both modes on the input repeated up to `size` bytes
+    import time
+
+    with open(input_path, "rb") as f:
+        data = f.read()
+    if not data.endswith(b"\n"):
+        data += b"\n"
+    data *= max(1, size // len(data))
+
+    start = time.perf_counter()
+    expected = sum_calibration_values(data.decode().splitlines())
+    per_line = time.perf_counter() - start
+    start = time.perf_counter()
+    assert sum_calibration_values_vectorized(data) == expected
+    vectorized = time.perf_counter() - start
+
+    megabytes = len(data) / (1 << 20)
+    print(f"{megabytes:.0f} MB: per line {megabytes / per_line:.1f} MB/s, vectorized {megabytes / vectorized:.1f} MB/s ({per_line / vectorized:.1f}x)")
+
 if __name__ == "__main__":
     # run the test function
     test_calibration_values()
 
     # execute the main function
     main()
+
+    # python -m day_1.part_1_trebuchet --benchmark
+    if "--benchmark" in sys.argv:
+        benchmark()
     
\ No newline at end of file
@@ -1,6 +1,10 @@
 # --- Day 1: Trebuchet?! ---
 # --- Part two ---
 
+import sys
+
+from aoc.automaton import FirstLastMatcher
+
 # mapping of spelled-out numbers to their numeric equivalents
 WORD_TO_DIGIT_MAP = {
     "one": "1",
@@ -14,35 +18,61 @@ WORD_TO_DIGIT_MAP = {
     "nine": "9",
 }
 
-def get_combined_digits(line):
-    # positions stores tuples of (idx, digit) for each spelled-out 
-    # number found in the line, this helps in replacing the spelled-out numbers 
-    # with their corresponding digits, considering their order and overlaps in the string
-    positions = [
-        (idx, digit)
-        for word, digit in WORD_TO_DIGIT_MAP.items()
-        for idx in range(len(line))
-        if line.startswith(word, idx)
-    ]
+# registry of named vocabularies (spelled-out number -> digit); any mix of
+# them is compiled, together with the digits themselves, into one shared
+# forward and reverse Aho-Corasick automaton, so matching a line costs the
+# same whether the vocabulary has 9 words or 500
+VOCABULARIES = {
+    "english": WORD_TO_DIGIT_MAP,
+    "german": dict(zip(["eins", "zwei", "drei", "vier", "fünf", "sechs", "sieben", "acht", "neun"], "123456789")),
+    "french": dict(zip(["un", "deux", "trois", "quatre", "cinq", "six", "sept", "huit", "neuf"], "123456789")),
+    "spanish": dict(zip(["uno", "dos", "tres", "cuatro", "cinco", "seis", "siete", "ocho", "nueve"], "123456789")),
+}
+DIGITS = {digit: digit for digit in "0123456789"}
+
+_compiled = {}
+
+def register_vocabulary(name, words):
+    # words maps each spelling to a digit character, e.g. {"eins": "1"}
+    for word, digit in words.items():
+        if digit not in DIGITS or not word:
+            raise ValueError(f"{name}: {word!r} must map to a single digit, not {digit!r}")
+    VOCABULARIES[name] = dict(words)
+    # matchers built from the old words are stale now
+    _compiled.clear()
+
+def compile_vocabularies(names=("english",)):
+    # one FirstLastMatcher for the union of the named vocabularies, built
+    # once per combination; a word spelled the same in two vocabularies
+    # must mean the same digit
+    key = tuple(sorted(set(names)))
+    if key not in _compiled:
+        words = dict(DIGITS)
+        for name in key:
+            for word, digit in VOCABULARIES[name].items():
+                if words.setdefault(word, digit) != digit:
+                    raise ValueError(f"{word!r} is {words[word]} elsewhere but {digit} in {name}")
+        _compiled[key] = FirstLastMatcher(words)
+    return _compiled[key]
+
+# the first digit is found scanning from the start, the last scanning from
+# the end, and both scans stop early
+DIGIT_MATCHER = compile_vocabularies()
 
-    # add existing numerical digits and their positions
-    positions.extend((idx, ch) for idx, ch in enumerate(line) if ch.isdigit())
+def get_combined_digits(line, matcher=DIGIT_MATCHER):
+    first, last = matcher.first_and_last(line)
 
     # handle no digits case
-    if not positions:
+    if first is None:
         return 0
 
-    # sort by position idx
-    positions.sort(key=lambda x: x[0])
-
-    # extract first and last digit based on combined order
-    first, last = positions[0][1], positions[-1][1]
     return int(first + last)
 
-def sum_calibration_values(lines):
+def sum_calibration_values(lines, vocabularies=("english",)):
+    matcher = compile_vocabularies(vocabularies)
     sum = 0
     for line in lines:
-        tmp = get_combined_digits(line.strip())
+        tmp = get_combined_digits(line.strip(), matcher)
         # print(f"{line.strip()} -> {tmp}")
         sum += tmp
 
@@ -64,13 +94,62 @@ def test_calibration_values():
         assert get_combined_digits(line) == expected, f"Failed on {line}"
 
     assert sum_calibration_values([line for line, _ in test_cases]) == 281, "Sum test failed"
+
+    # other vocabularies share the automaton, overlaps included
+    assert sum_calibration_values(["zweins", "dreixsieben", "nueveinte"], ["german", "spanish"]) == 21 + 37 + 99
+    assert sum_calibration_values(["huitrois", "eightwo"], ["french", "english"]) == 83 + 82
+    assert compile_vocabularies(["german", "english"]) is compile_vocabularies(["english", "german"])
+    register_vocabulary("conflicting", {"one": "2"})
+    try:
+        compile_vocabularies(["english", "conflicting"])
+        assert False, "conflicting vocabularies should fail"
+    except ValueError:
+        pass
+    finally:
+        del VOCABULARIES["conflicting"]
     print("All tests passed")
 
+def benchmark(sizes=(9, 50, 100, 250, 500), input_path="day_1/input.txt", scan_lines=200):
+    # lines/sec as the vocabulary grows: english plus random made-up words,
+    # against the per-index startswith scan this file used to do
+    import random
+    import string
+    import time
+
+    def startswith_scan(line, words):
+        positions = [(idx, digit) for word, digit in words.items() for idx in range(len(line)) if line.startswith(word, idx)]
+        return int(min(positions)[1] + max(positions)[1]) if positions else 0
+
+    with open(input_path) as f:
+        lines = [line.strip() for line in f]
+    rng = random.Random(2023)
+    words = {**WORD_TO_DIGIT_MAP}
+    print(f"{'words':>5} {'automaton (lines/s)':>20} {'startswith (lines/s)':>21}")
+    for size in sizes:
+        while len(words) < size:
+            words["".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 8)))] = rng.choice("123456789")
+        register_vocabulary("benchmark", words)
+        matcher = compile_vocabularies(["benchmark"])
 
-def main():
-    with open("day_1/input.txt") as f:
+        start = time.perf_counter()
+        automaton = [get_combined_digits(line, matcher) for line in lines]
+        automaton_rate = len(lines) / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        scanned = [startswith_scan(line, {**words, **DIGITS}) for line in lines[:scan_lines]]
+        scan_rate = scan_lines / (time.perf_counter() - start)
+        assert scanned == automaton[:scan_lines]
+        print(f"{len(words):>5} {automaton_rate:>20,.0f} {scan_rate:>21,.0f}")
+    del VOCABULARIES["benchmark"]
+    _compiled.clear()
+
+
+def main(input_path="day_1/input.txt"):
+    with open(input_path) as f:
         lines = f.readlines()
-        print(sum_calibration_values(lines))
+        total = sum_calibration_values(lines)
+        print(total)
+        return total
 
 if __name__ == "__main__":
     # run the test function
@@ -78,3 +157,7 @@ if __name__ == "__main__":
 
     # execute the main function
     main()
+
+    # python -m day_1.part_2_trebuchet --benchmark
+    if "--benchmark" in sys.argv:
+        benchmark()
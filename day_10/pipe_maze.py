@@ -1,34 +1,18 @@
 # -- Day 10: Pipe Maze ---
 
-from enum import Enum
+from aoc.directions import DELTAS, DOWN, LEFT, OPPOSITE, RIGHT, UP
+from aoc.grid import Grid
 
 
-class Direction(Enum):
-    """
-    Enum representing cardinal directions with their grid movements.
-    """
-
-    NORTH = (-1, 0)
-    SOUTH = (1, 0)
-    EAST = (0, 1)
-    WEST = (0, -1)
-
-
-REVERSE_DIRECTION_MAP = {
-    Direction.NORTH: Direction.SOUTH,
-    Direction.SOUTH: Direction.NORTH,
-    Direction.EAST: Direction.WEST,
-    Direction.WEST: Direction.EAST,
-}
-
+# directions (see aoc.directions) each pipe connects, keyed by tile byte
 PIPE_MOVEMENT_OPTIONS = {
-    "|": [Direction.NORTH, Direction.SOUTH],
-    "-": [Direction.EAST, Direction.WEST],
-    "L": [Direction.NORTH, Direction.EAST],
-    "J": [Direction.NORTH, Direction.WEST],
-    "7": [Direction.SOUTH, Direction.WEST],
-    "F": [Direction.SOUTH, Direction.EAST],
-    "S": [Direction.NORTH, Direction.SOUTH, Direction.EAST, Direction.WEST],
+    ord("|"): (UP, DOWN),
+    ord("-"): (RIGHT, LEFT),
+    ord("L"): (UP, RIGHT),
+    ord("J"): (UP, LEFT),
+    ord("7"): (DOWN, LEFT),
+    ord("F"): (DOWN, RIGHT),
+    ord("S"): (UP, DOWN, RIGHT, LEFT),
 }
 
 
@@ -38,24 +22,21 @@ class Maze:
         Initialize the Maze with a string representation.
         :param input_string: Multiline string representing the maze.
         """
-        self.maze = [list(line) for line in input_string.splitlines()]
+        self.maze = Grid.from_string(input_string)
 
     def find_animal_start(self):
         """
         Find the starting position of the animal marked by 'S' in the maze.
         :return: Tuple (x, y) as the starting position.
         """
-        for i, row in enumerate(self.maze):
-            for j, cell in enumerate(row):
-                if cell == "S":
-                    return (i, j)
+        return self.maze.find("S")
 
 
 class MazeSolver:
     def __init__(self, maze):
         """
         Initialize the MazeSolver with the maze.
-        :param maze: 2D list representing the maze.
+        :param maze: Grid representing the maze.
         """
         self.maze = maze
 
@@ -68,11 +49,13 @@ class MazeSolver:
         stack = [start]
         visited = {start}
         path_tracker = {start: None}
+        cells, width = self.maze.cells, self.maze.width
 
         while stack:
             x, y = stack.pop()
-            for direction in PIPE_MOVEMENT_OPTIONS[self.maze[x][y]]:
-                nx, ny = x + direction.value[0], y + direction.value[1]
+            for direction in PIPE_MOVEMENT_OPTIONS[cells[x * width + y]]:
+                dx, dy = DELTAS[direction]
+                nx, ny = x + dx, y + dy
                 if self.can_move(x, y, nx, ny, direction):
                     if (nx, ny) not in visited:
                         self.update_stack_and_visited(
@@ -88,16 +71,13 @@ class MazeSolver:
         Check if movement is possible in the maze from (x, y) to (nx, ny).
         :param x, y: Current position coordinates.
         :param nx, ny: Next position coordinates.
-        :param direction: Direction of movement.
+        :param direction: Direction of movement (an aoc.directions code).
         :return: Boolean indicating if movement is possible.
         """
-        return (
-            0 <= nx < len(self.maze)
-            and 0 <= ny < len(self.maze[0])
-            and self.maze[nx][ny] in PIPE_MOVEMENT_OPTIONS
-            and REVERSE_DIRECTION_MAP[direction]
-            in PIPE_MOVEMENT_OPTIONS[self.maze[nx][ny]]
-        )
+        if not self.maze.in_bounds(nx, ny):
+            return False
+        options = PIPE_MOVEMENT_OPTIONS.get(self.maze.cells[nx * self.maze.width + ny])
+        return options is not None and OPPOSITE[direction] in options
 
     def update_stack_and_visited(self, stack, visited, path_tracker, x, y, nx, ny):
         """
@@ -151,9 +131,9 @@ class MazeSolver:
         return area - n // 2 + 1
 
 
-def part_one():
+def part_one(input_path="day_10/input.txt"):
     # Read the maze input from a file
-    with open("day_10/input.txt") as f:
+    with open(input_path) as f:
         maze_input = f.read()
 
     # Initialize the Maze and MazeSolver
@@ -167,11 +147,12 @@ def part_one():
 
     # Print the result
     print(f"❗️ Steps to the farthest point: {farthest_point}")
+    return farthest_point
 
 
-def part_two():
+def part_two(input_path="day_10/input.txt"):
     # Read the maze input from a file
-    with open("day_10/input.txt") as f:
+    with open(input_path) as f:
         maze_input = f.read()
 
     # Initialize the Maze and MazeSolver
@@ -185,6 +166,7 @@ def part_two():
 
     # Print the result
     print(f"❗️ Enclosed tiles: {enclosed_tiles}")
+    return enclosed_tiles
 
 
 def test_simple_maze():
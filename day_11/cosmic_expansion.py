@@ -1,11 +1,16 @@
 # Day 11: Cosmic Expansion
 
+from aoc.grid import Grid
+
+GALAXY = ord("#")
+
+
 class CosmicGrid:
     def __init__(self, space_grid):
         # Initialize the cosmic grid with the provided space grid
-        self.space_grid = space_grid
-        self.grid_height = len(space_grid)
-        self.grid_width = len(space_grid[0])
+        self.space_grid = Grid.from_lines(space_grid)
+        self.grid_height = self.space_grid.height
+        self.grid_width = self.space_grid.width
         # Find rows and columns that are entirely empty
         self.empty_rows = self._find_empty_rows()
         self.empty_columns = self._find_empty_columns()
@@ -16,7 +21,7 @@ class CosmicGrid:
         # Identify rows that contain only empty space
         empty_rows = set()
         for row in range(self.grid_height):
-            if all(cell == '.' for cell in self.space_grid[row]):
+            if GALAXY not in self.space_grid.row(row):
                 empty_rows.add(row)
         return empty_rows
 
@@ -24,18 +29,13 @@ class CosmicGrid:
         # Identify columns that contain only empty space
         empty_columns = set()
         for col in range(self.grid_width):
-            if all(self.space_grid[row][col] == '.' for row in range(self.grid_height)):
+            if GALAXY not in self.space_grid.column(col):
                 empty_columns.add(col)
         return empty_columns
 
     def _find_galaxy_positions(self):
         # Record the positions of all galaxies in the grid
-        galaxy_positions = []
-        for row in range(self.grid_height):
-            for col in range(self.grid_width):
-                if self.space_grid[row][col] == '#':
-                    galaxy_positions.append((row, col))
-        return galaxy_positions
+        return self.space_grid.positions("#")
 
     def find_shortest_distance(self, galaxy1, galaxy2, expansion_factor):
         # Calculate the shortest distance between two galaxies, factoring in cosmic expansion
@@ -67,8 +67,8 @@ class CosmicGrid:
 
 
 
-def part_one():
-    with open("day_11/input.txt") as f:
+def part_one(input_path="day_11/input.txt"):
+    with open(input_path) as f:
         space_map = f.read().splitlines()
 
     cosmic_grid = CosmicGrid(space_map)
@@ -76,10 +76,11 @@ def part_one():
     print(
         f"❗️ Sum of the lengths of the shortest path between every pair of galaxies for expansion_factor=2: {sum}"
     )
+    return sum
 
 
-def part_two():
-    with open("day_11/input.txt") as f:
+def part_two(input_path="day_11/input.txt"):
+    with open(input_path) as f:
         space_map = f.read().splitlines()
 
     cosmic_grid = CosmicGrid(space_map)
@@ -87,6 +88,7 @@ def part_two():
     print(
         f"‼️ Sum of the lengths of the shortest path between every pair of galaxies for expansion_factor=1000000: {sum}"
     )
+    return sum
 
 
 def test_analyze_space():
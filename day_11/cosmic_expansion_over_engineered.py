@@ -135,13 +135,14 @@ def analyze_space(space_map):
     return sum
 
 
-def part_one():
-    with open("day_11/input.txt") as f:
+def part_one(input_path="day_11/input.txt"):
+    with open(input_path) as f:
         space_map = f.read().splitlines()
     sum = analyze_space(space_map)
     print(
         f"❗️ Sum of the lengths of the shortest path between every pair of galaxies: {sum}"
     )
+    return sum
 
 
 def test_analyze_space():
@@ -64,11 +64,12 @@ def sum_spring_record_combinations(spring_condition_records):
     return total_combinations
 
 
-def part_one():
-    with open("day_12/input.txt") as f:
+def part_one(input_path="day_12/input.txt"):
+    with open(input_path) as f:
         spring_condition_records = f.read()
     sum = sum_spring_record_combinations(spring_condition_records)
     print(f"❗️ Total valid combinations: {sum}")
+    return sum
 
 
 def sum_spring_record_combinations_unfold(spring_condition_records):
@@ -85,11 +86,12 @@ def sum_spring_record_combinations_unfold(spring_condition_records):
     return total_combinations
 
 
-def part_two():
-    with open("day_12/input.txt") as f:
+def part_two(input_path="day_12/input.txt"):
+    with open(input_path) as f:
         spring_condition_records = f.read()
     sum = sum_spring_record_combinations_unfold(spring_condition_records)
     print(f"❗️ Total valid combinations: {sum}")
+    return sum
 
 
 def test_sum_spring_record_combinations():
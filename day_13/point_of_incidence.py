@@ -3,6 +3,9 @@
 from enum import Enum
 import itertools
 
+from aoc.grid import Grid
+from aoc.inputs import MappedInput, iter_blocks
+
 
 class Mode(Enum):
     ROW = "row"
@@ -11,7 +14,9 @@ class Mode(Enum):
 
 class MirrorPatternAnalyzer:
     def __init__(self, pattern):
-        self.pattern = [list(row) for row in pattern.strip().split("\n")]
+        if isinstance(pattern, str):
+            pattern = pattern.strip().encode()
+        self.pattern = Grid.from_bytes(pattern)
 
     @staticmethod
     def flip_char(char):
@@ -20,8 +25,8 @@ class MirrorPatternAnalyzer:
     def is_perfect_reflection(self, index, mode):
         if mode == Mode.ROW:
             prev, next = index - 1, index
-            while prev >= 0 and next < len(self.pattern):
-                if self.pattern[prev] != self.pattern[next]:
+            while prev >= 0 and next < self.pattern.height:
+                if self.pattern.row(prev) != self.pattern.row(next):
                     return False
                 prev -= 1
                 next += 1
@@ -29,11 +34,8 @@ class MirrorPatternAnalyzer:
 
         elif mode == Mode.COLUMN:
             prev, next = index - 1, index
-            while prev >= 0 and next < len(self.pattern[0]):
-                if any(
-                    self.pattern[row][prev] != self.pattern[row][next]
-                    for row in range(len(self.pattern))
-                ):
+            while prev >= 0 and next < self.pattern.width:
+                if self.pattern.column(prev) != self.pattern.column(next):
                     return False
                 prev -= 1
                 next += 1
@@ -43,7 +45,7 @@ class MirrorPatternAnalyzer:
 
     def find_point_of_reflection(self, mode):
         range_to_check = range(
-            1, len(self.pattern) if mode == Mode.ROW else len(self.pattern[0])
+            1, self.pattern.height if mode == Mode.ROW else self.pattern.width
         )
         for i in range_to_check:
             if self.is_perfect_reflection(i, mode):
@@ -53,9 +55,9 @@ class MirrorPatternAnalyzer:
     def try_fix_smudge_and_find_reflection(
         self, original_reflection_point, original_mode
     ):
-        for i in range(len(self.pattern)):
-            for j in range(len(self.pattern[i])):
-                self.pattern[i][j] = MirrorPatternAnalyzer.flip_char(self.pattern[i][j])
+        for i in range(self.pattern.height):
+            for j in range(self.pattern.width):
+                self.pattern[i, j] = MirrorPatternAnalyzer.flip_char(self.pattern[i, j])
                 for mode in [Mode.ROW, Mode.COLUMN]:
                     new_reflection_point = self.find_point_of_reflection(mode)
                     if new_reflection_point and (new_reflection_point, mode) != (
@@ -63,7 +65,7 @@ class MirrorPatternAnalyzer:
                         original_mode,
                     ):
                         return new_reflection_point, mode
-                self.pattern[i][j] = MirrorPatternAnalyzer.flip_char(self.pattern[i][j])
+                self.pattern[i, j] = MirrorPatternAnalyzer.flip_char(self.pattern[i, j])
         return original_reflection_point, original_mode
 
     def analyze(self, with_smudge=False):
@@ -87,19 +89,21 @@ class MirrorPatternAnalyzer:
 
 
 def summarize_patterns(patterns, with_smudges=False):
+    if isinstance(patterns, str):
+        patterns = patterns.encode()
     total_sum = 0
-    for i, pattern in enumerate(patterns.split("\n\n")):
+    for pattern in iter_blocks(patterns):
         analyzer = MirrorPatternAnalyzer(pattern)
         total_sum += analyzer.analyze(with_smudge=with_smudges)
     return total_sum
 
 
-def part_one():
-    with open("day_13/input.txt", "r") as f:
-        patterns = f.read()
-    sum = summarize_patterns(patterns)
+def part_one(input_path="day_13/input.txt"):
+    with MappedInput(input_path) as patterns:
+        sum = summarize_patterns(patterns.data)
 
     print(f"❗️ Summarizing all patterns in Part 1: {sum}")
+    return sum
 
 
 def test_summarize_patterns():
@@ -123,11 +127,11 @@ def test_summarize_patterns():
     print("✅ summarize_pattern passed")
 
 
-def part_two():
-    with open("day_13/input.txt", "r") as f:
-        patterns = f.read()
-    sum = summarize_patterns(patterns, with_smudges=True)
+def part_two(input_path="day_13/input.txt"):
+    with MappedInput(input_path) as patterns:
+        sum = summarize_patterns(patterns.data, with_smudges=True)
     print(f"‼️ Summarizing all patterns in Part 2: {sum}")
+    return sum
 
 
 def test_summarize_patterns_with_smudges():
@@ -2,6 +2,8 @@
 
 from enum import Enum
 
+from aoc.grid import Grid
+
 
 class TiltDirection(Enum):
     North = "NORTH"
@@ -16,35 +18,31 @@ class Tile(Enum):
     RoundRock = "O"
 
 
+def roll_rocks(line):
+    """Rolls every round rock in a line of tiles towards its start, stopping at cube rocks."""
+    segments = []
+    for segment in line.split(b"#"):
+        rocks = segment.count(b"O")
+        segments.append(b"O" * rocks + b"." * (len(segment) - rocks))
+    return b"#".join(segments)
+
+
 def tilt_platform(platform_state, direction):
-    rows, cols = len(platform_state), len(platform_state[0])
-    delta = {
-        TiltDirection.North: (0, -1),
-        TiltDirection.South: (0, 1),
-        TiltDirection.East: (1, 0),
-        TiltDirection.West: (-1, 0)
-    }[direction]
-
-    def is_valid_position(row, col):
-        return 0 <= row < rows and 0 <= col < cols
-
-    def move_rock(start_row, start_col):
-        row, col = start_row, start_col
-        while is_valid_position(row + delta[1], col + delta[0]) and \
-                platform_state[row + delta[1]][col + delta[0]] == Tile.Empty.value:
-            platform_state[row][col] = Tile.Empty.value
-            row, col = row + delta[1], col + delta[0]
-            platform_state[row][col] = Tile.RoundRock.value
-
-    if direction in [TiltDirection.North, TiltDirection.West]:
-        range_func = range
-    else:
-        range_func = lambda start, end: range(end - 1, start - 1, -1)
-
-    for i in range_func(0, rows):
-        for j in range_func(0, cols):
-            if platform_state[i][j] == Tile.RoundRock.value:
-                move_rock(i, j)
+    cells, rows, cols = platform_state.cells, platform_state.height, platform_state.width
+
+    # tilting is done one row or column at a time, in the direction of travel
+    if direction == TiltDirection.North:
+        for col in range(cols):
+            cells[col::cols] = roll_rocks(cells[col::cols])
+    elif direction == TiltDirection.South:
+        for col in range(cols):
+            cells[col::cols] = roll_rocks(cells[col::cols][::-1])[::-1]
+    elif direction == TiltDirection.West:
+        for row in range(0, rows * cols, cols):
+            cells[row:row + cols] = roll_rocks(cells[row:row + cols])
+    elif direction == TiltDirection.East:
+        for row in range(0, rows * cols, cols):
+            cells[row:row + cols] = roll_rocks(cells[row:row + cols][::-1])[::-1]
 
     return platform_state
 
@@ -61,7 +59,7 @@ def tilt_platform_cycle(platform_state, num_cycles=1):
             platform_state = tilt_platform(platform_state, direction)
 
         # Generate a key for the current state
-        platform_state_key = "\n".join([" ".join(map(str, row)) for row in platform_state])
+        platform_state_key = bytes(platform_state.cells)
        
         # Check if the current state has been seen before
         if platform_state_key in platform_cache:
@@ -74,7 +72,7 @@ def tilt_platform_cycle(platform_state, num_cycles=1):
             if platform_state_key == cycle_patterns[0]:
                 cycle_length = len(cycle_patterns)
                 cycle_index = (num_cycles - cycle_start_point) % cycle_length
-                return [list(row) for row in cycle_patterns[cycle_index].split("\n")]
+                return Grid(platform_state.width, platform_state.height, cycle_patterns[cycle_index])
 
             # New state in the cycle
             if platform_state_key not in cycle_patterns:
@@ -90,32 +88,32 @@ def tilt_platform_cycle(platform_state, num_cycles=1):
 
 
 def calculate_load_on_north_beam(tilted_platform_state):
-    return sum((len(tilted_platform_state) - i) * row.count(Tile.RoundRock.value)
-               for i, row in enumerate(tilted_platform_state))
+    return sum((tilted_platform_state.height - i) * row.tobytes().count(Tile.RoundRock.value.encode())
+               for i, row in enumerate(tilted_platform_state.rows()))
 
 
-def part_one():
-    with open("day_14/input.txt") as f:
+def part_one(input_path="day_14/input.txt"):
+    with open(input_path) as f:
         platform_state = f.read()
 
-    # split the platform state into rows
-    platform_state = [list(row) for row in platform_state.split("\n")]
+    platform_state = Grid.from_string(platform_state)
 
     tilted_platform_state = tilt_platform(platform_state, TiltDirection.North)
     total_load = calculate_load_on_north_beam(tilted_platform_state)
     print(f"❗️ Total load on the north beam is {total_load}")
+    return total_load
 
 
-def part_two():
-    with open("day_14/input.txt") as f:
+def part_two(input_path="day_14/input.txt"):
+    with open(input_path) as f:
         platform_state = f.read()
 
-    # split the platform state into rows
-    platform_state = [list(row) for row in platform_state.split("\n")]
+    platform_state = Grid.from_string(platform_state)
 
     tilted_platform_state = tilt_platform_cycle(platform_state, 1000000000)
     total_load = calculate_load_on_north_beam(tilted_platform_state)
     print(f"‼️ Total load on the north beam after 1000000000 cycles is {total_load}")
+    return total_load
 
 
 def test_tilt_platform_cycle():
@@ -164,10 +162,8 @@ O.#..O.#.#
 #.OOO#...O"""
 
     # split the platform state into rows
-    platform_state = [list(row) for row in platform_state_og.split("\n")]
-    expected_platform_state_with_1_cycle = [
-        list(row) for row in expected_platform_state_with_1_cycle.split("\n")
-    ]
+    platform_state = Grid.from_string(platform_state_og)
+    expected_platform_state_with_1_cycle = Grid.from_string(expected_platform_state_with_1_cycle)
     tilted_platform_state = tilt_platform_cycle(platform_state, 1)
     assert (
         tilted_platform_state == expected_platform_state_with_1_cycle
@@ -175,10 +171,8 @@ O.#..O.#.#
     print("✅ tilt_platform_cycle with 1 cycle passed")
 
     # reseting platform_state
-    platform_state = [list(row) for row in platform_state_og.split("\n")]
-    expected_platform_state_with_2_cycles = [
-        list(row) for row in expected_platform_state_with_2_cycles.split("\n")
-    ]
+    platform_state = Grid.from_string(platform_state_og)
+    expected_platform_state_with_2_cycles = Grid.from_string(expected_platform_state_with_2_cycles)
     tilted_platform_state = tilt_platform_cycle(platform_state, 2)
     assert (
         tilted_platform_state == expected_platform_state_with_2_cycles
@@ -186,10 +180,8 @@ O.#..O.#.#
     print("✅ tilt_platform_cycle with 2 cycles passed")
 
     # reseting platform_state
-    platform_state = [list(row) for row in platform_state_og.split("\n")]
-    expected_platform_state_with_3_cycles = [
-        list(row) for row in expected_platform_state_with_3_cycles.split("\n")
-    ]
+    platform_state = Grid.from_string(platform_state_og)
+    expected_platform_state_with_3_cycles = Grid.from_string(expected_platform_state_with_3_cycles)
     tilted_platform_state = tilt_platform_cycle(platform_state, 3)
     assert (
         tilted_platform_state == expected_platform_state_with_3_cycles
@@ -219,12 +211,11 @@ O..#.OO...
 ..O.......
 #....###..
 #....#...."""
-    # split the platform state into rows
-    platform_state = [list(row) for row in platform_state.split("\n")]
+    platform_state = Grid.from_string(platform_state)
     tilted_platform_state = tilt_platform(platform_state, TiltDirection.North)
-    assert tilted_platform_state == [
-        list(row) for row in expected_platform_state.split("\n")
-    ], f"Expected {expected_platform_state}, got {tilted_platform_state}"
+    assert tilted_platform_state == Grid.from_string(
+        expected_platform_state
+    ), f"Expected {expected_platform_state}, got {tilted_platform_state}"
     print("✅ tilt_platform passed")
 
 
@@ -239,8 +230,7 @@ O.#..O.#.#
 .......O..
 #....###..
 #OO..#...."""
-    # split the platform state into rows
-    platform_state = [list(row) for row in platform_state.split("\n")]
+    platform_state = Grid.from_string(platform_state)
     tilted_platform_state = tilt_platform(platform_state, TiltDirection.North)
     total_load = calculate_load_on_north_beam(tilted_platform_state)
     assert total_load == 136, f"Expected 136, got {total_load}"
@@ -258,8 +248,7 @@ O.#..O.#.#
 .......O..
 #....###..
 #OO..#...."""
-    # split the platform state into rows
-    platform_state = [list(row) for row in platform_state.split("\n")]
+    platform_state = Grid.from_string(platform_state)
     tilted_platform_state = tilt_platform_cycle(platform_state, 1000000000)
     total_load = calculate_load_on_north_beam(tilted_platform_state)
     assert total_load == 64, f"Expected 64, got {total_load}"
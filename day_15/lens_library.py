@@ -2,6 +2,8 @@
 
 from enum import Enum
 
+from aoc.inputs import MappedInput, iter_records
+
 
 class Operation(Enum):
     DASH = "-"
@@ -93,37 +95,38 @@ class LavaProductionFacility:
     # H.A.S.H. = Holiday ASCII String Helper
     def holiday_ascii_string_helper(step):
         current_value = 0
-        for ch in step:
-            current_value = (current_value + ord(ch)) * 17 % 256
+        # steps come as str or straight out of the input as byte views
+        for code in step.encode() if isinstance(step, str) else step:
+            current_value = (current_value + code) * 17 % 256
         return current_value
 
     def get_sequence_hash(self, sequence):
+        if isinstance(sequence, str):
+            sequence = sequence.encode()
         return sum(
-            self.holiday_ascii_string_helper(step) for step in sequence.split(",")
+            self.holiday_ascii_string_helper(step) for step in iter_records(sequence)
         )
 
 
-def part_one():
-    with open("day_15/input.txt") as f:
-        sequence = f.read().strip()
-
+def part_one(input_path="day_15/input.txt"):
     facility = LavaProductionFacility()
-    sum_hash = facility.get_sequence_hash(sequence)
+    with MappedInput(input_path) as sequence:
+        sum_hash = facility.get_sequence_hash(sequence.data)
     print(f"❗️ Part One: {sum_hash}")
+    return sum_hash
 
 
-def part_two():
-    with open("day_15/input.txt") as f:
-        sequence = f.read().strip()
-
+def part_two(input_path="day_15/input.txt"):
     facility = LavaProductionFacility()
-    facility.holiday_ascii_string_helper_manual_arrangement_procedure(
-        sequence.split(",")
-    )
+    with MappedInput(input_path) as sequence:
+        facility.holiday_ascii_string_helper_manual_arrangement_procedure(
+            bytes(step).decode() for step in sequence.records()
+        )
     sum_focusing_power = facility.sum_focusing_power()
     print(
         f"❗️❗️ Focusing power of the resulting lens configuration: {sum_focusing_power}"
     )
+    return sum_focusing_power
 
 
 def test_hashmap():
@@ -1,7 +1,9 @@
 # Day 16 - The Floor will be Lava
 
 from enum import Enum
-from collections import deque
+
+from aoc import directions
+from aoc.grid import Grid
 
 
 class Direction(Enum):
@@ -19,207 +21,66 @@ class Tile(Enum):
     LEFT_TILTED_MIRROR = "L"
 
 
-class LightBeamNode:
-    def __init__(self, idx, last_dir, next_dir):
-        self.idx = idx
-        self.last_dir = last_dir
-        self.next_dir = next_dir
+# outgoing beam directions per (tile byte, direction of travel); this input
+# writes the `/` mirror as R and the `\` mirror as L. Every beam node the
+# simulation processes looks itself up here once, so the profiler counts
+# beam nodes by counting lookups into this table.
+BEAM_TURNS = directions.beam_table(
+    slash=Tile.RIGHT_TILTED_MIRROR.value.encode(),
+    backslash=Tile.LEFT_TILTED_MIRROR.value.encode(),
+    vertical_splitter=Tile.VERTICAL_SPLITTER.value.encode(),
+    horizontal_splitter=Tile.HORIZONTAL_SPLITTER.value.encode(),
+)
 
+# the Direction enum is only the public API of simulate_light_beam; it is
+# converted to a direction code once per call, at that boundary
+DIRECTION_CODES = {
+    Direction.UP: directions.UP,
+    Direction.RIGHT: directions.RIGHT,
+    Direction.DOWN: directions.DOWN,
+    Direction.LEFT: directions.LEFT,
+}
 
-def get_next_tile_idx(tile_idx, direction):
-    dx, dy = direction.value
-    return (tile_idx[0] + dx, tile_idx[1] + dy)
+# energized cells become '#', everything else '.'
+ENERGIZED_TILES = bytes([ord(Tile.EMPTY.value)] + [ord("#")] * 255)
 
 
-def simulate_light_beam(
-    grid, start_pos=(0, 0), last_dir=Direction.LEFT, next_dir=Direction.RIGHT
-):
-    energized_tiles = set()
-    queue = deque()
+def simulate_light_beam(grid, start_pos=(0, 0), next_dir=Direction.RIGHT):
+    cells, width, height = grid.cells, grid.width, grid.height
+    drow, dcol, turns = directions.DROW, directions.DCOL, BEAM_TURNS
 
-    # Initialize the light beam's starting position and direction.
-    node = LightBeamNode(start_pos, last_dir, next_dir)
-    queue.append(node)
+    # one bit per direction of travel for every tile the beam has crossed
+    energized = bytearray(width * height)
 
-    while queue:
-        # Process the next node in the queue.
-        node = queue.popleft()
+    # a beam is (row, col, direction of travel)
+    row, col = start_pos
+    stack = [(row, col, DIRECTION_CODES[next_dir])]
 
-        # Skip processing if the node is out of the grid's bounds.
-        if (
-            node.idx[0] < 0
-            or node.idx[0] >= len(grid[0])
-            or node.idx[1] < 0
-            or node.idx[1] >= len(grid)
-        ):
-            continue
+    while stack:
+        row, col, direction = stack.pop()
 
-        # Skip processing if the tile in this direction has already been energized.
-        if (node.idx, node.last_dir) in energized_tiles:
+        # Skip processing if the beam left the grid.
+        if row < 0 or row >= height or col < 0 or col >= width:
             continue
-        else:
-            energized_tiles.add((node.idx, node.last_dir))
-
-        # Get the tile at the current node's position.
-        tile = grid[node.idx[0]][node.idx[1]]
-
-        # If the tile is empty, propagate the light beam in the same direction.
-        if tile == Tile.EMPTY.value:
-            queue.append(
-                LightBeamNode(
-                    get_next_tile_idx(node.idx, node.next_dir),
-                    node.last_dir,
-                    node.next_dir,
-                )
-            )
-
-        # Handle interaction with vertical splitters.
-        elif tile == Tile.VERTICAL_SPLITTER.value:
-            # Continue in the same direction if moving vertically.
-            if node.last_dir in [Direction.UP, Direction.DOWN]:
-                queue.append(
-                    LightBeamNode(
-                        get_next_tile_idx(node.idx, node.next_dir),
-                        node.last_dir,
-                        node.next_dir,
-                    )
-                )
-
-            # Split the beam in up and down directions if moving horizontally.
-            else:
-                queue.append(
-                    LightBeamNode(
-                        get_next_tile_idx(node.idx, Direction.UP),
-                        Direction.DOWN,
-                        Direction.UP,
-                    )
-                )
-                queue.append(
-                    LightBeamNode(
-                        get_next_tile_idx(node.idx, Direction.DOWN),
-                        Direction.UP,
-                        Direction.DOWN,
-                    )
-                )
-
-        # Handle interaction with horizontal splitters.
-        elif tile == Tile.HORIZONTAL_SPLITTER.value:
-            # Continue in the same direction if moving horizontally.
-            if node.last_dir in [Direction.LEFT, Direction.RIGHT]:
-                queue.append(
-                    LightBeamNode(
-                        get_next_tile_idx(node.idx, node.next_dir),
-                        node.last_dir,
-                        node.next_dir,
-                    )
-                )
-
-            # Split the beam in left and right directions if moving vertically.
-            else:
-                queue.append(
-                    LightBeamNode(
-                        get_next_tile_idx(node.idx, Direction.LEFT),
-                        Direction.RIGHT,
-                        Direction.LEFT,
-                    )
-                )
-                queue.append(
-                    LightBeamNode(
-                        get_next_tile_idx(node.idx, Direction.RIGHT),
-                        Direction.LEFT,
-                        Direction.RIGHT,
-                    )
-                )
-
-        # Handle interaction with right-tilted mirrors.
-        elif tile == Tile.RIGHT_TILTED_MIRROR.value:
-            # Change direction based on the mirror's orientation and the beam's current direction.
-            if node.last_dir == Direction.UP:
-                queue.append(
-                    LightBeamNode(
-                        get_next_tile_idx(node.idx, Direction.LEFT),
-                        Direction.RIGHT,
-                        Direction.LEFT,
-                    )
-                )
-            elif node.last_dir == Direction.RIGHT:
-                queue.append(
-                    LightBeamNode(
-                        get_next_tile_idx(node.idx, Direction.DOWN),
-                        Direction.UP,
-                        Direction.DOWN,
-                    )
-                )
-            elif node.last_dir == Direction.DOWN:
-                queue.append(
-                    LightBeamNode(
-                        get_next_tile_idx(node.idx, Direction.RIGHT),
-                        Direction.LEFT,
-                        Direction.RIGHT,
-                    )
-                )
-            elif node.last_dir == Direction.LEFT:
-                queue.append(
-                    LightBeamNode(
-                        get_next_tile_idx(node.idx, Direction.UP),
-                        Direction.DOWN,
-                        Direction.UP,
-                    )
-                )
-
-        # Handle interaction with left-tilted mirrors.
-        elif tile == Tile.LEFT_TILTED_MIRROR.value:
-            # Change direction based on the mirror's orientation and the beam's current direction.
-            if node.last_dir == Direction.UP:
-                queue.append(
-                    LightBeamNode(
-                        get_next_tile_idx(node.idx, Direction.RIGHT),
-                        Direction.LEFT,
-                        Direction.RIGHT,
-                    )
-                )
-            elif node.last_dir == Direction.RIGHT:
-                queue.append(
-                    LightBeamNode(
-                        get_next_tile_idx(node.idx, Direction.UP),
-                        Direction.DOWN,
-                        Direction.UP,
-                    )
-                )
-            elif node.last_dir == Direction.DOWN:
-                queue.append(
-                    LightBeamNode(
-                        get_next_tile_idx(node.idx, Direction.LEFT),
-                        Direction.RIGHT,
-                        Direction.LEFT,
-                    )
-                )
-            elif node.last_dir == Direction.LEFT:
-                queue.append(
-                    LightBeamNode(
-                        get_next_tile_idx(node.idx, Direction.DOWN),
-                        Direction.UP,
-                        Direction.DOWN,
-                    )
-                )
 
-    # Create a new grid representation showing the energized tiles.
-    new_grid = [
-        [Tile.EMPTY.value for _ in range(len(grid[0]))] for _ in range(len(grid))
-    ]
+        # Skip processing if a beam already crossed this tile in this direction.
+        idx = row * width + col
+        seen = energized[idx]
+        if seen >> direction & 1:
+            continue
+        energized[idx] = seen | 1 << direction
 
-    # Mark energized tiles in the new grid.
-    for tile, _ in energized_tiles:
-        new_grid[tile[0]][tile[1]] = "#"
+        # Mirrors turn the beam, splitters hit side-on split it, anything else lets it through.
+        for new_direction in turns[cells[idx] << 2 | direction]:
+            stack.append((row + drow[new_direction], col + dcol[new_direction], new_direction))
 
-    return new_grid
+    # Create a new grid representation showing the energized tiles.
+    return Grid(width, height, energized.translate(ENERGIZED_TILES))
 
 
-def process_tile(grid, tile, last_dir, next_dir, record):
-    updated_grid = simulate_light_beam(
-        grid, start_pos=tile, last_dir=last_dir, next_dir=next_dir
-    )
-    record.append(sum(tile == "#" for row in updated_grid for tile in row))
+def process_tile(grid, tile, next_dir, record):
+    updated_grid = simulate_light_beam(grid, start_pos=tile, next_dir=next_dir)
+    record.append(updated_grid.count("#"))
 
 
 def get_max_energized_tiles(grid):
@@ -227,72 +88,52 @@ def get_max_energized_tiles(grid):
 
     grid_corners = [
         (0, 0),
-        (0, len(grid[0]) - 1),
-        (len(grid) - 1, 0),
-        (len(grid) - 1, len(grid[0]) - 1),
+        (0, grid.width - 1),
+        (grid.height - 1, 0),
+        (grid.height - 1, grid.width - 1),
     ]
 
-    directions = [Direction.LEFT, Direction.UP, Direction.RIGHT, Direction.DOWN]
+    # directions each corner beam starts in
+    corner_directions = [Direction.UP, Direction.DOWN]
 
     # Process corners
     for corner in grid_corners:
-        for i in range(2):
-            process_tile(
-                grid,
-                corner,
-                directions[i * 2],
-                directions[i * 2 + 1],
-                energized_tiles_record,
-            )
+        for next_dir in corner_directions:
+            process_tile(grid, corner, next_dir, energized_tiles_record)
 
     # Process edges without corners
-    for i in range(1, len(grid[0]) - 1):  # Top and bottom rows
-        process_tile(grid, (0, i), Direction.UP, Direction.DOWN, energized_tiles_record)
-        process_tile(
-            grid,
-            (len(grid) - 1, i),
-            Direction.DOWN,
-            Direction.UP,
-            energized_tiles_record,
-        )
-
-    for i in range(1, len(grid) - 1):  # Left and right columns
-        process_tile(
-            grid, (i, 0), Direction.LEFT, Direction.RIGHT, energized_tiles_record
-        )
-        process_tile(
-            grid,
-            (i, len(grid[0]) - 1),
-            Direction.RIGHT,
-            Direction.LEFT,
-            energized_tiles_record,
-        )
+    for i in range(1, grid.width - 1):  # Top and bottom rows
+        process_tile(grid, (0, i), Direction.DOWN, energized_tiles_record)
+        process_tile(grid, (grid.height - 1, i), Direction.UP, energized_tiles_record)
+
+    for i in range(1, grid.height - 1):  # Left and right columns
+        process_tile(grid, (i, 0), Direction.RIGHT, energized_tiles_record)
+        process_tile(grid, (i, grid.width - 1), Direction.LEFT, energized_tiles_record)
 
     return max(energized_tiles_record)
 
 
 def parse_input(input_str):
-    grid = []
-    for line in input_str.splitlines():
-        grid.append(list(line))
-    return grid
+    return Grid.from_string(input_str)
 
 
-def part_one():
-    with open("day_16/input.txt", "r") as f:
+def part_one(input_path="day_16/input.txt"):
+    with open(input_path, "r") as f:
         input_str = f.read()
     grid = parse_input(input_str)
     updated_grid = simulate_light_beam(grid)
-    num_of_energized_tiles = sum(tile == "#" for row in updated_grid for tile in row)
+    num_of_energized_tiles = updated_grid.count("#")
     print(f"❗️ Number of energized tiles: {num_of_energized_tiles}")
+    return num_of_energized_tiles
 
 
-def part_two():
-    with open("day_16/input.txt", "r") as f:
+def part_two(input_path="day_16/input.txt"):
+    with open(input_path, "r") as f:
         input_str = f.read()
     grid = parse_input(input_str)
     maximum_energized_tiles = get_max_energized_tiles(grid)
     print(f"❗️❗️ Number of energized tiles: {maximum_energized_tiles}")
+    return maximum_energized_tiles
 
 
 def test_get_max_energized_tiles():
@@ -326,7 +167,7 @@ def test_get_energized_tiles():
 
     grid = parse_input(input_str)
     updated_grid = simulate_light_beam(grid)
-    num_of_energized_tiles = sum(tile == "#" for row in updated_grid for tile in row)
+    num_of_energized_tiles = updated_grid.count("#")
     assert num_of_energized_tiles == 46, f"Expected 46, got {num_of_energized_tiles}"
     print("✅ test_get_energized_tiles passed")
 
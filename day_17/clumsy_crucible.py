@@ -1,94 +1,84 @@
 # Day 17: Clumsy Crucible
 
 import sys
-from enum import Enum
-from queue import PriorityQueue
-from collections import defaultdict
+from heapq import heappop, heappush
 
-
-# Define the Direction Enum for clarity and ease of use
-class Direction(Enum):
-    UP = (-1, 0)
-    DOWN = (1, 0)
-    LEFT = (0, -1)
-    RIGHT = (0, 1)
-
-
-# Define allowed turns for the crucible from each direction
-ALLOWED_CRUCIBLE_TURNS = {
-    Direction.RIGHT: [Direction.UP, Direction.DOWN],
-    Direction.LEFT: [Direction.UP, Direction.DOWN],
-    Direction.UP: [Direction.LEFT, Direction.RIGHT],
-    Direction.DOWN: [Direction.LEFT, Direction.RIGHT],
-}
+from aoc import directions
+from aoc.grid import Grid
 
 
 # Function to find the minimum heat loss for moving the crucible
 def find_min_heat_loss(grid, blocks_before_turn, max_in_direction):
-    # Initialize distance dictionary with max values for each direction
-    memo = defaultdict(lambda: defaultdict(lambda: sys.maxsize))
-
-    for direction in Direction:
-        memo[(0, 0)][direction] = 0
+    # heat loss digits are read straight out of the grid's byte buffer
+    cells, width, height = grid.cells, grid.width, grid.height
+    zero = ord("0")
+    deltas, turns = directions.DELTAS, directions.PERPENDICULAR
 
-    # Initialize the priority queue for Dijkstra's algorithm
-    pq = PriorityQueue()
+    # best known heat loss per (cell, direction to leave it in), flattened
+    memo = [sys.maxsize] * (width * height * 4)
+    for direction in directions.DIRECTIONS:
+        memo[direction] = 0
 
-    # seed pq with all possible directions from the starting position
-    pq.put((0, (0, 0), Direction.RIGHT.name))
-    pq.put((0, (0, 0), Direction.DOWN.name))
+    # Dijkstra over (heat loss, row, col, direction) entries;
+    # seed it with all possible directions from the starting position
+    pq = []
+    heappush(pq, (0, 0, 0, directions.RIGHT))
+    heappush(pq, (0, 0, 0, directions.DOWN))
 
-    while not pq.empty():
-        heat_loss, position, dir_name = pq.get()
-        direction = Direction[dir_name]  # Convert back to Direction enum
+    while pq:
+        heat_loss, row, col, direction = heappop(pq)
 
         # Skip if the current path's heat loss is not better than already known
-        if heat_loss > memo[position][direction]:
+        if heat_loss > memo[(row * width + col) * 4 + direction]:
             continue
 
-        x, y = position
+        drow, dcol = deltas[direction]
         for block in range(max_in_direction):
             # Move in the current direction
-            dx, dy = direction.value
-            x, y = x + dx, y + dy
+            row, col = row + drow, col + dcol
 
             # Check if the new position is out of bounds
-            if x < 0 or x >= len(grid[0]) or y < 0 or y >= len(grid):
+            if row < 0 or row >= height or col < 0 or col >= width:
                 break
 
             # Accumulate heat loss
-            heat_loss += grid[y][x]
+            cell = row * width + col
+            heat_loss += cells[cell] - zero
 
             # Check if the crucible has moved the required blocks before turning
             if block < blocks_before_turn:
                 continue
 
             # Explore new directions from the current position
-            for new_dir in ALLOWED_CRUCIBLE_TURNS[direction]:
-                if heat_loss < memo[(x, y)][new_dir]:
-                    memo[(x, y)][new_dir] = heat_loss
-                    pq.put((heat_loss, (x, y), new_dir.name))
+            for new_dir in turns[direction]:
+                state = cell * 4 + new_dir
+                if heat_loss < memo[state]:
+                    memo[state] = heat_loss
+                    heappush(pq, (heat_loss, row, col, new_dir))
 
     # Return the minimum heat loss to reach the bottom-right corner
-    return min(memo[(len(grid[0]) - 1, len(grid) - 1)].values())
+    end = (width * height - 1) * 4
+    return min(memo[end : end + 4])
 
 
 def parse_grid(input_str):
-    return [[int(x) for x in line] for line in input_str.split("\n")]
+    return Grid.from_string(input_str)
 
 
-def part_one():
-    with open("day_17/input.txt", "r") as f:
+def part_one(input_path="day_17/input.txt"):
+    with open(input_path, "r") as f:
         grid = parse_grid(f.read())
     min_heat_loss = find_min_heat_loss(grid, 0, 3)
     print(f"❗️ Minimum heat loss for Normal Crucible: {min_heat_loss}")
+    return min_heat_loss
 
 
-def part_two():
-    with open("day_17/input.txt", "r") as f:
+def part_two(input_path="day_17/input.txt"):
+    with open(input_path, "r") as f:
         grid = parse_grid(f.read())
     min_heat_loss = find_min_heat_loss(grid, 3, 10)
     print(f"❗️❗️ Minimum heat loss for Ultra Crucible: {min_heat_loss}")
+    return min_heat_loss
 
 
 def test_get_min_heat_loss_path_normal_crucible():
@@ -1,29 +1,22 @@
 # Day 18: Lavaduct Lagoon
 
-from enum import Enum
-
-
-class Direction(Enum):
-    UP = (-1, 0)
-    DOWN = (1, 0)
-    LEFT = (0, -1)
-    RIGHT = (0, 1)
+from aoc.directions import DELTAS, DOWN, LEFT, RIGHT, UP
 
 
 dig_plan_to_direction = {
-    "U": Direction.UP,
-    "D": Direction.DOWN,
-    "L": Direction.LEFT,
-    "R": Direction.RIGHT,
+    "U": UP,
+    "D": DOWN,
+    "L": LEFT,
+    "R": RIGHT,
 }
 
 
 class TrenchLine:
     hex_to_directions = {
-        "0": Direction.RIGHT,
-        "1": Direction.DOWN,
-        "2": Direction.LEFT,
-        "3": Direction.UP,
+        "0": RIGHT,
+        "1": DOWN,
+        "2": LEFT,
+        "3": UP,
     }
 
     def __init__(self, start_x, start_y, direction, distance):
@@ -34,9 +27,10 @@ class TrenchLine:
         self.end_x, self.end_y = self.calculate_end_coordinates()
 
     def calculate_end_coordinates(self):
+        dx, dy = DELTAS[self.direction]
         return (
-            self.start_x + self.direction.value[0] * self.distance,
-            self.start_y + self.direction.value[1] * self.distance,
+            self.start_x + dx * self.distance,
+            self.start_y + dy * self.distance,
         )
 
     def __repr__(self):
@@ -154,22 +148,24 @@ U 2 (#7a21e3)"""
     print("✅ get_lagoon_volume passed")
 
 
-def part_one():
-    with open("day_18/input.txt", "r") as f:
+def part_one(input_path="day_18/input.txt"):
+    with open(input_path, "r") as f:
         dig_plan = [line.split() for line in f.readlines()]
 
     trench_lines = dig_trench_simple(dig_plan)
     lagoon_volume = Lagoon.get_lagoon_volume(trench_lines)
     print(f"❗️ Our lagoon can hold {lagoon_volume} m^3 of lava!")
+    return lagoon_volume
 
 
-def part_two():
-    with open("day_18/input.txt", "r") as f:
+def part_two(input_path="day_18/input.txt"):
+    with open(input_path, "r") as f:
         dig_plan = [line.split() for line in f.readlines()]
 
     trench_lines = dig_trench_hex(dig_plan)
     lagoon_volume = Lagoon.get_lagoon_volume(trench_lines)
     print(f"❗️❗️ Our lagoon can actually hold {lagoon_volume} m^3 of lava!")
+    return lagoon_volume
 
 
 if __name__ == "__main__":
@@ -1,5 +1,8 @@
 # Day 19 - Aplenty
 
+from aoc.inputs import MappedInput, iter_blocks, iter_lines
+from aoc.parsing import ints
+
 class MachinePart:
     ACCEPTED = "A"
     REJECTED = "R"
@@ -72,32 +75,31 @@ def sum_of_rating_of_accepted_parts(parts_list: list) -> int:
     return sum
 
 
-def parse_input(input_str: str) -> tuple:
-    workflow_str, parts_str = input_str.split("\n\n")
+def parse_input(input_str) -> tuple:
+    # a str, or the raw bytes of a mapped input
+    data = input_str.encode() if isinstance(input_str, str) else input_str
+    workflow_block, parts_block = iter_blocks(data)
     workflows = {}
-    for workflow in workflow_str.split("\n"):
-        workflow_name, workflow_rules = workflow.split("{")  # Split on first '{'
+    for workflow in iter_lines(workflow_block):
+        workflow_name, workflow_rules = bytes(workflow).decode().split("{")  # Split on first '{'
         workflow_rules = workflow_rules[:-1]  # Remove trailing '}'
         workflows[workflow_name] = workflow_rules.split(",")
 
     parts_list = []
-    for part in parts_str.split("\n"):
-        x, m, a, s = part[1:-1].split(",")
-        x = int(x.split("=")[1])
-        m = int(m.split("=")[1])
-        a = int(a.split("=")[1])
-        s = int(s.split("=")[1])
+    for part in iter_lines(parts_block):
+        # ratings always come in x, m, a, s order
+        x, m, a, s = ints(part)
         parts_list.append(MachinePart(x, m, a, s))
 
     return workflows, parts_list
 
-def part_one():
-    with open("day_19/input.txt") as f:
-        input_str = f.read()
-    workflows, parts_list = parse_input(input_str)
+def part_one(input_path="day_19/input.txt"):
+    with MappedInput(input_path) as data:
+        workflows, parts_list = parse_input(data.data)
     parts_list = process(workflows, parts_list)
     sum = sum_of_rating_of_accepted_parts(parts_list)
     print(f"❗️ Sum of ratings of accepted parts: {sum}")
+    return sum
 
 def test_sum_of_rating_of_accepted_parts():
     input_str = """px{a<2006:qkq,m>2090:A,rfg}
@@ -1,6 +1,8 @@
 # Day 19 - Aplenty
 # Part Two
 
+from aoc.inputs import MappedInput, iter_blocks, iter_lines
+
 class MachinePartRanges:
     ACCEPTED = "A"
     REJECTED = "R"
@@ -87,22 +89,24 @@ def num_of_combinations_possible(workflows) -> int:
     return num_of_combinations
 
 
-def parse_input(input_str: str) -> tuple:
-    workflow_str, _ = input_str.split("\n\n")
+def parse_input(input_str) -> tuple:
+    # only the workflows matter here, the parts block is never read
+    data = input_str.encode() if isinstance(input_str, str) else input_str
+    workflow_block = next(iter_blocks(data))
     workflows = {}
-    for workflow in workflow_str.split("\n"):
-        workflow_name, workflow_rules = workflow.split("{")  # Split on first '{'
+    for workflow in iter_lines(workflow_block):
+        workflow_name, workflow_rules = bytes(workflow).decode().split("{")  # Split on first '{'
         workflow_rules = workflow_rules[:-1]  # Remove trailing '}'
         workflows[workflow_name] = workflow_rules.split(",")
 
     return workflows
 
-def part_two():
-    with open("day_19/input.txt") as f:
-        input_str = f.read()
-    workflows = parse_input(input_str)
+def part_two(input_path="day_19/input.txt"):
+    with MappedInput(input_path) as data:
+        workflows = parse_input(data.data)
     num = num_of_combinations_possible(workflows)
     print(f"❗️❗️ Number of combinations possible: {num}")
+    return num
 
 def test_num_of_combinations_possible():
     input_str = """px{a<2006:qkq,m>2090:A,rfg}
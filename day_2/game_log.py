@@ -0,0 +1,416 @@
+# --- Day 2: Cube Conundrum ---
+# --- Game log ---
+# the games parsed once into columns: an array of game ids and, for every
+# colour, an array with the most cubes of that colour shown in any draw of
+# each game. Both parts are reductions over these columns (with numpy when
+# it is installed), so asking again costs no string work.
+#
+# ThresholdIndex answers many bags against the same games at once: a
+# prefix-sum table over the (few) distinct per-colour maxima turns each bag
+# into one lookup, whatever the number of games; when the colours have too
+# many distinct values for a table, per-colour bitsets are intersected.
+#
+# A log can also be fed a live stream (`log.extend(follow(path))`): colours
+# are discovered as they appear, and the total power and the id sums of
+# watched bags are kept current with O(colours) work per new game.
+
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from math import prod
+
+from aoc.parsing import count_words
+
+# numpy is optional, the columns are plain arrays either way
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def parse_game(game):
+    """Parses `Game 7: 3 blue, 4 red; ...` into `(7, [(3, "blue"), (4, "red"), ...])` in one pass."""
+    head, sequences = game.split(":")
+    return int(head.split()[1]), [(count, color.decode()) for count, color in count_words(sequences)]
+
+
+def follow(path, poll_interval=0.5, idle_timeout=None):
+    """Yields the lines of a file, then every line appended to it, like `tail -f`.
+
+    A trailing partial line is held back until its newline arrives. Stops
+    after `idle_timeout` seconds without any new data (never when None), so
+    a line written slowly isn't cut off halfway.
+    """
+    with open(path) as f:
+        pending = ""
+        idle_since = time.monotonic()
+        while True:
+            chunk = f.readline()
+            if chunk:
+                idle_since = time.monotonic()
+                pending += chunk
+                if pending.endswith("\n"):
+                    yield pending
+                    pending = ""
+                continue
+            if idle_timeout is not None and time.monotonic() - idle_since >= idle_timeout:
+                return
+            time.sleep(poll_interval)
+
+
+class WatchedBag:
+    """A bag whose possible-game id sum the log keeps up to date as games arrive."""
+
+    def __init__(self, max_cubes, colors, total=0):
+        self.max_cubes = dict(max_cubes)
+        # limit per interned colour, extended as new colours show up
+        self.limits = [self.max_cubes.get(color, 0) for color in colors]
+        self.total = total
+
+
+class GameLog:
+    """Games as columns of per-colour maxima, plus running totals.
+
+    Colours are interned to column indices the first time a game shows
+    them, so any set of colours works; pass `colors=()` to discover them
+    all from the log. `add` updates the total power and the id sum of every
+    watched bag in O(colours), so a growing log never needs a rescan. With
+    `store=False` only those totals are kept, in constant memory.
+    """
+
+    def __init__(self, colors=("red", "green", "blue"), store=True):
+        self.store = store
+        self.count = 0
+        self.ids = array("q")
+        self.colors = []
+        self.color_index = {}
+        # maxima[i][g] is the most cubes of colors[i] shown at once in game g
+        self.maxima = []
+        self.total_power = 0
+        self.watched = {}
+        for color in colors:
+            self._intern(color)
+
+    @classmethod
+    def from_lines(cls, lines, **kwargs):
+        log = cls(**kwargs)
+        log.extend(lines)
+        return log
+
+    def __len__(self):
+        return self.count
+
+    def _intern(self, color):
+        index = self.color_index.get(color)
+        if index is None:
+            # a colour seen for the first time was shown 0 times in earlier games
+            index = self.color_index[color] = len(self.colors)
+            self.colors.append(color)
+            if self.store:
+                self.maxima.append(array("q", bytes(8 * len(self.ids))))
+            for bag in self.watched.values():
+                bag.limits.append(bag.max_cubes.get(color, 0))
+            # ...so each of them now needs 0 of it, and has a power of 0
+            self.total_power = 0
+        return index
+
+    def add(self, game):
+        game_id, cubes = parse_game(game)
+        row = [0] * len(self.colors)
+        for count, color in cubes:
+            index = self._intern(color)
+            if index == len(row):
+                row.append(0)
+            if count > row[index]:
+                row[index] = count
+
+        self.count += 1
+        if self.store:
+            self.ids.append(game_id)
+            for column, count in zip(self.maxima, row):
+                column.append(count)
+
+        self.total_power += prod(row)
+        for bag in self.watched.values():
+            if all(count <= limit for count, limit in zip(row, bag.limits)):
+                bag.total += game_id
+
+    def extend(self, lines):
+        # any iterable of lines, e.g. an open file or follow(path); blank lines are skipped
+        for line in lines:
+            if line.strip():
+                self.add(line)
+
+    def watch(self, name, max_cubes):
+        """Keeps `possible_id_sum(name)` up to date for the bag `max_cubes`."""
+        if self.count and not self.store:
+            raise ValueError(f"Can't watch {name!r} after {self.count} games without stored columns")
+        total = self.sum_of_possible_game_ids(max_cubes) if self.count else 0
+        self.watched[name] = WatchedBag(max_cubes, self.colors, total)
+
+    def possible_id_sum(self, name):
+        return self.watched[name].total
+
+    def sum_of_possible_game_ids(self, max_cubes):
+        # a game is possible when no draw shows more cubes of a colour than
+        # the bag holds; colours missing from the bag have none
+        self._require_columns()
+        limits = [max_cubes.get(color, 0) for color in self.colors]
+        if np is not None and self.ids:
+            possible = np.ones(len(self.ids), dtype=bool)
+            for column, limit in zip(self.maxima, limits):
+                possible &= np.frombuffer(column, dtype=np.int64) <= limit
+            return int(np.frombuffer(self.ids, dtype=np.int64)[possible].sum())
+        return sum(
+            game_id
+            for game_id, *counts in zip(self.ids, *self.maxima)
+            if all(count <= limit for count, limit in zip(counts, limits))
+        )
+
+    def sum_of_powers(self):
+        # the power of a game is the product of its per-colour maxima, i.e.
+        # of the fewest cubes of each colour that make it possible
+        self._require_columns()
+        if np is not None and self.ids:
+            power = np.ones(len(self.ids), dtype=np.int64)
+            for column in self.maxima:
+                power *= np.frombuffer(column, dtype=np.int64)
+            return int(power.sum())
+        total = 0
+        for counts in zip(*self.maxima):
+            power = 1
+            for count in counts:
+                power *= count
+            total += power
+        return total
+
+    def threshold_index(self):
+        self._require_columns()
+        return ThresholdIndex(self)
+
+    def _require_columns(self):
+        if not self.store:
+            raise ValueError("This log keeps running totals only, not the per-game columns")
+
+    def possible_id_sums(self, bags):
+        """`sum_of_possible_game_ids` for each bag in `bags`, sharing one index."""
+        return self.threshold_index().sums(bags)
+
+
+class ThresholdIndex:
+    """Sums of the ids of the games a bag of cubes makes possible, for many bags.
+
+    A snapshot: games added to the log afterwards need a new index.
+    """
+
+    # largest prefix-sum table built before falling back to bitsets
+    MAX_TABLE_CELLS = 1 << 20
+
+    def __init__(self, log, max_table_cells=MAX_TABLE_CELLS):
+        self.colors = list(log.colors)
+        # the distinct maxima of every colour, in order; a game is described
+        # by the rank of its maximum in each
+        self.values = [sorted(set(column)) for column in log.maxima]
+        ranks = [[bisect_left(values, count) for count in column] for values, column in zip(self.values, log.maxima)]
+        self.shape = [len(values) for values in self.values]
+
+        self.table = self.masks = None
+        if prod(self.shape) <= max_table_cells:
+            self.table = self._prefix_table(log.ids, ranks)
+        else:
+            self.ids = array("q", log.ids)
+            # masks[c][r] has bit g set when game g shows at most values[c][r] cubes of colour c
+            self.masks = []
+            for color_ranks, size in zip(ranks, self.shape):
+                bits = [bytearray((len(self.ids) + 7) // 8) for _ in range(size)]
+                for game, rank in enumerate(color_ranks):
+                    bits[rank][game >> 3] |= 1 << (game & 7)
+                by_rank = [int.from_bytes(rank_bits, "little") for rank_bits in bits]
+                for rank in range(1, size):
+                    by_rank[rank] |= by_rank[rank - 1]
+                self.masks.append(by_rank)
+
+    def _prefix_table(self, ids, ranks):
+        # table[r0, r1, ...] is the id sum of the games whose rank is <= r_i
+        # in every colour i, flattened row-major
+        if not ids:
+            return []
+        if np is not None:
+            table = np.zeros(self.shape, dtype=np.int64)
+            np.add.at(table, tuple(np.array(color_ranks) for color_ranks in ranks), np.frombuffer(ids, dtype=np.int64))
+            for axis in range(len(self.shape)):
+                np.cumsum(table, axis=axis, out=table)
+            return table.ravel().tolist()
+
+        strides = [prod(self.shape[axis + 1 :]) for axis in range(len(self.shape))]
+        table = [0] * prod(self.shape)
+        for game_id, game_ranks in zip(ids, zip(*ranks)):
+            table[sum(rank * stride for rank, stride in zip(game_ranks, strides))] += game_id
+        for stride, size in zip(strides, self.shape):
+            for cell in range(len(table)):
+                if (cell // stride) % size:
+                    table[cell] += table[cell - stride]
+        return table
+
+    def sum(self, max_cubes):
+        # highest rank within the bag's limit per colour, -1 when no game fits
+        limit_ranks = [bisect_right(values, max_cubes.get(color, 0)) - 1 for color, values in zip(self.colors, self.values)]
+        if not self.shape or min(self.shape) == 0 or min(limit_ranks) < 0:
+            return 0
+        if self.table is not None:
+            cell = 0
+            for rank, size in zip(limit_ranks, self.shape):
+                cell = cell * size + rank
+            return self.table[cell]
+
+        possible = -1
+        for masks, rank in zip(self.masks, limit_ranks):
+            possible &= masks[rank]
+        if np is not None:
+            bits = np.frombuffer(possible.to_bytes((len(self.ids) + 7) // 8, "little"), dtype=np.uint8)
+            selected = np.unpackbits(bits, count=len(self.ids), bitorder="little").astype(bool)
+            return int(np.frombuffer(self.ids, dtype=np.int64)[selected].sum())
+        total = 0
+        while possible:
+            lowest = possible & -possible
+            total += self.ids[lowest.bit_length() - 1]
+            possible ^= lowest
+        return total
+
+    def sums(self, bags):
+        return [self.sum(max_cubes) for max_cubes in bags]
+
+
+def test_game_log():
+    import sys
+
+    from aoc.testing import numpy_modes
+
+    games = [
+        "Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green",
+        "Game 2: 1 blue, 2 green; 3 green, 4 blue, 1 red; 1 green, 1 blue",
+        "Game 3: 8 green, 6 blue, 20 red; 5 blue, 4 red, 13 green; 5 green, 1 red",
+        "Game 4: 1 green, 3 red, 6 blue; 3 green, 6 red; 3 green, 15 blue, 14 red",
+        "Game 5: 6 red, 1 blue, 3 green; 2 blue, 1 red, 2 green",
+        "",
+    ]
+    log = GameLog.from_lines(games)
+    assert len(log) == 5 and list(log.maxima[log.color_index["red"]]) == [4, 1, 20, 14, 6]
+
+    # the same answers with and without numpy
+    for _ in numpy_modes(sys.modules[__name__]):
+        assert log.sum_of_possible_game_ids({"red": 12, "green": 13, "blue": 14}) == 8
+        assert log.sum_of_possible_game_ids({"red": 20, "green": 13, "blue": 15}) == 15
+        assert log.sum_of_powers() == 2286
+        assert GameLog().sum_of_powers() == 0 and GameLog().sum_of_possible_game_ids({}) == 0
+    print("Test passed: game log")
+
+
+def test_streaming():
+    import os
+    import sys
+    import tempfile
+    import types
+
+    games = [
+        "Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green",
+        "Game 2: 1 blue, 2 green; 3 green, 4 blue, 1 red; 1 green, 1 blue",
+        "Game 3: 8 green, 6 blue, 20 red; 5 blue, 4 red, 13 green; 5 green, 1 red",
+        "Game 4: 2 purple, 1 red; 3 green, 1 blue",
+        "Game 5: 6 red, 1 blue, 3 green, 1 purple; 2 blue, 1 red, 2 green",
+    ]
+    bag = {"red": 12, "green": 13, "blue": 14}
+    stored = GameLog(colors=())
+    streaming = GameLog(colors=(), store=False)
+    for log in (stored, streaming):
+        log.watch("bag", bag)
+        log.watch("with purple", {**bag, "purple": 2})
+
+    # the running totals match a recomputation after every game, including
+    # when a new colour turns up and zeroes every earlier game's power
+    for count, game in enumerate(games, 1):
+        stored.add(game)
+        streaming.add(game)
+        recomputed = GameLog.from_lines(games[:count], colors=())
+        for log in (stored, streaming):
+            assert log.total_power == recomputed.sum_of_powers()
+            assert log.possible_id_sum("bag") == recomputed.sum_of_possible_game_ids(bag)
+            assert log.possible_id_sum("with purple") == recomputed.sum_of_possible_game_ids({**bag, "purple": 2})
+    assert stored.colors == ["blue", "red", "green", "purple"] and streaming.maxima == []
+    assert (stored.total_power, stored.possible_id_sum("bag"), stored.possible_id_sum("with purple")) == (6 + 36, 3, 1 + 2 + 4 + 5)
+
+    # a bag watched late starts from the stored columns
+    stored.watch("late", bag)
+    assert stored.possible_id_sum("late") == 3
+    try:
+        streaming.watch("late", bag)
+        assert False, "a streaming log can't answer for games it didn't keep"
+    except ValueError:
+        pass
+
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+        f.write("\n".join(games[:2]) + "\n" + games[2])
+    try:
+        lines = follow(f.name, poll_interval=0.01, idle_timeout=0.05)
+        live = GameLog(colors=())
+        live.extend(lines)
+        # the unfinished last line waits for its newline
+        assert len(live) == 2
+
+        # a line written in pieces, slower overall than the idle timeout but
+        # never idle for that long: a fake clock stands in for `time`, and
+        # every poll's sleep writes the next piece, so no real timing is involved
+        pieces = [games[3][start : start + 8] for start in range(0, len(games[3]), 8)] + ["\n"]
+        clock = types.SimpleNamespace(now=0.0)
+
+        def sleep(seconds):
+            clock.now += seconds
+            if pieces:
+                with open(f.name, "a") as out:
+                    out.write(pieces.pop(0))
+
+        module = sys.modules[__name__]
+        real_time = module.time
+        module.time = types.SimpleNamespace(monotonic=lambda: clock.now, sleep=sleep)
+        try:
+            slow = list(follow(f.name, poll_interval=1, idle_timeout=3))
+        finally:
+            module.time = real_time
+        assert len(pieces) == 0 and clock.now > 3 * 2, "the line should take longer than the timeout"
+        assert slow[-1] == games[2] + games[3] + "\n"
+    finally:
+        os.remove(f.name)
+    print("Test passed: streaming")
+
+
+def test_threshold_index():
+    import random
+    import sys
+
+    from aoc.testing import numpy_modes
+
+    rng = random.Random(2)
+    games = [
+        f"Game {game_id}: " + "; ".join(
+            ", ".join(f"{rng.randint(1, 20)} {color}" for color in rng.sample(["red", "green", "blue"], rng.randint(1, 3)))
+            for _ in range(rng.randint(1, 4))
+        )
+        for game_id in range(1, 301)
+    ]
+    log = GameLog.from_lines(games)
+    bags = [{"red": rng.randint(0, 21), "green": rng.randint(0, 21), "blue": rng.randint(0, 21)} for _ in range(200)]
+    bags += [{"red": 12, "green": 13, "blue": 14}, {}, {"red": 99, "green": 99, "blue": 99}]
+    expected = [log.sum_of_possible_game_ids(bag) for bag in bags]
+
+    # the prefix table (with and without numpy) and the bitsets agree with the columns
+    for _ in numpy_modes(sys.modules[__name__]):
+        assert log.possible_id_sums(bags) == expected
+        assert ThresholdIndex(log, max_table_cells=0).sums(bags) == expected
+    assert expected[-1] == sum(range(1, 301)) and GameLog().possible_id_sums(bags[:2]) == [0, 0]
+    print("Test passed: threshold index")
+
+
+if __name__ == "__main__":
+    test_game_log()
+    test_streaming()
+    test_threshold_index()
@@ -1,48 +1,35 @@
 # --- Day 2: Cube Conundrum ---
 # --- Part One ---
 
+from day_2.game_log import GameLog
+
 
 class CubeGameAnalyzer:
     def __init__(self, max_cubes):
         self.max_cubes = max_cubes
 
     def sum_of_possible_game_ids(self, games):
-        sum_ids = 0
+        # parse every game once into columns, then reduce over them
+        log = GameLog()
         for game in games:
             try:
-                game_id, sequences = game.split(": ")
-                if self._is_game_possible(sequences):
-                    sum_ids += int(game_id.split()[1])
-            except ValueError as e:
+                log.add(game)
+            except (ValueError, KeyError) as e:
                 print(f"Error processing game data: {e}")
-        return sum_ids
-
-    def _is_game_possible(self, game_sequence):
-        sequences = game_sequence.split(";")
-        for sequence in sequences:
-            sequence = sequence.strip()
-            if not self._is_sequence_possible(sequence):
-                return False
-        return True
+        return log.sum_of_possible_game_ids(self.max_cubes)
 
-    def _is_sequence_possible(self, sequence):
-        cubes = sequence.split(",")
-        for cube in cubes:
-            count, color = cube.strip().split()
-            if int(count) > self.max_cubes[color]:
-                return False
-        return True
 
-
-def main():
+def main(input_path="day_2/input.txt"):
     # read games from the input file
-    with open("day_2/input.txt") as f:
+    with open(input_path) as f:
         games = f.readlines()
 
     # calculate and display the sum of possible game IDs
     max_cubes = {"red": 12, "green": 13, "blue": 14}
     analyzer = CubeGameAnalyzer(max_cubes)
-    print(analyzer.sum_of_possible_game_ids(games))
+    sum_of_ids = analyzer.sum_of_possible_game_ids(games)
+    print(sum_of_ids)
+    return sum_of_ids
 
 
 def test_cube_game_analyzer():
@@ -1,67 +1,31 @@
 # --- Day 2: Cube Conundrum ---
 # --- Part Two ---
 
-from functools import reduce
-from operator import mul
+from day_2.game_log import GameLog
 
 
 class CubeGameAnalyzer:
     def __init__(self, games, max_cubes=None):
-        self.games = games
+        # parsed once; every query below is a reduction over the columns
+        self.games = GameLog.from_lines(games)
         self.max_cubes = max_cubes
 
     def sum_of_possible_game_ids(self):
-        sum_ids = 0
-        for game in self.games:
-            try:
-                game_id, sequences = game.split(": ")
-                if self._is_game_possible(sequences):
-                    sum_ids += int(game_id.split()[1])
-            except ValueError as e:
-                print(f"Error processing game data: {e}")
-        return sum_ids
+        return self.games.sum_of_possible_game_ids(self.max_cubes)
 
     def sum_of_power_of_games(self):
-        sum_power_of_games = 0
-        for game in self.games:
-            game_sets = game.split(": ")[1].split("; ")
-            min_cubes_required = {"red": 0, "green": 0, "blue": 0}
+        return self.games.sum_of_powers()
 
-            for cubes in game_sets:
-                for count, color in map(str.split, cubes.split(", ")):
-                    min_cubes_required[color] = max(
-                        int(count), min_cubes_required[color]
-                    )
 
-            game_power = reduce(mul, min_cubes_required.values(), 1)
-            sum_power_of_games += game_power
-
-        return sum_power_of_games
-
-    def _is_game_possible(self, game_sequence):
-        sequences = game_sequence.split(";")
-        for sequence in sequences:
-            sequence = sequence.strip()
-            if not self._is_sequence_possible(sequence):
-                return False
-        return True
-
-    def _is_sequence_possible(self, sequence):
-        cubes = sequence.split(",")
-        for cube in cubes:
-            count, color = cube.strip().split()
-            if int(count) > self.max_cubes[color]:
-                return False
-        return True
-
-
-def main():
+def main(input_path="day_2/input.txt"):
     # read games from the input file
-    with open("day_2/input.txt") as f:
+    with open(input_path) as f:
         games = f.readlines()
 
     analyzer = CubeGameAnalyzer(games)
-    print(analyzer.sum_of_power_of_games())
+    sum_of_power_of_games = analyzer.sum_of_power_of_games()
+    print(sum_of_power_of_games)
+    return sum_of_power_of_games
 
 
 def test_cube_game_analyzer():
@@ -252,8 +252,8 @@ def test_count_pulses_in_the_circuit_b():
 
 # Main
 
-def part_one():
-    with open("day_20/input.txt") as f:
+def part_one(input_path="day_20/input.txt"):
+    with open(input_path) as f:
         config_lines = f.readlines()
     process_input_count(config_lines)
     modules = setup_modules(config_lines)
@@ -265,15 +265,17 @@ def part_one():
         f"❗️ Product of total number of low pulses sent by the \
 total number of high pulses sent: {num_pulses}"
     )
+    return num_pulses
 
-def part_two():
-    with open("day_20/input.txt") as f:
+def part_two(input_path="day_20/input.txt"):
+    with open(input_path) as f:
         config_lines = f.readlines()
     process_input_count(config_lines)
     modules = setup_modules(config_lines)
     simulation = Simulation(modules)
     button_presses = simulation.run_simulation_until_rx()
     print(f"❗️❗️ Number of button presses required to activate the Rx: {button_presses}")
+    return button_presses
 
 
 if __name__ == "__main__":
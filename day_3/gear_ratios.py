@@ -1,106 +1,504 @@
 # --- Day 3: Gear Ratios ---
 
+import re
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from aoc.chunks import DEFAULT_CHUNK_SIZE, map_ranges
+from aoc.grid import Grid
+
+# numpy is optional, it only powers the vectorized mode
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+NUMBER = re.compile(rb"[0-9]+")
+# deleting these from a slice of cells leaves only the symbols
+NOT_SYMBOLS = b"0123456789."
+# longest digit run whose value always fits in an int64
+MAX_INT64_DIGITS = 18
+
+
 class EngineSchematicAnalyzer:
-    DIRECTIONS = [
-        (-1, -1), # Top-left
-        (-1, 0),  # Up
-        (-1, 1),  # Top-right
-        (0, -1),  # Left
-        (0, 1),   # Right
-        (1, -1),  # Bottom-left
-        (1, 0),   # Down
-        (1, 1)    # Bottom-right
-    ]
+    def __init__(self, schematic, vectorized=np is not None):
+        # pad with a ring of '.' so neighbour lookups never fall off the grid;
+        # positions below are flat indices into the padded grid
+        self.schematic = Grid.from_string(schematic).padded(".")
+        self.neighbour_offsets = self.schematic.neighbour_offsets(diagonal=True)
+        # the vectorized mode does the same work with numpy array operations
+        # instead of a python loop per number, symbol or gear
+        self.vectorized = vectorized
+        # the digit-run index, built on first use (the tiled mode doesn't need it)
+        self.values = None
+        # both sums from the tiled mode per process count, which always
+        # computes the two together
+        self._tiled_sums = {}
+
+    def _ensure_labels(self):
+        if self.values is None:
+            if self.vectorized:
+                self._label_numbers_vectorized()
+            else:
+                self._label_numbers()
+
+    def _label_numbers(self):
+        # one pass over the cells: every run of digits gets a label, with its
+        # value and its [start, end) span, and labels[idx] is the label of
+        # the run covering idx (-1 for other cells). The padding keeps runs
+        # from wrapping onto the next row. Values stay python ints, a run
+        # can be longer than 64 bits.
+        cells = self.schematic.cells
+        self.values = []
+        self.starts = array("q")
+        self.ends = array("q")
+        self.labels = array("i", [-1]) * len(cells)
+        for label, match in enumerate(NUMBER.finditer(cells)):
+            start, end = match.span()
+            self.values.append(int(match[0]))
+            self.starts.append(start)
+            self.ends.append(end)
+            self.labels[start:end] = array("i", [label]) * (end - start)
+
+    def _label_numbers_vectorized(self):
+        # the same index built from the digit positions: a run starts at a
+        # digit whose left neighbour isn't one, and its value is the sum of
+        # its digits weighted by powers of ten counted back from its end
+        cells = np.frombuffer(self.schematic.cells, dtype=np.uint8)
+        positions = np.flatnonzero((cells >= ord("0")) & (cells <= ord("9")))
+        run_starts = np.ones(len(positions), dtype=bool)
+        run_starts[1:] = positions[1:] != positions[:-1] + 1
+        first_digits = np.flatnonzero(run_starts)
+        run_of_digit = np.cumsum(run_starts) - 1
+
+        self.starts = positions[first_digits]
+        self.ends = self.starts + np.diff(first_digits, append=len(positions))
+        if len(positions) and (self.ends - self.starts).max() > MAX_INT64_DIGITS:
+            # too long for int64: python ints in an object array
+            self.values = np.array([int(self.schematic.cells[start:end]) for start, end in zip(self.starts.tolist(), self.ends.tolist())], dtype=object)
+        else:
+            weights = np.power(10, self.ends[run_of_digit] - 1 - positions)
+            digits = cells[positions].astype(np.int64) - ord("0")
+            self.values = np.add.reduceat(digits * weights, first_digits) if len(positions) else np.zeros(0, dtype=np.int64)
+        self.labels = np.full(len(cells), -1, dtype=np.int32)
+        self.labels[positions] = run_of_digit
+
+    def calculate_sum_of_part_numbers(self, processes=None):
+        # with `processes`, horizontal tiles are solved in a process pool
+        if processes:
+            return self._tiled(processes)[0]
+        self._ensure_labels()
+        if self.vectorized:
+            return self._sum_of_values(self._part_mask())
+        return sum(self.values[label] for label in self.part_labels())
+
+    def calculate_sum_of_all_gear_ratios(self, processes=None):
+        if processes:
+            return self._tiled(processes)[1]
+        self._ensure_labels()
+        if self.vectorized:
+            return self._sum_of_ratios(self._stars())
+        return sum(self.values[first] * self.values[second] for _, first, second in self.gears())
+
+    def part_labels(self):
+        """Labels of the numbers next to a symbol, in reading order."""
+        self._ensure_labels()
+        if self.vectorized:
+            return np.flatnonzero(self._part_mask()).tolist()
+        return [label for label in range(len(self.values)) if self._is_part(label)]
+
+    def gears(self):
+        """`(idx, label, label)` for every `*` next to exactly two different numbers."""
+        self._ensure_labels()
+        if self.vectorized:
+            stars = self._stars()
+            is_gear, first, second = self._gear_labels(stars)
+            return list(zip(stars[is_gear].tolist(), first.tolist(), second.tolist()))
+
+        cells, labels = self.schematic.cells, self.labels
+        found = []
+        idx = cells.find(b"*")
+        while idx != -1:
+            # labels, not values, so two different parts with the same number both count
+            adjacent = {labels[idx + offset] for offset in self.neighbour_offsets}
+            adjacent.discard(-1)
+            if len(adjacent) == 2:
+                found.append((idx, *sorted(adjacent)))
+            idx = cells.find(b"*", idx + 1)
+        return found
+
+    def _tiled(self, processes):
+        if processes not in self._tiled_sums:
+            self._tiled_sums[processes] = self._solve_tiled(processes)
+        return self._tiled_sums[processes]
+
+    def _solve_tiled(self, processes, tile_rows=None):
+        # horizontal tiles of the unpadded rows, each sent with the row above
+        # and below it as a halo; see solve_tile
+        cells, width = self.schematic.cells, self.schematic.width
+        rows = [bytes(cells[row * width + 1 : (row + 1) * width - 1]) for row in range(1, self.schematic.height - 1)]
+        # a few tiles per process keeps the pool busy
+        tile_rows = tile_rows or max(1, -(-len(rows) // (processes * 4)))
+        tiles = [
+            (rows[start : start + tile_rows], rows[start - 1] if start else None, rows[start + tile_rows] if start + tile_rows < len(rows) else None)
+            for start in range(0, len(rows), tile_rows)
+        ]
+        if processes == 1:
+            results = [solve_tile(*tile) for tile in tiles]
+        else:
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                results = list(executor.map(solve_tile, *zip(*tiles)))
+        return sum(parts for parts, _ in results), sum(gears for _, gears in results)
+
+    def _is_part(self, label):
+        # any symbol in the box around the run: the rows above and below and
+        # the cells either side of it
+        cells, width = self.schematic.cells, self.schematic.width
+        left, right = self.starts[label] - 1, self.ends[label] + 1
+        return any(
+            cells[left + row_offset : right + row_offset].translate(None, NOT_SYMBOLS)
+            for row_offset in (-width, 0, width)
+        )
+
+    def _part_mask(self):
+        # symbols dilated by a 3x3 neighbourhood (as two separable shifts),
+        # then OR-reduced over the span of every run
+        grid = np.frombuffer(self.schematic.cells, dtype=np.uint8).reshape(self.schematic.height, self.schematic.width)
+        symbols = ((grid < ord("0")) | (grid > ord("9"))) & (grid != ord("."))
+        near = symbols.copy()
+        near[1:] |= symbols[:-1]
+        near[:-1] |= symbols[1:]
+        dilated = near.copy()
+        dilated[:, 1:] |= near[:, :-1]
+        dilated[:, :-1] |= near[:, 1:]
+        if not len(self.starts):
+            return np.zeros(0, dtype=bool)
+        # reduceat over [start, end, start, end, ...] reduces every span at the even slots
+        spans = np.column_stack((self.starts, self.ends)).ravel()
+        return np.logical_or.reduceat(dilated.ravel(), spans)[::2]
+
+    def _stars(self):
+        return np.flatnonzero(np.frombuffer(self.schematic.cells, dtype=np.uint8) == ord("*"))
+
+    def _sum_of_values(self, mask):
+        # summed as python ints, int64 would overflow silently
+        return sum(self.values[mask].tolist())
+
+    def _sum_of_ratios(self, stars):
+        _, first, second = self._gear_labels(stars)
+        return sum(a * b for a, b in zip(self.values[first].tolist(), self.values[second].tolist()))
+
+    def _sums_of_rows(self, first_row, stop_row):
+        # both sums, vectorized, counting only the numbers and gears on rows
+        # [first_row, stop_row) of the unpadded schematic; the rows around
+        # them are still looked at
+        self._ensure_labels()
+        width = self.schematic.width
+        # padded row r + 1 holds row r
+        run_rows = np.asarray(self.starts, dtype=np.int64) // width - 1
+        stars = self._stars()
+        star_rows = stars // width - 1
+        return (
+            self._sum_of_values(self._part_mask() & (run_rows >= first_row) & (run_rows < stop_row)),
+            self._sum_of_ratios(stars[(star_rows >= first_row) & (star_rows < stop_row)]),
+        )
+
+    def _gear_labels(self, stars):
+        # the labels around every star, one row per star; a gear has exactly
+        # two different labels besides -1, i.e. its smallest and largest
+        around = self.labels[stars[:, None] + np.array(self.neighbour_offsets)]
+        around.sort(axis=1)
+        distinct = (around[:, 1:] != around[:, :-1]).sum(axis=1) + 1 - (around[:, 0] == -1)
+        largest = around[:, -1]
+        smallest = np.where(around == -1, largest[:, None], around).min(axis=1)
+        is_gear = distinct == 2
+        return is_gear, smallest[is_gear], largest[is_gear]
+
+class StreamingSchematicAnalyzer:
+    """Part numbers and gear ratios of a schematic fed one row at a time.
+
+    Only a three-row window (previous, current, next) is kept, so memory
+    depends on the width of the schematic, not its height. A row is
+    settled once the row after it arrives: its numbers can then see every
+    symbol around them, and its stars every number, even one in the
+    previous or next row. `push` returns the events of the row it settled,
+    `finish` those of the last row.
+    """
+
+    def __init__(self):
+        self.sum_of_part_numbers = 0
+        self.sum_of_gear_ratios = 0
+        self.width = None
+        self._previous = self._current = None
+        self._row = -1
+
+    def _scan(self, row):
+        # one padded row with its digit runs and a column -> run lookup
+        cells = b"." + row + b"."
+        runs = []
+        run_at = array("i", [-1]) * len(cells)
+        for match in NUMBER.finditer(cells):
+            start, end = match.span()
+            run_at[start:end] = array("i", [len(runs)]) * (end - start)
+            runs.append((start, end, int(match[0])))
+        return cells, runs, run_at
+
+    def push(self, row):
+        if isinstance(row, str):
+            row = row.encode()
+        row = row.rstrip(b"\r\n")
+        if self.width is None:
+            self.width = len(row)
+            self._previous = self._scan(b"." * self.width)
+        elif len(row) != self.width:
+            raise ValueError(f"Ragged schematic: expected rows of {self.width}, got {len(row)}")
+
+        scanned = self._scan(row)
+        if self._current is None:
+            self._current = scanned
+            return []
+        events = self._settle(self._previous, self._current, scanned)
+        self._previous, self._current = self._current, scanned
+        return events
+
+    def finish(self):
+        if self._current is None:
+            return []
+        events = self._settle(self._previous, self._current, self._scan(b"." * self.width))
+        self._current = None
+        return events
+
+    def _settle(self, previous, current, following):
+        # events of the current row, as ("part", row, col, number) and
+        # ("gear", row, col, ratio) with unpadded columns
+        self._row += 1
+        window = (previous, current, following)
+        cells, runs, _ = current
+        events = []
+        for start, end, value in runs:
+            if any(row_cells[start - 1 : end + 1].translate(None, NOT_SYMBOLS) for row_cells, _, _ in window):
+                self.sum_of_part_numbers += value
+                events.append(("part", self._row, start - 1, value))
+
+        idx = cells.find(b"*")
+        while idx != -1:
+            # numbers are told apart by (row, run), not by value
+            adjacent = {
+                (row_offset, run_at[col])
+                for row_offset, (_, _, run_at) in enumerate(window)
+                for col in (idx - 1, idx, idx + 1)
+                if run_at[col] != -1
+            }
+            if len(adjacent) == 2:
+                (first_row, first), (second_row, second) = adjacent
+                ratio = window[first_row][1][first][2] * window[second_row][1][second][2]
+                self.sum_of_gear_ratios += ratio
+                events.append(("gear", self._row, idx - 1, ratio))
+            idx = cells.find(b"*", idx + 1)
+        return events
+
+    def analyze(self, rows):
+        """Yields the events of every row of `rows`, e.g. an open file."""
+        for row in rows:
+            if row.strip():
+                yield from self.push(row)
+        yield from self.finish()
+
+class IncrementalSchematicAnalyzer:
+    """Keeps the part-number and gear-ratio sums current while cells are edited.
+
+    `edit` only revisits what one cell can influence: the digit runs on
+    its row that it splits, joins or changes, the runs in its 3x3
+    neighbourhood whose part status may flip, and the stars around any of
+    those runs. That is O(length of the runs involved) per edit instead of
+    a rescan of the schematic.
+    """
 
     def __init__(self, schematic):
-        self.schematic = [list(line) for line in schematic.split('\n')]
-        self.processed_locations = set()
-
-    def calculate_sum_of_part_numbers(self):
-        total_sum = 0
-        for i, row in enumerate(self.schematic):
-            j = 0
-            while j < len(row):
-                if row[j].isdigit() and (i, j) not in self.processed_locations:
-                    part_number = self._get_full_part_number(i, j)
-                    self.processed_locations.update(
-                        (i, col_index) for col_index in range(j, j + len(str(part_number)))
-                    )
-
-                    if any(self._is_adjacent_to_symbol(i, col_index) for col_index in range(j, j + len(str(part_number)))):
-                        total_sum += part_number
-                    j += len(str(part_number)) - 1
-                j += 1
-            
-        return total_sum
-    
-    def calculate_sum_of_all_gear_ratios(self):
-        total_sum = 0
-        for i, row in enumerate(self.schematic):
-            for j, char in enumerate(row):
-                total_sum += self._get_gear_ratio(i, j) if char == '*' else 0
-        
-        return total_sum
-
-    def _get_gear_ratio(self, row, col):
-        adjacent_numbers = []
-        for dx, dy in self.DIRECTIONS:
-            adjacent_row, adjacent_col = row + dx, col + dy
-            if 0 <= adjacent_row < len(self.schematic) and 0 <= adjacent_col < len(self.schematic[adjacent_row]):
-                if self.schematic[adjacent_row][adjacent_col].isdigit():
-                    part_number = self._get_full_part_number(adjacent_row, adjacent_col)
-                    if part_number not in adjacent_numbers:
-                        adjacent_numbers.append(part_number)
-
-        if len(adjacent_numbers) == 2:
-            return adjacent_numbers[0] * adjacent_numbers[1]
-        return 0
-
-    def _get_full_part_number(self, row, col):
-        # start with the digit at (row, col)
-        number_str = self.schematic[row][col]
-
-        # fan out to the left
-        left_col = col - 1
-        while left_col >= 0 and self.schematic[row][left_col].isdigit():
-            number_str = self.schematic[row][left_col] + number_str
-            left_col -= 1
-
-        # fan out to the right
-        right_col = col + 1
-        while right_col < len(self.schematic[row]) and self.schematic[row][right_col].isdigit():
-            number_str += self.schematic[row][right_col]
-            right_col += 1
-
-        return int(number_str)
-
-    def _is_valid_symbol(self, char):
-        return not (char.isdigit() or char == '.')
-
-    def _is_adjacent_to_symbol(self, row, col):
-        for dx, dy in self.DIRECTIONS:
-            if 0 <= row + dx < len(self.schematic) and 0 <= col + dy < len(self.schematic[row + dx]):
-                if self._is_valid_symbol(self.schematic[row + dx][col + dy]):
-                    return True
-        return False
+        # padded like EngineSchematicAnalyzer, positions are flat indices
+        self.schematic = Grid.from_string(schematic).padded(".")
+        self.neighbour_offsets = self.schematic.neighbour_offsets(diagonal=True)
+        cells = self.schematic.cells
+        self.labels = array("i", [-1]) * len(cells)
+        # label -> (start, end, value) of every digit run
+        self.runs = {}
+        self.parts = set()
+        # star index -> ratio, for the stars that are gears
+        self.gear_ratios = {}
+        self.sum_of_part_numbers = 0
+        self.sum_of_gear_ratios = 0
+        self._next_label = 0
+
+        for match in NUMBER.finditer(cells):
+            self._update_part(self._add_run(*match.span()))
+        idx = cells.find(b"*")
+        while idx != -1:
+            self._update_gear(idx)
+            idx = cells.find(b"*", idx + 1)
+
+    def _add_run(self, start, end):
+        label = self._next_label
+        self._next_label += 1
+        self.runs[label] = (start, end, int(self.schematic.cells[start:end]))
+        self.labels[start:end] = array("i", [label]) * (end - start)
+        return label
+
+    def _remove_run(self, label):
+        start, end, value = self.runs.pop(label)
+        self.labels[start:end] = array("i", [-1]) * (end - start)
+        if label in self.parts:
+            self.parts.remove(label)
+            self.sum_of_part_numbers -= value
+
+    def _update_part(self, label):
+        cells, width = self.schematic.cells, self.schematic.width
+        start, end, value = self.runs[label]
+        is_part = any(
+            cells[start - 1 + row_offset : end + 1 + row_offset].translate(None, NOT_SYMBOLS)
+            for row_offset in (-width, 0, width)
+        )
+        if is_part and label not in self.parts:
+            self.parts.add(label)
+            self.sum_of_part_numbers += value
+        elif not is_part and label in self.parts:
+            self.parts.remove(label)
+            self.sum_of_part_numbers -= value
+
+    def _update_gear(self, idx):
+        self.sum_of_gear_ratios -= self.gear_ratios.pop(idx, 0)
+        if self.schematic.cells[idx] != ord("*"):
+            return
+        adjacent = {self.labels[idx + offset] for offset in self.neighbour_offsets}
+        adjacent.discard(-1)
+        if len(adjacent) == 2:
+            first, second = adjacent
+            ratio = self.runs[first][2] * self.runs[second][2]
+            self.gear_ratios[idx] = ratio
+            self.sum_of_gear_ratios += ratio
+
+    def _stars_around(self, start, end):
+        # every star in the box around the span [start, end)
+        cells, width = self.schematic.cells, self.schematic.width
+        stars = []
+        for row_offset in (-width, 0, width):
+            idx = cells.find(b"*", start - 1 + row_offset, end + 1 + row_offset)
+            while idx != -1:
+                stars.append(idx)
+                idx = cells.find(b"*", idx + 1, end + 1 + row_offset)
+        return stars
+
+    def edit(self, row, col, char):
+        """Sets the cell at (row, col) of the unpadded schematic to `char`."""
+        if not (0 <= row < self.schematic.height - 2 and 0 <= col < self.schematic.width - 2):
+            raise IndexError(f"({row}, {col}) is outside the schematic")
+        cells, labels = self.schematic.cells, self.labels
+        idx = (row + 1) * self.schematic.width + col + 1
+        if cells[idx] == ord(char):
+            return
+
+        # the runs on this row the edit can split, join, grow or change
+        touched = {labels[idx - 1], labels[idx], labels[idx + 1]}
+        touched.discard(-1)
+        left, right = idx, idx + 1
+        stars = {idx}
+        for label in touched:
+            start, end, _ = self.runs[label]
+            left, right = min(left, start), max(right, end)
+            stars.update(self._stars_around(start, end))
+            self._remove_run(label)
+
+        cells[idx] = ord(char)
+
+        # cells just outside [left, right) aren't digits, so its runs are complete
+        added = [self._add_run(*match.span()) for match in NUMBER.finditer(cells, left, right)]
+        for label in added:
+            stars.update(self._stars_around(*self.runs[label][:2]))
+
+        # a symbol appearing or going away can flip the runs around it
+        around = {labels[idx + offset] for offset in self.neighbour_offsets}
+        around.discard(-1)
+        for label in around.union(added):
+            self._update_part(label)
+        stars.update(idx + offset for offset in self.neighbour_offsets)
+        for star in stars:
+            self._update_gear(star)
+
+def solve_tile(rows, above=None, below=None):
+    """`(sum of part numbers, sum of gear ratios)` of the rows of one tile.
+
+    `above` and `below` are the rows just outside the tile (None at the
+    edges of the schematic). They are only looked at, never counted: every
+    number and every gear sits on exactly one row, so the tile owning that
+    row is the only one to count it. Blank rows are skipped, like
+    `StreamingSchematicAnalyzer.analyze` does. With numpy, the tile goes
+    through the vectorized analyzer, otherwise through the streaming one.
+    """
+    rows = [row for row in (row.rstrip(b"\r\n") for row in rows) if row]
+    above = above.rstrip(b"\r\n") or None if above is not None else None
+    below = below.rstrip(b"\r\n") or None if below is not None else None
+    if not rows:
+        return 0, 0
+    if np is not None:
+        window = ([above] if above is not None else []) + rows + ([below] if below is not None else [])
+        analyzer = EngineSchematicAnalyzer(b"\n".join(window).decode(), vectorized=True)
+        first_owned = 0 if above is None else 1
+        return analyzer._sums_of_rows(first_owned, first_owned + len(rows))
+
+    analyzer = StreamingSchematicAnalyzer()
+    events = []
+    for row in ([above] if above is not None else []) + list(rows) + ([below] if below is not None else []):
+        events.extend(analyzer.push(row))
+    events.extend(analyzer.finish())
+
+    first_owned = 0 if above is None else 1
+    parts = gears = 0
+    for kind, row, _, value in events:
+        if first_owned <= row < first_owned + len(rows):
+            if kind == "part":
+                parts += value
+            else:
+                gears += value
+    return parts, gears
+
+def _solve_file_range(path, start, end):
+    # a worker's tile of a schematic file: the rows in [start, end) plus the
+    # row before and after it, all rows having the length of the first
+    with open(path, "rb") as f:
+        row_length = len(f.readline())
+        above = None
+        if start:
+            f.seek(start - row_length)
+            above = f.read(row_length)
+        f.seek(start)
+        rows = f.read(end - start).splitlines()
+        below = f.readline() or None
+    return solve_tile(rows, above, below)
+
+def solve_file_tiled(input_path, processes=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    # both sums of a schematic file too big to load, in tiles of about
+    # chunk_size bytes across a process pool
+    results = list(map_ranges(input_path, _solve_file_range, processes, chunk_size))
+    return sum(parts for parts, _ in results), sum(gears for _, gears in results)
 
 # solves the Part 1 of the problem
-def part_1():
-    with open("day_3/input.txt") as file:
+def part_1(input_path="day_3/input.txt"):
+    with open(input_path) as file:
         engine_schematic = file.read()
 
     analyzer = EngineSchematicAnalyzer(engine_schematic)
     total_sum = analyzer.calculate_sum_of_part_numbers()
     print(f"Sum of part numbers is {total_sum}")
+    return total_sum
 
 # solves the Part 2 of the problem
-def part_2():
-    with open("day_3/input.txt") as file:
+def part_2(input_path="day_3/input.txt"):
+    with open(input_path) as file:
         engine_schematic = file.read()
     
     analyzer = EngineSchematicAnalyzer(engine_schematic)
     total_sum = analyzer.calculate_sum_of_all_gear_ratios()
     print(f"Sum of all gear ratios is {total_sum}")
+    return total_sum
 
 def test_sum_of_part_numbers():
     engine_schematic = """467..114..
@@ -118,8 +516,129 @@ def test_sum_of_part_numbers():
     analyzer = EngineSchematicAnalyzer(engine_schematic)
     calculated_sum = analyzer.calculate_sum_of_part_numbers()
     assert calculated_sum == 4361, f"sum of part numbers is {calculated_sum}"
+
+    # numbers longer than 64 bits
+    analyzer = EngineSchematicAnalyzer("12345678901234567890123*2\n", vectorized=False)
+    assert analyzer.calculate_sum_of_part_numbers() == 12345678901234567890123 + 2
     print("test_sum_of_part_numbers passed successfully!")
 
+def test_vectorized_mode():
+    if np is None:
+        return
+    import random
+
+    # random schematics, including numbers on the border and digit runs
+    # touching several stars, give the same answers in both modes
+    rng = random.Random(3)
+    for _ in range(50):
+        rows = ["".join(rng.choice("....0123456789*#+") for _ in range(12)) for _ in range(9)]
+        schematic = "\n".join(rows)
+        scalar = EngineSchematicAnalyzer(schematic, vectorized=False)
+        vectorized = EngineSchematicAnalyzer(schematic, vectorized=True)
+        assert vectorized.part_labels() == scalar.part_labels()
+        assert list(vectorized.values) == list(scalar.values)
+        assert vectorized.gears() == scalar.gears()
+        assert vectorized.calculate_sum_of_part_numbers() == scalar.calculate_sum_of_part_numbers()
+        assert vectorized.calculate_sum_of_all_gear_ratios() == scalar.calculate_sum_of_all_gear_ratios()
+    assert EngineSchematicAnalyzer("...\n", vectorized=True).calculate_sum_of_part_numbers() == 0
+    # products and runs past 64 bits
+    for schematic in ("12345678901*98765432109\n", "1234567890123456789012*3\n"):
+        scalar = EngineSchematicAnalyzer(schematic, vectorized=False)
+        vectorized = EngineSchematicAnalyzer(schematic, vectorized=True)
+        assert vectorized.calculate_sum_of_part_numbers() == scalar.calculate_sum_of_part_numbers()
+        assert vectorized.calculate_sum_of_all_gear_ratios() == scalar.calculate_sum_of_all_gear_ratios()
+    assert vectorized.calculate_sum_of_all_gear_ratios() == 1234567890123456789012 * 3
+    print("test_vectorized_mode passed successfully!")
+
+def test_streaming_analyzer():
+    import random
+
+    engine_schematic = """467..114..
+...*......
+..35..633.
+......#...
+617*......
+.....+.58.
+..592.....
+......755.
+...$.*....
+.664.598..
+"""
+    analyzer = StreamingSchematicAnalyzer()
+    events = list(analyzer.analyze(engine_schematic.splitlines()))
+    assert (analyzer.sum_of_part_numbers, analyzer.sum_of_gear_ratios) == (4361, 467835)
+    # the gear at (1, 3) pairs numbers from the rows above and below
+    assert ("gear", 1, 3, 467 * 35) in events and ("part", 9, 1, 664) in events
+
+    rng = random.Random(4)
+    for _ in range(50):
+        rows = ["".join(rng.choice("....0123456789*#+") for _ in range(12)) for _ in range(rng.randint(1, 9))]
+        streaming = StreamingSchematicAnalyzer()
+        for _ in streaming.analyze(row + "\n" for row in rows):
+            pass
+        whole = EngineSchematicAnalyzer("\n".join(rows), vectorized=False)
+        assert streaming.sum_of_part_numbers == whole.calculate_sum_of_part_numbers()
+        assert streaming.sum_of_gear_ratios == whole.calculate_sum_of_all_gear_ratios()
+    print("test_streaming_analyzer passed successfully!")
+
+def test_tiled_mode():
+    import os
+    import random
+    import sys
+    import tempfile
+
+    from aoc.testing import numpy_modes
+
+    # a schematic of many tiles, as written, with a trailing blank line and with CRLF newlines
+    rng = random.Random(5)
+    rows = ["".join(rng.choice("....0123456789*#+") for _ in range(12)) for _ in range(40)]
+    whole = EngineSchematicAnalyzer("\n".join(rows))
+    expected = (whole.calculate_sum_of_part_numbers(), whole.calculate_sum_of_all_gear_ratios())
+    scalar = EngineSchematicAnalyzer("\n".join(rows), vectorized=False)
+    assert (scalar.calculate_sum_of_part_numbers(), scalar.calculate_sum_of_all_gear_ratios()) == expected
+
+    for text in ("\n".join(rows) + "\n", "\n".join(rows) + "\n\n", "\r\n".join(rows) + "\r\n"):
+        analyzer = EngineSchematicAnalyzer(text)
+        assert (analyzer.calculate_sum_of_part_numbers(processes=2), analyzer.calculate_sum_of_all_gear_ratios(processes=2)) == expected
+        with tempfile.NamedTemporaryFile("wb", suffix=".txt", delete=False) as f:
+            f.write(text.encode())
+        try:
+            # chunks of one byte give tiles of one row, so every number and gear sits on a tile boundary
+            for _ in numpy_modes(sys.modules[__name__]):
+                for chunk_size in (1, 40, 1 << 20):
+                    assert solve_file_tiled(f.name, 1, chunk_size) == expected
+            assert solve_file_tiled(f.name, 2, 100) == expected
+        finally:
+            os.remove(f.name)
+    print("test_tiled_mode passed successfully!")
+
+def test_incremental_analyzer():
+    import random
+
+    rng = random.Random(6)
+    rows = [list("".join(rng.choice("....0123456789*#+") for _ in range(10))) for _ in range(8)]
+    analyzer = IncrementalSchematicAnalyzer("\n".join(map("".join, rows)))
+    for _ in range(2000):
+        row, col, char = rng.randrange(8), rng.randrange(10), rng.choice("...0123456789**#")
+        analyzer.edit(row, col, char)
+        rows[row][col] = char
+        whole = EngineSchematicAnalyzer("\n".join(map("".join, rows)), vectorized=False)
+        assert analyzer.sum_of_part_numbers == whole.calculate_sum_of_part_numbers()
+        assert analyzer.sum_of_gear_ratios == whole.calculate_sum_of_all_gear_ratios()
+
+    analyzer = IncrementalSchematicAnalyzer("467..\n...*.\n..35.\n")
+    assert (analyzer.sum_of_part_numbers, analyzer.sum_of_gear_ratios) == (467 + 35, 467 * 35)
+    analyzer.edit(0, 3, "1")  # 467 becomes 4671
+    assert (analyzer.sum_of_part_numbers, analyzer.sum_of_gear_ratios) == (4671 + 35, 4671 * 35)
+    analyzer.edit(1, 3, ".")
+    assert (analyzer.sum_of_part_numbers, analyzer.sum_of_gear_ratios) == (0, 0)
+    try:
+        analyzer.edit(3, 0, "1")
+        assert False, "edits outside the schematic should fail"
+    except IndexError:
+        pass
+    print("test_incremental_analyzer passed successfully!")
+
 def test_sum_of_all_gear_ratios():
     engine_schematic = """467..114..
 ...*......
@@ -135,12 +654,20 @@ def test_sum_of_all_gear_ratios():
     analyzer = EngineSchematicAnalyzer(engine_schematic)
     calculated_sum = analyzer.calculate_sum_of_all_gear_ratios()
     assert calculated_sum == 467835, f"sum of all gear ratios is {calculated_sum}"
+
+    # two different parts with the same number still make a gear
+    assert EngineSchematicAnalyzer("12*12\n").calculate_sum_of_all_gear_ratios() == 144
+    assert EngineSchematicAnalyzer("7..\n.*.\n7.7\n").calculate_sum_of_all_gear_ratios() == 0
     print("test_sum_of_all_gear_ratios passed successfully!")
 
 if __name__ == "__main__":
     # base test cases
     test_sum_of_part_numbers()
     test_sum_of_all_gear_ratios()
+    test_vectorized_mode()
+    test_streaming_analyzer()
+    test_tiled_mode()
+    test_incremental_analyzer()
 
     # run the main function using the input file
     part_1() 
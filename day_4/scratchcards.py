@@ -1,46 +1,79 @@
 # --- Day 4: Scratchcards ---
 
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from aoc.chunks import line_aligned_ranges, read_range
+from aoc.parsing import ints_per_line, ints_per_line_numpy
+
+# numpy is optional, it counts whole batches of cards at once
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# cells of the per-batch presence matrix (cards x largest number), which
+# bounds its memory whatever the input size
+BATCH_CELLS = 1 << 22
+# larger numbers make the presence rows too wide to pay off, so they take
+# the int bitmask path instead
+MAX_VECTORIZED_NUMBER = 1 << 12
+
+
 class ScratchCardProcessor:
     """Processes scratch cards to calculate total points and total scratchcards."""
     
     def __init__(self, scratchcards: str):
         """Initializes the processor with a string of scratchcards."""
         self.scratchcards = scratchcards
-        self.repository = {self._get_card_id(scratchcard): 1 for scratchcard in self._get_lines()}
+        self.card_ids, self.match_counts = self._parse_cards()
 
     def calculate_total_points(self) -> int:
         """Calculates the total points from all scratchcards."""
-        return sum(self._calculate_points(scratchcard) for scratchcard in self._get_lines())
+        return sum(self._calculate_points(match_count) for match_count in self.match_counts)
     
     def calculate_total_scratchcards(self) -> int:
-        """Calculates the total number of scratchcards."""
-        for scratchcard in self._get_lines():
-            card_id = self._get_card_id(scratchcard)
-            match_count = self._get_match_count(scratchcard)
-            for i in range(1, match_count + 1):
-                self.repository[card_id + i] += self.repository[card_id]
-        
-        return sum(self.repository.values())
-
-    def _get_lines(self):
-        """Splits the scratchcards string into individual lines."""
-        return self.scratchcards.splitlines()
-
-    def _get_card_id(self, scratchcard: str) -> int:
-        """Extracts the card ID from a scratchcard string."""
-        return int(scratchcard.split(":")[0].split()[1])
-
-    def _get_match_count(self, scratchcard: str) -> int:
-        """Calculates the match count for a scratchcard."""
-        _, numbers = scratchcard.split(": ")
-        winning_numbers, your_numbers = (set(map(int, ns.split())) for ns in numbers.split(" | "))
-        return len(your_numbers & winning_numbers)
-
-    def _calculate_points(self, scratchcard: str) -> int:
+        """Calculates the total number of scratchcards.
+
+        A card with `m` matches adds its copies to each of the next `m`
+        cards. Rather than looping over those cards, the copies are added
+        to a difference array once at the start of that range and taken
+        off once past its end, so the whole cascade is O(cards).
+        """
+        card_count = len(self.match_counts)
+        # a list, not an array: copy counts can outgrow 64 bits on big inputs
+        extra_copies = [0] * (card_count + 1)
+        total = running = 0
+        for card, match_count in enumerate(self.match_counts):
+            running += extra_copies[card]
+            copies = 1 + running
+            total += copies
+            if match_count:
+                extra_copies[card + 1] += copies
+                extra_copies[min(card + 1 + match_count, card_count)] -= copies
+        return total
+
+    @classmethod
+    def from_file(cls, path, chunk_size=1 << 20):
+        """Reads a card file in line-aligned chunks, so only ids and match counts are kept."""
+        processor = cls("")
+        for start, end in line_aligned_ranges(path, chunk_size):
+            count_matches(read_range(path, start, end), processor.card_ids, processor.match_counts)
+        return processor
+
+    def _parse_cards(self):
+        """Parses every card once into its id and match count."""
+        return count_matches(self.scratchcards, array("q"), array("H"))
+
+    def _calculate_points(self, match_count: int) -> int:
         """Calculates points for a single scratchcard."""
-        match_count = self._get_match_count(scratchcard)
         return 0 if match_count == 0 else 2 ** (match_count - 1)
 
+    def totals(self):
+        """`(total points, total scratchcards)` from the one parse."""
+        return self.calculate_total_points(), self.calculate_total_scratchcards()
+
     @staticmethod
     def test_calculate_total_points():
         scratchcards = """Card 1: 41 48 83 86 17 | 83 86  6 31 17  9 48 53
@@ -67,26 +100,154 @@ Card 6: 31 18 13 56 72 | 74 77 10 23 35 67 36 11
         processor = ScratchCardProcessor(scratchcards)
         total_scratchcards = processor.calculate_total_scratchcards()
         assert total_scratchcards == 30, f"Expected 30, got {total_scratchcards}"
+        # asking again doesn't add the copies a second time
+        assert processor.calculate_total_scratchcards() == 30
         print("test_calculate_total_scratchcards passed!")
 
-def part_1():
-    with open("day_4/input.txt") as f:
+    @staticmethod
+    def test_process_card_files():
+        import shutil
+        import tempfile
+
+        directory = tempfile.mkdtemp()
+        try:
+            paths = []
+            for name, cards in [("sample", "Card 1: 41 48 | 83 48\nCard 2: 13 32 | 61 30\nCard 3: 1 21 | 1 21\n"), ("empty", "")]:
+                paths.append(os.path.join(directory, name))
+                with open(paths[-1], "w") as f:
+                    f.write(cards)
+            for processes in (1, 2):
+                assert list(process_card_files(paths, processes)) == [(paths[0], 1 + 2, 1 + 2 + 1), (paths[1], 0, 0)]
+                assert list(process_card_files(iter(paths), processes)) == list(process_card_files(paths, processes))
+        finally:
+            shutil.rmtree(directory)
+        print("test_process_card_files passed!")
+
+    @staticmethod
+    def test_count_matches():
+        import random
+        import sys
+        import tempfile
+
+        from aoc.testing import numpy_modes
+
+        rng = random.Random(7)
+        cards = "".join(
+            f"Card {card}: {' '.join(map(str, rng.sample(range(1, 100), 10)))} | {' '.join(str(rng.randint(1, 99)) for _ in range(25))}\n"
+            for card in range(1, 2001)
+        )
+        # the set intersection the counts used to come from, duplicates counted once
+        expected = []
+        for line in cards.splitlines():
+            winning, held = line.split(":")[1].split("|")
+            expected.append(len(set(winning.split()) & set(held.split())))
+
+        for _ in numpy_modes(sys.modules[__name__]):
+            assert list(ScratchCardProcessor(cards).match_counts) == expected
+            # numbers too large for the presence matrix
+            assert list(ScratchCardProcessor("Card 1: 5 99999 | 99999 5 7\nCard 2: 1 2 | 3 4\n").match_counts) == [2, 0]
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+            f.write(cards)
+        try:
+            processor = ScratchCardProcessor.from_file(f.name, chunk_size=4096)
+            assert list(processor.match_counts) == expected and list(processor.card_ids) == list(range(1, 2001))
+        finally:
+            os.remove(f.name)
+        print("test_count_matches passed!")
+
+def count_matches(cards, card_ids, match_counts):
+    """Appends the id and match count of every card in `cards` (str or bytes) to the two arrays.
+
+    Numbers are small, so a card's winning and held numbers become two
+    bitmasks and its match count the popcount of their AND: Python ints
+    one card at a time, or with numpy, packed bit arrays for a batch of
+    cards at once.
+    """
+    newline, bar = (b"\n", b"|") if isinstance(cards, bytes) else ("\n", "|")
+    # every card has the same shape: `Card <id>: <winning> | <yours>`
+    winning_count = len(cards.partition(newline)[0].partition(bar)[0].split()) - 2
+
+    if np is not None:
+        values, offsets = ints_per_line_numpy(cards)
+        card_count = len(offsets) - 1
+        numbers_per_card = int(offsets[1]) if card_count else 0
+        if card_count and (np.diff(offsets) == numbers_per_card).all():
+            table = values.reshape(card_count, numbers_per_card)
+            largest = int(table[:, 1:].max()) if numbers_per_card > 1 else 0
+            if largest <= MAX_VECTORIZED_NUMBER:
+                card_ids.extend(table[:, 0].tolist())
+                batch_cards = max(1, BATCH_CELLS // (largest + 1))
+                for start in range(0, card_count, batch_cards):
+                    match_counts.extend(_count_matches_vectorized(table[start : start + batch_cards], winning_count).tolist())
+                return card_ids, match_counts
+
+    values, offsets = ints_per_line(cards)
+    for start, end in zip(offsets, offsets[1:]):
+        winning = held = 0
+        for number in values[start + 1 : start + 1 + winning_count]:
+            winning |= 1 << number
+        for number in values[start + 1 + winning_count : end]:
+            held |= 1 << number
+        card_ids.append(values[start])
+        match_counts.append((winning & held).bit_count())
+    return card_ids, match_counts
+
+def _count_matches_vectorized(table, winning_count):
+    # one row per card: presence of each number as a bit, packed 8 per byte
+    rows = np.arange(len(table))[:, None]
+    numbers = table[:, 1:]
+    winning = np.zeros((len(table), int(numbers.max()) + 1), dtype=bool)
+    held = np.zeros_like(winning)
+    winning[rows, numbers[:, :winning_count]] = True
+    held[rows, numbers[:, winning_count:]] = True
+    common = np.packbits(winning, axis=1) & np.packbits(held, axis=1)
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(common).sum(axis=1, dtype=np.int64)
+    # numpy < 2.0 has no popcount
+    return np.unpackbits(common, axis=1).sum(axis=1, dtype=np.int64)
+
+def _file_totals(path):
+    return path, *ScratchCardProcessor.from_file(path).totals()
+
+def process_card_files(paths, processes=None):
+    """Yields `(path, total points, total scratchcards)` for many card files, in order.
+
+    Each file is read and parsed once for both totals; with more than one
+    process the files are spread over a process pool.
+    """
+    processes = processes or os.cpu_count() or 1
+    if processes == 1:
+        yield from map(_file_totals, paths)
+        return
+    # any iterable of paths, the chunk size needs their count
+    paths = list(paths)
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        yield from executor.map(_file_totals, paths, chunksize=max(1, len(paths) // (processes * 4)))
+
+def part_1(input_path="day_4/input.txt"):
+    with open(input_path) as f:
         scratchcards = f.read()
 
     processor = ScratchCardProcessor(scratchcards)
-    print(f"Total points: {processor.calculate_total_points()}")
+    total_points = processor.calculate_total_points()
+    print(f"Total points: {total_points}")
+    return total_points
 
-def part_2():
-    with open("day_4/input.txt") as f:
+def part_2(input_path="day_4/input.txt"):
+    with open(input_path) as f:
         scratchcards = f.read()
 
     processor = ScratchCardProcessor(scratchcards)
-    print(f"Total scratchcards: {processor.calculate_total_scratchcards()}")
+    total_scratchcards = processor.calculate_total_scratchcards()
+    print(f"Total scratchcards: {total_scratchcards}")
+    return total_scratchcards
 
 if __name__ == "__main__":
     ScratchCardProcessor.test_calculate_total_points()
     part_1()
 
     ScratchCardProcessor.test_calculate_total_scratchcards()
+    ScratchCardProcessor.test_process_card_files()
+    ScratchCardProcessor.test_count_matches()
     part_2()
 
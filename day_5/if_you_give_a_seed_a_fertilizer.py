@@ -1,6 +1,8 @@
 # --- Day 5: If You Give A Seed A Fertilizer ---
 
-import multiprocessing
+from bisect import bisect_right
+
+from aoc.parsing import ints
 
 class AlmanacProcessor:
     def __init__(self, almanac):
@@ -8,76 +10,70 @@ class AlmanacProcessor:
         # self.seeds, self.mappings = self._parse_input(almanac) # part one
         self.seed_ranges, self.mappings = self._parse_input(almanac)
 
-    def _process_sub_range(self, start, end):
-        """Process a sub-range of seeds and find the lowest location number in the sub-range."""
-        lowest_location = float('inf')
-        for seed in range(start, end):          
-            current_number = seed
-            for map_data in self.mappings:
-                current_number = self._find_mapped_number(current_number, map_data)
-            lowest_location = min(lowest_location, current_number)
-        print(f"Finished processing seed range: {start} to {end}, lowest location: {lowest_location}")
-        return lowest_location
-
-    def _process_seed_range(self, start, length, pool):
-        """Process a range of seeds in parallel sub-ranges."""
-        sub_range_size = 1000
-        results = []
-        for sub_start in range(start, start + length, sub_range_size):
-            sub_end = min(sub_start + sub_range_size, start + length)
-            print(f"Spawning a sub-process process for seed range: {sub_start} to {sub_end}")
-            result = pool.apply_async(self._process_sub_range, args=(sub_start, sub_end))
-            results.append(result)
-        # Retrieve and compare the results from each sub-range
-        return min(result.get() for result in results)
-
     def find_lowest_location_number(self):
-        """Finds the lowest location number using parallel processing."""
-        with multiprocessing.Pool() as pool:
-            range_results = []
-            for i in range(0, len(self.seed_ranges), 2):
-                start = int(self.seed_ranges[i])
-                length = int(self.seed_ranges[i + 1])
-                print(f"Spawning a process for seed range: {start} to {start + length}")
-                range_result = self._process_seed_range(start, length, pool)
-                range_results.append(range_result)
-            # Retrieve and compare the results from each range
-            lowest_location = min(range_results)
-        return lowest_location
-
-    # def find_lowest_location_number(self):
-    #     """Finds the lowest location number based on the almanac's rules."""
-    #     lowest_location = float('inf')
-    #     for i in range(0, len(self.seed_ranges), 2):
-    #         start = int(self.seed_ranges[i])
-    #         length = int(self.seed_ranges[i + 1])
-    #         print(f"Processing seed from {start} to {start + length}")
-
-    #         for seed in range(start, start + length):          
-    #             current_number = seed
-
-    #             for map_data in self.mappings:
-    #                 current_number = self._find_mapped_number(current_number, map_data)
-    #             lowest_location = min(lowest_location, current_number)
-    #     return lowest_location
-
+        """Finds the lowest location number of any seed in the seed ranges.
+
+        Rather than mapping seeds one by one, whole [start, end) ranges go
+        through each map, split wherever a map entry begins or ends, so the
+        work depends on the number of ranges and map entries, not seeds.
+        """
+        ranges = [
+            (self.seed_ranges[i], self.seed_ranges[i] + self.seed_ranges[i + 1])
+            for i in range(0, len(self.seed_ranges), 2)
+        ]
+        for map_data in self.mappings:
+            ranges = self._map_ranges(ranges, map_data)
+        return min(start for start, _ in ranges)
+
+    def _map_ranges(self, ranges, map_data):
+        """Maps [start, end) ranges through one map, splitting them at its entries."""
+        entries = sorted(map_data, key=lambda entry: entry[1])
+        source_starts = [src_start for _, src_start, _ in entries]
+        mapped = []
+        for start, end in ranges:
+            # the entry that could hold `start`, the ones after it follow in order
+            i = max(bisect_right(source_starts, start) - 1, 0)
+            while start < end and i < len(entries):
+                dest_start, src_start, length = entries[i]
+                if src_start + length <= start:
+                    i += 1
+                    continue
+                if src_start >= end:
+                    break
+                # the gap before this entry maps to itself
+                if start < src_start:
+                    mapped.append((start, src_start))
+                    start = src_start
+                piece_end = min(end, src_start + length)
+                mapped.append((start - src_start + dest_start, piece_end - src_start + dest_start))
+                start = piece_end
+                i += 1
+            if start < end:
+                mapped.append((start, end))
+        return self._merge_ranges(mapped)
+
+    def _merge_ranges(self, ranges):
+        """Sorts ranges and joins the overlapping or touching ones, so their number stays small."""
+        merged = []
+        for start, end in sorted(ranges):
+            if merged and start <= merged[-1][1]:
+                if end > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], end)
+            else:
+                merged.append((start, end))
+        return merged
 
     def _parse_input(self, input_data):
         """Parses the input data into seed ranges and mappings."""
         sections = input_data.strip().split('\n\n')
-        seed_ranges = sections[0].split(': ')[1].split()
-        mappings = [section.split(':\n')[1].split('\n') for section in sections[1:]]
-        return seed_ranges, mappings   
-    
-    def _find_mapped_number(self, number, map_data):
-        """Finds the corresponding mapped number based on the mapping rules."""
-        for line in map_data:
-            if line.strip():
-                dest_start, src_start, length = map(int, line.split())
-                if src_start <= number < src_start + length:
-                    return dest_start + (number - src_start)
-        return number
-    
+        seed_ranges = list(ints(sections[0]))
+        # parsed once into (dest, src, length) triples instead of re-splitting per seed
+        mappings = []
+        for section in sections[1:]:
+            numbers = ints(section)
+            mappings.append([tuple(numbers[i:i + 3]) for i in range(0, len(numbers), 3)])
+        return seed_ranges, mappings
+
     # part One assumes seeds to be given as a list of integers
     # def _parse_input(self, input_data):
     #     """Parses the input data into seeds and mappings."""
@@ -86,13 +82,14 @@ class AlmanacProcessor:
     #     mappings = [section.split(':\n')[1].split('\n') for section in sections[1:]]
     #     return seeds, mappings
 
-def main():
-    with open("day_5/input.txt", "r") as f:
+def main(input_path="day_5/input.txt"):
+    with open(input_path, "r") as f:
         almanac = f.read()
 
     processor = AlmanacProcessor(almanac)
     lowest_location = processor.find_lowest_location_number()
     print("The lowest location number is:", lowest_location)
+    return lowest_location
 
 
 def test_find_lowest_location_number():
@@ -135,11 +132,35 @@ humidity-to-location map:
     lowest_location = processor.find_lowest_location_number()
     # assert lowest_location == 35, f"Tst failed: Expected 35, got {lowest_location}" # As per part 1 logic for seeds
     assert lowest_location == 46, f"Tst failed: Expected 35, got {lowest_location}" # As per part 2 logic for seeds
+
+    # random almanacs against mapping every seed one by one
+    import random
+    rng = random.Random(5)
+    for _ in range(50):
+        seeds = [n for _ in range(3) for n in (rng.randrange(100), rng.randrange(1, 30))]
+        sections = []
+        for _ in range(4):
+            # non-overlapping source ranges, like the real maps
+            bounds = sorted(rng.sample(range(150), 6))
+            entries = [(rng.randrange(150), bounds[i], bounds[i + 1] - bounds[i]) for i in range(0, 6, 2)]
+            sections.append("x-to-y map:\n" + "\n".join(" ".join(map(str, entry)) for entry in entries))
+        processor = AlmanacProcessor(f"seeds: {' '.join(map(str, seeds))}\n\n" + "\n\n".join(sections))
+
+        def location(seed):
+            for map_data in processor.mappings:
+                for dest_start, src_start, length in map_data:
+                    if src_start <= seed < src_start + length:
+                        seed = dest_start + seed - src_start
+                        break
+            return seed
+
+        brute_force = min(location(seed) for i in range(0, 6, 2) for seed in range(seeds[i], seeds[i] + seeds[i + 1]))
+        assert processor.find_lowest_location_number() == brute_force
+    assert processor._merge_ranges([(5, 8), (0, 2), (2, 3), (7, 9)]) == [(0, 3), (5, 9)]
     print("All tests passed succesfully!")
 
 
 if __name__ == "__main__":
-    # Uncomment the line below to run the test
     test_find_lowest_location_number()
 
-    # main()
+    main()
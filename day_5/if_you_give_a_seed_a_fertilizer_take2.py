@@ -2,6 +2,10 @@
 
 # --- Part Two ---
 
+from aoc.inputs import MappedInput, iter_blocks
+from aoc.parsing import ints
+
+
 class AlmanacProcessor:
     def __init__(self, almanac):
         self.seeds = []
@@ -10,9 +14,16 @@ class AlmanacProcessor:
 
     def _parse_input(self, almanac):
         """Parses the input sections into seeds and maps."""
-        self.sections = [block.splitlines() for block in almanac.strip().split("\n\n")]
-        self.seeds = [int(i) for i in self.sections[0][0].split()[1:]]
-        self.maps = [[list(map(int, line.split())) for line in block[1:]] for block in self.sections[1:]]
+        # a str, or the raw bytes of a mapped input
+        if isinstance(almanac, str):
+            almanac = almanac.encode()
+        seeds_block, *map_blocks = iter_blocks(almanac)
+        self.seeds = list(ints(seeds_block))
+        # the `x-to-y map:` headers hold no numbers, the rest are (dest, src, length) triples
+        self.maps = []
+        for block in map_blocks:
+            numbers = ints(block)
+            self.maps.append([tuple(numbers[i : i + 3]) for i in range(0, len(numbers), 3)])
 
     def process_maps(self):
         """Processes each map to convert the ranges according to the almanac."""
@@ -82,15 +93,14 @@ humidity-to-location map:
     assert lowest_location == 46, f"Tst failed: Expected 35, got {lowest_location}" # As per part 2 logic for seeds
     print("All tests passed succesfully!")
 
-def main():
-    with open("day_5/input.txt", "r") as f:
-        almanac = f.read()
-
-    processor = AlmanacProcessor(almanac)
+def main(input_path="day_5/input.txt"):
+    with MappedInput(input_path) as almanac:
+        processor = AlmanacProcessor(almanac.data)
     values = processor.process_maps()
     min_location = processor.find_minimum_location(values)
 
     print(f"Minimum location number: {min_location}")
+    return min_location
 
 if __name__ == "__main__":
     test_find_lowest_location_number()
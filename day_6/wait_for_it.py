@@ -63,23 +63,25 @@ class RaceAnalyzer:
         return prod
 
 
-def part_1():
+def part_1(input_path="day_6/input.txt"):
     analyzer = RaceAnalyzer()
-    with open("day_6/input.txt", "r") as f:
+    with open(input_path, "r") as f:
         raw_race_records = f.read()
 
     race_records = analyzer.parse_race_records_part_1(raw_race_records)
     margin_of_error = analyzer.product_of_ways_to_win(race_records)
     print(f"Margin of error: {margin_of_error}")
+    return margin_of_error
 
-def part_2():
+def part_2(input_path="day_6/input.txt"):
     analyzer = RaceAnalyzer()
-    with open("day_6/input.txt", "r") as f:
+    with open(input_path, "r") as f:
         raw_race_records = f.read()
 
     race_records = analyzer.parse_race_records_part_2(raw_race_records)
     margin_of_error = analyzer.product_of_ways_to_win(race_records)
     print(f"Margin of error: {margin_of_error}")
+    return margin_of_error
 
 def test_find_number_of_ways_to_win_part_1():
     raw_race_records = """Time:      7  15   30
@@ -3,6 +3,8 @@
 ## Part 2
 from collections import Counter
 
+from aoc.parsing import tokens
+
 
 class CamelCardsGame:
     HAND_STRENGTH_ORDER = [
@@ -20,8 +22,9 @@ class CamelCardsGame:
         self.hands = self.parse_input(hands_input_str)
 
     def parse_input(self, input_str):
-        lines = input_str.strip().split("\n")
-        return [(line.split()[0], int(line.split()[1])) for line in lines]
+        # hands and bids alternate in a single token scan
+        found = tokens(input_str)
+        return [(hand.decode(), int(bid)) for hand, bid in zip(found[0::2], found[1::2])]
 
     def classify_hand(self, hand):
         counts = Counter(hand).most_common()
@@ -81,12 +84,13 @@ class CamelCardsGame:
         return total_winnings
 
 
-def part_2():
-    with open("day_7/input.txt", "r") as f:
+def part_2(input_path="day_7/input.txt"):
+    with open(input_path, "r") as f:
         hands_input = f.read()
     game = CamelCardsGame(hands_input)
     total_winnings = game.calculate_winnings()
     print(f"Total winnings: {total_winnings}")
+    return total_winnings
 
 
 def test_calculate_winnings():
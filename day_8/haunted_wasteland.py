@@ -144,19 +144,20 @@ XXX = (XXX, XXX)"""
 
 
 # part 1
-def navigate_through_desert():
-    with open("day_8/input.txt") as file:
+def navigate_through_desert(input_path="day_8/input.txt"):
+    with open(input_path) as file:
         navigation_data = file.read()
 
     navigator = DesertNavigator()
     navigator.load_navigation_data(navigation_data)
     steps = navigator.navigate_desert()
     print(f"Steps to reach destination: {steps}")
+    return steps
 
 
 # part 2
-def navigate_through_desert_as_ghosts():
-    with open("day_8/input.txt") as file:
+def navigate_through_desert_as_ghosts(input_path="day_8/input.txt"):
+    with open(input_path) as file:
         navigation_data = file.read()
 
     navigator = DesertNavigator()
@@ -164,6 +165,7 @@ def navigate_through_desert_as_ghosts():
     # steps = navigator.navigate_desert_as_ghosts()
     steps = navigator.navigate_through_desert_as_ghosts_lcm()
     print(f"Steps to reach destination as ghosts: {steps}")
+    return steps
 
 
 if __name__ == "__main__":
@@ -1,11 +1,15 @@
 # --- Day 9: Mirage Maintenance ---
 
+from aoc.parsing import ints_per_line, rows
+
+
 class OasisAnalyzer:
     def __init__(self, report):
-        self.report = report.splitlines()
+        # every history parsed once, in a single scan of the report
+        self.histories = rows(*ints_per_line(report, signed=True))
 
-    def extrapolate_next_value(self, history_line):
-        sequence = [int(x) for x in history_line.split(" ")]
+    def extrapolate_next_value(self, history):
+        sequence = list(history)
         sequences = [sequence]
 
         while True:
@@ -17,8 +21,8 @@ class OasisAnalyzer:
 
         return sum(row[-1] for row in sequences)
 
-    def extrapolate_previous_value(self, history_line):
-        sequence = [int(x) for x in history_line.split(" ")]
+    def extrapolate_previous_value(self, history):
+        sequence = list(history)
         sequences = [sequence]
 
         while True:
@@ -36,26 +40,28 @@ class OasisAnalyzer:
 
     def process_report(self, extrapolate_backwards=False):
         if extrapolate_backwards:
-            return sum(self.extrapolate_previous_value(row) for row in self.report)
+            return sum(self.extrapolate_previous_value(row) for row in self.histories)
         
-        return sum(self.extrapolate_next_value(row) for row in self.report)
+        return sum(self.extrapolate_next_value(row) for row in self.histories)
 
 
-def part_one():
-    with open("day_9/input.txt", "r") as f:
+def part_one(input_path="day_9/input.txt"):
+    with open(input_path, "r") as f:
         report = f.read()
 
     analyzer = OasisAnalyzer(report)
     sum_of_extrapolated_values = analyzer.process_report()
     print(f"Sum of forward extrapolated values: {sum_of_extrapolated_values}")
+    return sum_of_extrapolated_values
 
-def part_two():
-    with open("day_9/input.txt", "r") as f:
+def part_two(input_path="day_9/input.txt"):
+    with open(input_path, "r") as f:
         report = f.read()
 
     analyzer = OasisAnalyzer(report)
     sum_of_extrapolated_values = analyzer.process_report(extrapolate_backwards=True)
     print(f"Sum of backward extrapolated values: {sum_of_extrapolated_values}")
+    return sum_of_extrapolated_values
 
 def test_process_oasis_report_forward():
     report = """0 3 6 9 12 15